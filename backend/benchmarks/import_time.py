@@ -0,0 +1,136 @@
+# Cold-start import and startup budget for the API process
+#
+# Runs `python -X importtime -c "import main"` in fresh interpreters and fails
+# when importing the app exceeds the budget or pulls in a module that should
+# only load on first use. It then runs the app's lifespan startup in fresh
+# interpreters and fails when the startup takes too long to make the app ready
+# for traffic, e.g. because it waits for a module that should load in the
+# background.
+#
+# Usage (from the backend directory):
+#   python benchmarks/import_time.py [--budget-ms 1500] [--startup-budget-ms 300] [--runs 5]
+
+# --------------------------------------------------------------
+# Import dependencies for the import-time benchmark
+# --------------------------------------------------------------
+
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy packages that must stay off the startup path
+DEFERRED_MODULES = ("openai", "reportlab", "numpy")
+
+# Imports main and enters the app's lifespan; prints seconds from the end of
+# the import until the app is ready
+STARTUP_PROBE = """
+import asyncio, time
+import main
+
+async def startup():
+    started = time.perf_counter()
+    async with main.app.router.lifespan_context(main.app):
+        print(time.perf_counter() - started)
+
+asyncio.run(startup())
+"""
+
+# Environment for the measurements: no background network work, but an API
+# key so that startup sets up the OpenAI client as it does in production
+MEASUREMENT_ENV = {
+    "VERSION_DISCOVERY_ENABLED": "false",
+    "PREWARM_ENABLED": "false",
+    "OPENAI_API_KEY": "import-time-benchmark",
+}
+
+# --------------------------------------------------------------
+# Define import-time measurement
+# --------------------------------------------------------------
+
+
+def measure_import(module: str = "main") -> tuple:
+    """Import module in a fresh interpreter; returns (cumulative microseconds, imported top-level packages)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ, **MEASUREMENT_ENV),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    cumulative_us = None
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        packages.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(cumulative)
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry for {module}:\n{result.stderr[-2000:]}")
+    return cumulative_us, packages
+
+
+def measure_startup() -> float:
+    """Run the app's lifespan startup in a fresh interpreter; returns milliseconds until ready"""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_PROBE],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ, **MEASUREMENT_ENV),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1]) * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail when the app's cold-start import or startup time regresses")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500")))
+    parser.add_argument("--startup-budget-ms", type=float, default=float(os.getenv("STARTUP_TIME_BUDGET_MS", "300")),
+                        help="Budget for the lifespan startup after `import main`")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample; the fastest run is compared")
+    args = parser.parse_args()
+
+    samples = []
+    startup_samples = []
+    packages = set()
+    for _ in range(max(1, args.runs)):
+        cumulative_us, packages = measure_import()
+        samples.append(cumulative_us / 1000.0)
+        startup_samples.append(measure_startup())
+
+    # The minimum is the least noisy estimate of the real cost
+    best_ms = min(samples)
+    print(f"import main: best {best_ms:.0f} ms, worst {max(samples):.0f} ms over {len(samples)} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+    best_startup_ms = min(startup_samples)
+    print(f"lifespan startup: best {best_startup_ms:.0f} ms, worst {max(startup_samples):.0f} ms "
+          f"over {len(startup_samples)} runs (budget {args.startup_budget_ms:.0f} ms)")
+
+    failed = False
+    eager = [name for name in DEFERRED_MODULES if name in packages]
+    if eager:
+        print(f"FAIL: imported at startup, should load on first use: {', '.join(eager)}")
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f"FAIL: import time {best_ms:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if best_startup_ms > args.startup_budget_ms:
+        print(f"FAIL: lifespan startup {best_startup_ms:.0f} ms exceeds budget {args.startup_budget_ms:.0f} ms")
+        failed = True
+
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# Async load generator for the summary and PDF endpoints
+#
+# Keeps --concurrency requests in flight against a running backend (usually
+# one pointed at benchmarks/mock_openai_server.py) and reports throughput,
+# latency percentiles and error rates per endpoint:
+#
+#   python benchmarks/load_test.py --base-url http://127.0.0.1:8000 --concurrency 20 --duration 60 --pdf-ratio 0.2
+
+# --------------------------------------------------------------
+# Import dependencies for the load generator
+# --------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import make_release_news  # noqa: E402
+
+SUMMARY_PATH = "/api/dynatrace-release-news-summary"
+PDF_PATH = "/api/download-release-news-pdf"
+
+# Selection ids of the registered components, as the frontend sends them
+DEFAULT_SELECTION_IDS = ("dynatrace_managed", "oneagent", "active_gate", "dynatrace_api", "dynatrace_operator")
+
+# --------------------------------------------------------------
+# Define statistics helpers
+# --------------------------------------------------------------
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def summarize_results(results: list, elapsed: float) -> dict:
+    """Throughput, latency percentiles and error rate per endpoint and overall"""
+    groups = defaultdict(list)
+    for result in results:
+        groups[result["endpoint"]].append(result)
+    if results:
+        groups["all"] = results
+
+    report = {}
+    for endpoint, endpoint_results in groups.items():
+        latencies = sorted(result["latency"] for result in endpoint_results)
+        errors = [result for result in endpoint_results if not result["ok"]]
+        statuses = defaultdict(int)
+        for result in endpoint_results:
+            statuses[str(result["status"])] += 1
+        report[endpoint] = {
+            "requests": len(endpoint_results),
+            "throughput_rps": round(len(endpoint_results) / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(len(errors) / len(endpoint_results), 4),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+            "max_ms": round(latencies[-1] * 1000, 1),
+            "statuses": dict(statuses),
+        }
+    return report
+
+# --------------------------------------------------------------
+# Define load generator
+# --------------------------------------------------------------
+
+
+class LoadGenerator:
+    """Closed-loop workers issuing summary and PDF requests until the deadline or request count is reached"""
+
+    def __init__(self, args):
+        """Initialize from command-line arguments"""
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.results = []
+        self.issued = 0
+        self.pdf_release_news = make_release_news(args.pdf_components)
+
+    async def run(self) -> dict:
+        timeout = aiohttp.ClientTimeout(total=self.args.timeout)
+        connector = aiohttp.TCPConnector(limit=self.args.concurrency)
+        async with aiohttp.ClientSession(self.args.base_url, timeout=timeout, connector=connector) as session:
+            started = time.perf_counter()
+            deadline = started + self.args.duration
+            await asyncio.gather(*(self.worker(session, deadline) for _ in range(self.args.concurrency)))
+            elapsed = time.perf_counter() - started
+        return {
+            "config": {
+                "base_url": self.args.base_url,
+                "concurrency": self.args.concurrency,
+                "duration_s": round(elapsed, 2),
+                "pdf_ratio": self.args.pdf_ratio,
+            },
+            "endpoints": summarize_results(self.results, elapsed),
+        }
+
+    async def worker(self, session: aiohttp.ClientSession, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            if self.args.requests and self.issued >= self.args.requests:
+                return
+            self.issued += 1
+            if self.rng.random() < self.args.pdf_ratio:
+                await self.timed_request(session, "pdf", PDF_PATH, self.pdf_body())
+            else:
+                await self.timed_request(session, "summary", SUMMARY_PATH, self.summary_body())
+
+    async def timed_request(self, session: aiohttp.ClientSession, endpoint: str, path: str, body: dict) -> None:
+        started = time.perf_counter()
+        try:
+            async with session.post(path, json=body) as response:
+                await response.read()
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = type(e).__name__
+        self.results.append({
+            "endpoint": endpoint,
+            "status": status,
+            "ok": isinstance(status, int) and status < 400,
+            "latency": time.perf_counter() - started,
+        })
+
+    def summary_body(self) -> dict:
+        selection_ids = self.rng.sample(self.args.components, self.rng.randint(1, len(self.args.components)))
+        return {"selectedItems": [{selection_id: True} for selection_id in selection_ids]}
+
+    def pdf_body(self) -> dict:
+        release_news = self.pdf_release_news
+        if self.rng.random() < self.args.unique_pdf_rate:
+            # A different payload bypasses the rendered PDF cache
+            release_news = [dict(release_news[0], version=f"1.{self.rng.randrange(10 ** 6)}")] + release_news[1:]
+        return {"releaseNews": release_news}
+
+
+def print_report(report: dict) -> None:
+    config = report["config"]
+    print(f"{config['base_url']}: concurrency {config['concurrency']}, {config['duration_s']} s")
+    print(f"{'endpoint':<10} {'requests':>9} {'rps':>8} {'errors':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  statuses")
+    for endpoint, stats in report["endpoints"].items():
+        print(f"{endpoint:<10} {stats['requests']:>9} {stats['throughput_rps']:>8} {stats['error_rate']:>8.2%} "
+              f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}  {stats['statuses']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the summary and PDF endpoints")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests kept in flight")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--requests", type=int, default=0, help="Stop after this many requests (0 for no limit)")
+    parser.add_argument("--pdf-ratio", type=float, default=0.2, help="Fraction of requests sent to the PDF endpoint")
+    parser.add_argument("--pdf-components", type=int, default=5, help="Components in each PDF payload")
+    parser.add_argument("--unique-pdf-rate", type=float, default=0.0,
+                        help="Fraction of PDF requests with a new payload, forcing a render")
+    parser.add_argument("--components", nargs="+", default=list(DEFAULT_SELECTION_IDS),
+                        help="Selection ids picked from for each summary request")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    report = asyncio.run(LoadGenerator(args).run())
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
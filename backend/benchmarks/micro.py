@@ -0,0 +1,228 @@
+# Micro-benchmarks for the backend's CPU-bound paths
+#
+# Usage (from the backend directory):
+#   python benchmarks/micro.py run --output benchmarks/results/<commit>.json [--filter pdf]
+#   python benchmarks/micro.py compare base.json head.json [--threshold 0.10]
+#
+# `compare` exits non-zero when any benchmark is slower than the baseline by
+# more than the threshold (a fraction of the baseline median).
+
+# --------------------------------------------------------------
+# Import dependencies for the micro-benchmark suite
+# --------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("VERSION_DISCOVERY_ENABLED", "false")
+os.environ.setdefault("PREWARM_ENABLED", "false")
+
+from payloads import make_release_news, make_summary  # noqa: E402
+
+# --------------------------------------------------------------
+# Define benchmark cases
+# --------------------------------------------------------------
+
+
+class CannedEngine:
+    """Engine replacement returning prebuilt summaries, so only response assembly is timed"""
+
+    def __init__(self, summaries: dict):
+        self.summaries = summaries
+
+    async def process_components(self, keys: list, combined=None, batched=None) -> list:
+        return [self.summaries[key] for key in keys]
+
+
+def pdf_cases() -> dict:
+    from services.pdf_rendering import generate_pdf_from_release_news
+
+    cases = {}
+    for count in (1, 5, 50):
+        release_news = make_release_news(count)
+        cases[f"pdf_generation[{count}]"] = lambda news=release_news: generate_pdf_from_release_news(news)
+    return cases
+
+
+def cleaning_cases() -> dict:
+    from services.pdf_rendering import format_paragraph_markup
+    from services.summary_text import strip_emoji
+
+    # The per-item cleaning generate_pdf_from_release_news applies before layout
+    summaries = [item["summary"] for item in make_release_news(50)]
+    return {
+        "regex_cleaning[50]": lambda: [format_paragraph_markup(strip_emoji(summary)) for summary in summaries],
+    }
+
+
+def response_assembly_cases() -> dict:
+    import main
+    from services.component_registry import COMPONENTS
+    from services.data_models import ComponentLatestReleaseSummary
+
+    summaries = {
+        component.key: ComponentLatestReleaseSummary(**make_summary(index))
+        for index, component in enumerate(COMPONENTS)
+    }
+    main.release_notes_engine = CannedEngine(summaries)
+    selected_items = [{component.selection_id: True} for component in COMPONENTS]
+    loop = asyncio.new_event_loop()
+    return {
+        f"response_assembly[{len(COMPONENTS)}]": lambda: loop.run_until_complete(
+            main.process_selected_components(selected_items)
+        ),
+    }
+
+
+def model_cases() -> dict:
+    from services.data_models import ComponentLatestReleaseSummary
+
+    summary = make_summary(0)
+    summary_json = json.dumps(summary)
+    model = ComponentLatestReleaseSummary(**summary)
+    return {
+        # responses.parse validates the model's JSON output this way
+        "model_validate_json": lambda: ComponentLatestReleaseSummary.model_validate_json(summary_json),
+        "model_dump": lambda: model.model_dump(),
+        "model_dump_json": lambda: model.model_dump_json(),
+    }
+
+
+CASE_GROUPS = (pdf_cases, cleaning_cases, response_assembly_cases, model_cases)
+
+# --------------------------------------------------------------
+# Define timing and result storage
+# --------------------------------------------------------------
+
+
+def time_case(function, repeat: int, min_time: float) -> dict:
+    """Median and best seconds per call over repeat samples of at least min_time each"""
+    timer = timeit.Timer(function)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time:
+            break
+        loops *= 2
+    samples = [elapsed / loops for elapsed in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def get_git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def run_benchmarks(args) -> int:
+    results = {}
+    for group in CASE_GROUPS:
+        for name, function in group().items():
+            if args.filter and args.filter not in name:
+                continue
+            started = time.perf_counter()
+            results[name] = time_case(function, args.repeat, args.min_time)
+            print(f"{name:<28} {format_seconds(results[name]['median_s']):>12}  "
+                  f"(best {format_seconds(results[name]['min_s'])}, {results[name]['loops']} loops, "
+                  f"{time.perf_counter() - started:.1f} s)")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": get_git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Saved results to {args.output}")
+    return 0
+
+# --------------------------------------------------------------
+# Define comparison between two result files
+# --------------------------------------------------------------
+
+
+def compare_results(args) -> int:
+    with open(args.base, encoding="utf-8") as file:
+        base = json.load(file)
+    with open(args.head, encoding="utf-8") as file:
+        head = json.load(file)
+
+    print(f"base {base.get('git_commit') or args.base} -> head {head.get('git_commit') or args.head}, "
+          f"threshold {args.threshold:.0%}")
+    regressions = []
+    for name, head_result in head["benchmarks"].items():
+        base_result = base["benchmarks"].get(name)
+        if base_result is None:
+            print(f"{name:<28} {'new':>12}  {format_seconds(head_result['median_s'])}")
+            continue
+        change = head_result["median_s"] / base_result["median_s"] - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = "  improved"
+        print(f"{name:<28} {change:>+11.1%}  {format_seconds(base_result['median_s'])} -> "
+              f"{format_seconds(head_result['median_s'])}{flag}")
+
+    if regressions:
+        print(f"FAIL: {len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("OK")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backend micro-benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and optionally save results as JSON")
+    run_parser.add_argument("--output", help="Path of the JSON results file")
+    run_parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    run_parser.add_argument("--repeat", type=int, default=7, help="Timed samples per benchmark")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per sample")
+    run_parser.set_defaults(handler=run_benchmarks)
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Slowdown of the median, as a fraction, reported as a regression")
+    compare_parser.set_defaults(handler=compare_results)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
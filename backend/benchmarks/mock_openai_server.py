@@ -0,0 +1,226 @@
+# Local mock of the OpenAI Responses API for load tests
+#
+# Answers POST /v1/responses with canned structured output after a configurable
+# latency, and injects 429/500 errors at configurable rates. Point the backend
+# at it with OPENAI_BASE_URL (read by the OpenAI SDK):
+#
+#   python benchmarks/mock_openai_server.py --port 8099 --latency lognormal:0.8:0.5 --rate-429 0.05
+#   OPENAI_API_KEY=mock OPENAI_BASE_URL=http://127.0.0.1:8099/v1 VERSION_DISCOVERY_ENABLED=false \
+#       uvicorn main:app --port 8000
+#
+# Latency specs: fixed:SECONDS, uniform:LOW:HIGH, lognormal:MEDIAN:SIGMA, exponential:MEAN
+
+# --------------------------------------------------------------
+# Import dependencies for the mock Responses API
+# --------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from typing import Callable, Optional
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payloads import make_summary  # noqa: E402
+
+# --------------------------------------------------------------
+# Define latency distributions and canned payloads
+# --------------------------------------------------------------
+
+# Summary prompts name the version as "... for version 1.305 ..."
+VERSION_IN_PROMPT = re.compile(r"version (\d+(?:\.\d+)+)")
+BATCH_COMPONENT_PATTERN = re.compile(r"===== Component '([^']+)' =====")
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Build a sampler of response delays in seconds from a distribution spec"""
+    kind, *params = spec.split(":")
+    values = [float(param) for param in params]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    if kind == "exponential" and len(values) == 1:
+        return lambda rng: rng.expovariate(1.0 / values[0])
+    raise argparse.ArgumentTypeError(f"Invalid latency spec: {spec}")
+
+
+def load_canned_summaries(path: Optional[str]) -> list:
+    """Summaries to answer with: a JSON list of ComponentLatestReleaseSummary dicts, or synthetic ones"""
+    if path:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    return [make_summary(index) for index in range(10)]
+
+
+def get_schema(body: dict) -> dict:
+    """JSON schema of the requested structured output"""
+    text_format = (body.get("text") or {}).get("format") or {}
+    return text_format.get("schema") or {}
+
+
+def get_prompt(body: dict) -> str:
+    prompt = body.get("input", "")
+    return prompt if isinstance(prompt, str) else json.dumps(prompt)
+
+# --------------------------------------------------------------
+# Define mock server
+# --------------------------------------------------------------
+
+
+class MockResponsesServer:
+    """Serves canned Responses API results with injected latency and failures"""
+
+    def __init__(
+        self,
+        latency: Callable[[random.Random], float],
+        summaries: list,
+        rate_429: float = 0.0,
+        rate_500: float = 0.0,
+        retry_after_seconds: float = 1.0,
+        new_version_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """Initialize with a latency sampler, canned summaries and fault injection rates"""
+        self.latency = latency
+        self.summaries = summaries
+        self.rate_429 = rate_429
+        self.rate_500 = rate_500
+        self.retry_after_seconds = retry_after_seconds
+        self.new_version_rate = new_version_rate
+        self.rng = random.Random(seed)
+        self.version_minor = 300
+        self.in_flight = 0
+        self.counts = {"requests": 0, "ok": 0, "429": 0, "500": 0}
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_post("/v1/responses", self.handle_responses)
+        app.router.add_get("/stats", self.handle_stats)
+        return app
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.counts, "in_flight": self.in_flight})
+
+    async def handle_responses(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.counts["requests"] += 1
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(max(0.0, self.latency(self.rng)))
+
+            roll = self.rng.random()
+            if roll < self.rate_429:
+                self.counts["429"] += 1
+                return web.json_response(
+                    {"error": {"message": "Rate limit reached (mock)", "type": "requests", "code": "rate_limit_exceeded"}},
+                    status=429,
+                    headers={"retry-after": str(self.retry_after_seconds)}
+                )
+            if roll < self.rate_429 + self.rate_500:
+                self.counts["500"] += 1
+                return web.json_response(
+                    {"error": {"message": "Internal server error (mock)", "type": "server_error"}},
+                    status=500
+                )
+
+            self.counts["ok"] += 1
+            return web.json_response(self.build_response(body))
+        finally:
+            self.in_flight -= 1
+
+    def build_response(self, body: dict) -> dict:
+        """Responses API result whose output text matches the requested schema"""
+        output = self.build_output(get_schema(body), get_prompt(body))
+        output_text = json.dumps(output)
+        input_tokens = max(1, len(get_prompt(body)) // 4)
+        output_tokens = max(1, len(output_text) // 4)
+        return {
+            "id": f"resp_{uuid.uuid4().hex}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "status": "completed",
+            "model": body.get("model", "gpt-4o"),
+            "output": [{
+                "type": "message",
+                "id": f"msg_{uuid.uuid4().hex}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": output_text, "annotations": []}],
+            }],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": body.get("tools", []),
+            "usage": {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": output_tokens,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": input_tokens + output_tokens,
+            },
+        }
+
+    def build_output(self, schema: dict, prompt: str) -> dict:
+        """Canned payload for the version, summary or batched summary schema"""
+        properties = schema.get("properties", {})
+        if "version" in properties:
+            if self.rng.random() < self.new_version_rate:
+                self.version_minor += 1
+            return {"version": self.current_version()}
+        if "summaries" in properties:
+            sections = BATCH_COMPONENT_PATTERN.split(prompt)[1:]
+            return {"summaries": [
+                {**self.summary_for(section_prompt), "component": component_key}
+                for component_key, section_prompt in zip(sections[::2], sections[1::2])
+            ]}
+        return self.summary_for(prompt)
+
+    def summary_for(self, prompt: str) -> dict:
+        match = VERSION_IN_PROMPT.search(prompt)
+        version = match.group(1) if match else self.current_version()
+        return {**self.rng.choice(self.summaries), "latestVersion": version}
+
+    def current_version(self) -> str:
+        return f"1.{self.version_minor}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock OpenAI Responses API for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=parse_latency, default="lognormal:0.8:0.5",
+                        help="Delay distribution per response (default lognormal:0.8:0.5)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--rate-500", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--new-version-rate", type=float, default=0.0,
+                        help="Chance each version lookup reports a new release, forcing summary cache misses")
+    parser.add_argument("--payloads", help="JSON file with a list of canned summaries")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = MockResponsesServer(
+        latency=args.latency,
+        summaries=load_canned_summaries(args.payloads),
+        rate_429=args.rate_429,
+        rate_500=args.rate_500,
+        retry_after_seconds=args.retry_after,
+        new_version_rate=args.new_version_rate,
+        seed=args.seed
+    )
+    web.run_app(server.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
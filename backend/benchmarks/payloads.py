@@ -0,0 +1,57 @@
+# Synthetic release summaries sized like real model output, for benchmarks
+
+# --------------------------------------------------------------
+# Import dependencies for synthetic payloads
+# --------------------------------------------------------------
+
+import random
+
+from services.summary_text import release_news_from_summaries
+
+# --------------------------------------------------------------
+# Define synthetic summary generators
+# --------------------------------------------------------------
+
+WORDS = (
+    "agent", "monitoring", "support", "deprecated", "Kubernetes", "Java", "memory", "leak", "cluster",
+    "configuration", "extension", "OpenTelemetry", "ingest", "latency", "process", "host", "container",
+    "metrics", "traces", "logs", "upgrade", "TLS", "certificate", "API", "endpoint", "timeout", "Linux",
+    "Windows", "AIX", "z/OS", ".NET", "Node.js", "Go", "PHP", "Python", "instrumentation", "sensor",
+)
+
+# Bullets per section; real summaries list a handful of items per section
+SECTION_BULLETS = {
+    "breaking_changes": 4,
+    "announcements": 3,
+    "technology_support": 6,
+    "new_features": 8,
+    "resolved_issues": 10,
+}
+
+
+def make_bullet(rng: random.Random) -> str:
+    """One summary bullet with a bold lead-in, as the model writes them"""
+    lead = " ".join(rng.choice(WORDS) for _ in range(3)).capitalize()
+    detail = " ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 30)))
+    return f"- **{lead}**: {detail}."
+
+
+def make_summary(index: int, seed: int = 0) -> dict:
+    """Summary dict shaped like ComponentLatestReleaseSummary (a few KB of text)"""
+    rng = random.Random(seed * 1000 + index)
+    summary = {"latestVersion": f"1.{300 + index}"}
+    for field, bullets in SECTION_BULLETS.items():
+        summary[field] = "\n".join(make_bullet(rng) for _ in range(bullets))
+    return summary
+
+
+def make_release_summaries(count: int) -> dict:
+    """Summary endpoint response with count components"""
+    return {f"component-{index}": make_summary(index) for index in range(count)}
+
+
+def make_release_news(count: int) -> list:
+    """releaseNews payload for count components, formatted like the frontend cards"""
+    titles = {f"component-{index}": f"Component {index}" for index in range(count)}
+    return release_news_from_summaries(make_release_summaries(count), titles)
+
@@ -12,41 +12,87 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import asyncio
+import json
 import logging
+from contextlib import asynccontextmanager
+from functools import partial
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from io import BytesIO
-import re
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from datetime import datetime
+from typing import Optional
 
 from dotenv import load_dotenv
 
-import openai
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 from services.data_models import ComponentLatestReleaseVersion, ComponentLatestReleaseSummary
-from services.process_oneagent_release_notes import ProcessOneAgentReleaseNotes
-from services.process_activegate_release_notes import ProcessActiveGateReleaseNotes
-from services.process_dynatrace_api_release_notes import ProcessDynatraceApiReleaseNotes
-from services.process_dynatrace_operator_release_notes import ProcessDynatraceOperatorReleaseNotes
-from services.process_dynatrace_managed_release_notes import ProcessDynatraceManagedReleaseNotes
+from services.summary_cache import SummaryCache
+from services.single_flight import SingleFlight
+from services.version_discovery import VersionDiscovery, parse_version
+from services.prewarm_scheduler import PrewarmScheduler
+from services.release_notes_corpus import ReleaseNotesCorpus
+from services.openai_client import create_openai_client
+from services.search_index import SearchIndex, HashingEmbedder, OpenAIEmbedder
+from services.pdf_render_pool import PdfRenderPool, PdfRenderPoolFull
+from services.rendered_pdf_cache import RenderedPdfCache, content_etag, etag_matches
+from services.summary_text import filter_release_news, release_news_from_summaries
+from services.summary_export import EXPORT_FORMATS
+from services.metrics import REGISTRY as METRICS_REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from services.request_profiler import RequestProfiler, RequestProfilingMiddleware, PROFILE_FORMATS
+from services.structured_logging import configure_logging, RequestIdMiddleware
+from services.component_registry import COMPONENTS, COMPONENT_REGISTRY, describe_components, get_selected_components
+from services.release_notes_engine import ReleaseNotesEngine
+from services.llm_call_scheduler import LLMCallScheduler, PRIORITY_BACKGROUND
+from services.token_budget import TokenBudget, load_token_encoder_with_retries
 
 # --------------------------------------------------------------
 # Initialize application configuration and logging
 # --------------------------------------------------------------
 
 load_dotenv()
-logging.basicConfig(level=logging.INFO)
+# Log records are queued and written as JSON lines by a background thread;
+# prompts and responses are logged as sizes plus a sampled, capped excerpt
+log_listener = configure_logging(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    json_output=os.getenv("LOG_FORMAT", "json").lower() == "json",
+    prompt_max_chars=int(os.getenv("LOG_PROMPT_MAX_CHARS", "500")),
+    prompt_sample_rate=float(os.getenv("LOG_PROMPT_SAMPLE_RATE", "0.1"))
+)
 logger = logging.getLogger(__name__)
 
 # --------------------------------------------------------------
 # Create FastAPI app instance and configure CORS
 # --------------------------------------------------------------
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the optional pre-warm scheduler and release shared connection and worker pools on shutdown"""
+    # Load the tokenizer in the background, downloading its encoding on
+    # first boot; prompt tokens are estimated from text length until then
+    encoder_load = asyncio.create_task(load_token_encoder_with_retries(
+        timeout_seconds=float(os.getenv("TIKTOKEN_LOAD_TIMEOUT_SECONDS", "30")),
+        retry_seconds=float(os.getenv("TIKTOKEN_LOAD_RETRY_SECONDS", "30"))
+    ))
+    # Import the OpenAI SDK in the background: the worker takes traffic right
+    # away, and the first LLM call rarely has to wait for the import. The
+    # reference keeps the task alive until it finishes
+    sdk_preload = asyncio.create_task(asyncio.to_thread(openai_client.preload)) if openai_client else None
+    if prewarm_scheduler:
+        prewarm_scheduler.start()
+    yield
+    encoder_load.cancel()
+    if prewarm_scheduler:
+        await prewarm_scheduler.stop()
+    if version_discovery:
+        await version_discovery.close()
+    if release_notes_corpus:
+        await release_notes_corpus.close()
+    if openai_client:
+        await openai_client.close()
+    pdf_render_pool.shutdown()
+    log_listener.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Enable CORS for all origins
 app.add_middleware(
@@ -55,198 +101,200 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Content-Disposition", "ETag", "X-Profile-Id", "X-Request-ID"],
 )
 
+# Tag every request with a correlation ID carried by its log records
+app.add_middleware(RequestIdMiddleware)
+
 # --------------------------------------------------------------
-# Initialize OpenAI client and component processors
+# Initialize OpenAI client and release notes engine
 # --------------------------------------------------------------
 
-# Initialize OpenAI client and processors
-openai_api_key = os.getenv("OPENAI_API_KEY")
-openai_client = openai.OpenAI(api_key=openai_api_key) if openai_api_key else None
+# Initialize a single async OpenAI client shared by every component so that
+# LLM calls are awaited without blocking the event loop; retries are left to
+# the LLM call scheduler so they respect the shared rate limits. The SDK is
+# imported and the client built on the first LLM call to keep startup fast
+openai_client = create_openai_client(os.getenv("OPENAI_API_KEY"), max_retries=0)
 
-# Initialize the release notes processors
-oneagent_processor = ProcessOneAgentReleaseNotes(openai_client)
-activegate_processor = ProcessActiveGateReleaseNotes(openai_client)
-dynatrace_api_processor = ProcessDynatraceApiReleaseNotes(openai_client)
-dynatrace_operator_processor = ProcessDynatraceOperatorReleaseNotes(openai_client)
-dynatrace_managed_processor = ProcessDynatraceManagedReleaseNotes(openai_client)
+# Initialize the summary cache shared by all components; a release summary
+# for a given version never changes, so repeat requests skip the LLM call
+summary_cache = SummaryCache(
+    max_entries=int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "128")),
+    ttl_seconds=float(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "86400"))
+)
 
-# --------------------------------------------------------------
-# Define helper functions for request processing
-# --------------------------------------------------------------
+# Initialize the single-flight group so concurrent identical version probes
+# and summaries share one in-flight LLM call
+single_flight = SingleFlight()
 
+# Initialize deterministic version discovery from the docs tables; the LLM
+# version prompt is only used when the table cannot be fetched or parsed
+version_discovery = (
+    VersionDiscovery(timeout_seconds=float(os.getenv("VERSION_DISCOVERY_TIMEOUT_SECONDS", "10")))
+    if os.getenv("VERSION_DISCOVERY_ENABLED", "true").lower() == "true"
+    else None
+)
 
-def generate_pdf_content(release_summaries: dict) -> BytesIO:
-    """Generate PDF content from release summaries"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch, bottomMargin=1*inch)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor='#1496FF'
-    )
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=10,
-        textColor='#1a3a6b'
-    )
-    section_style = ParagraphStyle(
-        'SectionHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceBefore=15,
-        spaceAfter=8,
-        textColor='#1496FF'
-    )
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceBefore=6,
-        spaceAfter=6,
-        leftIndent=20
+# Keep the downloaded tiktoken encoding next to the app instead of in the
+# system temp directory, so it survives restarts and is only fetched once
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tiktoken_cache"))
+
+# Initialize the optional daily token budget; once a day's usage nears the
+# limit new OpenAI calls are refused and the last known results are served
+token_budget_daily_tokens = int(os.getenv("TOKEN_BUDGET_DAILY_TOKENS", "0"))
+token_budget = (
+    TokenBudget(
+        daily_tokens=token_budget_daily_tokens,
+        near_limit_fraction=float(os.getenv("TOKEN_BUDGET_NEAR_LIMIT_FRACTION", "0.9"))
     )
-    
-    # Build story content
-    story = []
-    
-    # Add title
-    title = Paragraph("Dynatrace Release Notes Summary", title_style)
-    story.append(title)
-    story.append(Spacer(1, 20))
-    
-    # Add generation date
-    date_text = f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}"
-    story.append(Paragraph(date_text, styles['Normal']))
-    story.append(Spacer(1, 30))
-    
-    # Process each component
-    for component_key, component_data in release_summaries.items():
-        if component_data.get('latestVersion'):
-            # Component title with version
-            component_name = component_key.replace('-', ' ').replace('_', ' ').title()
-            if component_name == "Dynatrace Api":
-                component_name = "Dynatrace API"
-            
-            component_title = f"{component_name} - Version {component_data['latestVersion']}"
-            story.append(Paragraph(component_title, heading_style))
-            story.append(Spacer(1, 15))
-            
-            # Add sections
-            sections = [
-                ('Breaking Changes', component_data.get('breaking_changes', '')),
-                ('Announcements', component_data.get('announcements', '')),
-                ('New Features', component_data.get('new_features', '')),
-                ('Technology Support', component_data.get('technology_support', '')),
-                ('Resolved Issues', component_data.get('resolved_issues', ''))
-            ]
-            
-            for section_title, section_content in sections:
-                if section_content and section_content.strip():
-                    story.append(Paragraph(section_title, section_style))
-                    
-                    # Clean and format content
-                    clean_content = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', section_content)
-                    clean_content = clean_content.replace('\n\n', '<br/><br/>')
-                    clean_content = clean_content.replace('\n', '<br/>')
-                    
-                    story.append(Paragraph(clean_content, normal_style))
-                    story.append(Spacer(1, 10))
-            
-            story.append(Spacer(1, 30))
-    
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+    if token_budget_daily_tokens > 0
+    else None
+)
 
+# Initialize the scheduler that keeps every OpenAI call within the provider's
+# request and token rate limits, with interactive calls ahead of background ones
+llm_scheduler = LLMCallScheduler(
+    requests_per_minute=float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500")),
+    tokens_per_minute=float(os.getenv("LLM_TOKENS_PER_MINUTE", "30000")),
+    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENT_CALLS", "5")),
+    max_retries=int(os.getenv("LLM_MAX_RETRIES", "2")),
+    base_backoff_seconds=float(os.getenv("LLM_BACKOFF_SECONDS", "1")),
+    max_backoff_seconds=float(os.getenv("LLM_MAX_BACKOFF_SECONDS", "60")),
+    token_budget=token_budget
+)
 
-def generate_pdf_from_release_news(release_news: list) -> BytesIO:
-    """Generate PDF content from frontend releaseNews array format"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch, bottomMargin=1*inch)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Title'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor='#1496FF'
+# Initialize the optional local corpus of release notes pages; summaries are
+# then generated from the stored page text instead of a web search per call
+release_notes_corpus = (
+    ReleaseNotesCorpus(
+        storage_dir=os.getenv("CORPUS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus_data")),
+        refresh_interval_seconds=float(os.getenv("CORPUS_REFRESH_SECONDS", "3600")),
+        timeout_seconds=float(os.getenv("CORPUS_TIMEOUT_SECONDS", "10")),
+        max_page_chars=int(os.getenv("CORPUS_MAX_PAGE_CHARS", "200000"))
     )
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=10,
-        textColor='#1a3a6b'
+    if os.getenv("CORPUS_ENABLED", "false").lower() == "true"
+    else None
+)
+
+# Initialize the search index fed with every generated summary; the local
+# hashing embedder works offline, the OpenAI embedder needs an API key
+search_index = None
+if os.getenv("SEARCH_ENABLED", "true").lower() == "true":
+    if os.getenv("SEARCH_EMBEDDER", "hashing") == "openai" and openai_client:
+        search_embedder = OpenAIEmbedder(openai_client, model=os.getenv("SEARCH_EMBEDDING_MODEL", "text-embedding-3-small"))
+    else:
+        search_embedder = HashingEmbedder(dimensions=int(os.getenv("SEARCH_HASHING_DIMENSIONS", "1024")))
+    search_index = SearchIndex(search_embedder)
+
+# Initialize the cache of rendered PDFs so repeat downloads of the same
+# release news are served from memory instead of being rendered again
+pdf_cache = RenderedPdfCache(max_bytes=int(os.getenv("PDF_CACHE_MAX_BYTES", str(32 * 1024 * 1024))))
+
+# Initialize the worker processes that render PDFs off the event loop; when
+# every worker is busy and the queue is full, downloads get 503 + Retry-After
+pdf_render_pool = PdfRenderPool(
+    max_workers=int(os.getenv("PDF_RENDER_WORKERS", "2")),
+    max_queued=int(os.getenv("PDF_RENDER_MAX_QUEUED", "8")),
+    retry_after_seconds=float(os.getenv("PDF_RENDER_RETRY_AFTER_SECONDS", "5"))
+)
+
+# Initialize the single-flight group for PDF renders so simultaneous
+# downloads of the same release news share one render
+pdf_single_flight = SingleFlight()
+
+# Initialize the engine that processes every component in the registry; in
+# combined mode a component whose version is not in the docs table is resolved
+# and summarized by one LLM call instead of two sequential ones, and in batched
+# mode the summaries of several selected components share one LLM call
+release_notes_engine = ReleaseNotesEngine(
+    openai_client,
+    summary_cache=summary_cache,
+    single_flight=single_flight,
+    version_discovery=version_discovery,
+    llm_scheduler=llm_scheduler,
+    corpus=release_notes_corpus,
+    search_index=search_index,
+    combined_mode=os.getenv("COMBINED_MODE_ENABLED", "false").lower() == "true",
+    batched_mode=os.getenv("BATCHED_MODE_ENABLED", "false").lower() == "true",
+    max_range_versions=int(os.getenv("RANGE_MAX_VERSIONS", "20")),
+    chunk_max_chars=int(os.getenv("CHUNK_MAX_CHARS", "12000")),
+    chunk_parallelism=int(os.getenv("CHUNK_PARALLELISM", "4")),
+    token_budget=token_budget,
+    summary_max_output_tokens=int(os.getenv("SUMMARY_MAX_OUTPUT_TOKENS", "2000"))
+)
+
+# Initialize the optional background scheduler that generates summaries for
+# new versions before the first user asks for them
+prewarm_scheduler = None
+if os.getenv("PREWARM_ENABLED", "false").lower() == "true":
+    prewarm_scheduler = PrewarmScheduler(
+        interval_seconds=float(os.getenv("PREWARM_INTERVAL_SECONDS", "900")),
+        jitter_seconds=float(os.getenv("PREWARM_JITTER_SECONDS", "60")),
+        max_concurrency=int(os.getenv("PREWARM_MAX_CONCURRENCY", "2"))
     )
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceBefore=6,
-        spaceAfter=6,
-        leftIndent=20
+    for component in COMPONENTS:
+        prewarm_scheduler.register(
+            component.key,
+            partial(release_notes_engine.get_latest_version, component.key, priority=PRIORITY_BACKGROUND),
+            partial(release_notes_engine.get_release_summary, component.key, priority=PRIORITY_BACKGROUND)
+        )
+
+# Initialize the /metrics series read from the services' own counters at
+# scrape time; latency histograms and token counts are recorded by the services
+def cache_hit_ratio(stats: dict) -> float:
+    """Hits over lookups for a cache stats() dict"""
+    lookups = stats["hits"] + stats["misses"]
+    return stats["hits"] / lookups if lookups else 0.0
+
+
+METRICS_REGISTRY.counter_callback(
+    "cache_hits_total", "Cache lookups that found an entry, by cache",
+    lambda: {(("cache", "summary"),): summary_cache.hits, (("cache", "pdf"),): pdf_cache.hits}
+)
+METRICS_REGISTRY.counter_callback(
+    "cache_misses_total", "Cache lookups that found no entry, by cache",
+    lambda: {(("cache", "summary"),): summary_cache.misses, (("cache", "pdf"),): pdf_cache.misses}
+)
+METRICS_REGISTRY.gauge_callback(
+    "cache_hit_ratio", "Hits over lookups since startup, by cache",
+    lambda: {
+        (("cache", "summary"),): cache_hit_ratio(summary_cache.stats()),
+        (("cache", "pdf"),): cache_hit_ratio(pdf_cache.stats()),
+    }
+)
+METRICS_REGISTRY.gauge_callback("llm_calls_in_flight", "OpenAI calls currently running", lambda: llm_scheduler.stats()["in_flight"])
+METRICS_REGISTRY.gauge_callback("llm_calls_queued", "OpenAI calls waiting for a slot or rate-limit budget", lambda: llm_scheduler.stats()["queued"])
+METRICS_REGISTRY.counter_callback("llm_retries_total", "OpenAI calls retried after a transient error", lambda: llm_scheduler.retries)
+METRICS_REGISTRY.counter_callback("llm_rate_limited_total", "OpenAI calls rejected with 429", lambda: llm_scheduler.rate_limited)
+METRICS_REGISTRY.counter_callback("llm_failures_total", "OpenAI calls that failed after all retries", lambda: llm_scheduler.failures)
+METRICS_REGISTRY.gauge_callback("pdf_render_pending", "PDF renders running or queued", lambda: pdf_render_pool.stats()["pending"])
+METRICS_REGISTRY.counter_callback("pdf_render_rejected_total", "PDF renders rejected with 503 because the queue was full", lambda: pdf_render_pool.rejected)
+if token_budget is not None:
+    METRICS_REGISTRY.gauge_callback("token_budget_used_tokens", "Tokens used today against the daily budget", lambda: token_budget.stats()["used_tokens"])
+    METRICS_REGISTRY.gauge_callback("token_budget_limit_tokens", "Daily token budget", lambda: token_budget.daily_tokens)
+    METRICS_REGISTRY.counter_callback("token_budget_refused_total", "OpenAI calls refused because the daily budget was nearly spent", lambda: token_budget.refused)
+
+# Initialize the optional request profiler; it profiles a sample of requests
+# plus, when enabled, any request carrying the admin token in the trigger
+# header, and is not installed at all when disabled so unprofiled traffic
+# pays nothing
+request_profiler = None
+if os.getenv("PROFILING_ENABLED", "false").lower() == "true":
+    request_profiler = RequestProfiler(
+        profile_dir=os.getenv("PROFILING_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")),
+        sample_rate=float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+        header_name=os.getenv("PROFILING_HEADER", "X-Profile-Request"),
+        max_profiles=int(os.getenv("PROFILING_MAX_PROFILES", "50")),
+        interval_seconds=float(os.getenv("PROFILING_INTERVAL_SECONDS", "0.001")),
+        admin_token=os.getenv("PROFILING_ADMIN_TOKEN"),
+        header_enabled=os.getenv("PROFILING_HEADER_ENABLED", "false").lower() == "true"
     )
-    
-    # Build story content
-    story = []
-    
-    # Add title
-    title = Paragraph("Dynatrace Release Notes Summary", title_style)
-    story.append(title)
-    story.append(Spacer(1, 20))
-    
-    # Add generation date
-    date_text = f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}"
-    story.append(Paragraph(date_text, styles['Normal']))
-    story.append(Spacer(1, 30))
-    
-    # Process each release news item
-    for item in release_news:
-        component = item.get('component', '')
-        version = item.get('version', '')
-        summary = item.get('summary', '')
-        
-        # Skip error components
-        if component in ['Error', 'Info']:
-            continue
-        
-        # Component title with version
-        component_title = f"{component}"
-        if version:
-            component_title += f" - Version {version}"
-            
-        story.append(Paragraph(component_title, heading_style))
-        story.append(Spacer(1, 15))
-        
-        # Clean and format summary content
-        if summary:
-            # Remove emoji and markdown formatting for PDF
-            clean_content = re.sub(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF🚨📢✨🔧🐛]', '', summary)
-            clean_content = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', clean_content)
-            clean_content = clean_content.replace('\n\n', '<br/><br/>')
-            clean_content = clean_content.replace('\n', '<br/>')
-            
-            story.append(Paragraph(clean_content, normal_style))
-            story.append(Spacer(1, 20))
-    
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
+    app.add_middleware(RequestProfilingMiddleware, profiler=request_profiler)
+
+# --------------------------------------------------------------
+# Define helper functions for request processing
+# --------------------------------------------------------------
 
 
 @app.get("/")
@@ -255,153 +303,240 @@ def read_root():
     return {"message": "Hello from FastAPI!"}
 
 
-async def process_selected_components(selected_items: list) -> dict:
+@app.get("/api/components")
+def read_components():
+    """Components available for summarization, in display order"""
+    return describe_components()
+
+
+@app.get("/api/cache-stats")
+def read_cache_stats():
+    """Summary cache size and hit/miss counters"""
+    return summary_cache.stats()
+
+
+@app.get("/api/pdf-cache-stats")
+def read_pdf_cache_stats():
+    """Rendered PDF cache size, hit/miss counters and render pool load"""
+    return {**pdf_cache.stats(), "render_pool": pdf_render_pool.stats()}
+
+
+@app.get("/api/corpus-stats")
+def read_corpus_stats():
+    """Release notes corpus download, 304 and content change counters"""
+    if release_notes_corpus is None:
+        return {"enabled": False}
+    return {"enabled": True, **release_notes_corpus.stats()}
+
+
+@app.get("/api/llm-stats")
+def read_llm_stats():
+    """LLM call queue depth, in-flight calls and retry counters"""
+    return llm_scheduler.stats()
+
+
+@app.get("/api/token-budget")
+def read_token_budget():
+    """Tokens used today against the daily budget and calls refused near the limit"""
+    if token_budget is None:
+        return {"enabled": False}
+    return {"enabled": True, **token_budget.stats()}
+
+
+def profile_access_error(request: Request) -> Optional[JSONResponse]:
+    """Error response unless profiling is enabled and the request sends the admin token as a bearer token"""
+    if request_profiler is None:
+        return JSONResponse(status_code=503, content={"error": "Profiling is disabled."})
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not request_profiler.is_authorized(token.strip()):
+        return JSONResponse(status_code=403, content={"error": "Admin token required."})
+    return None
+
+
+@app.get("/api/admin/profiles")
+async def list_request_profiles(request: Request):
+    """Stored request profiles, newest first"""
+    access_error = profile_access_error(request)
+    if access_error is not None:
+        return access_error
+    profiles = await asyncio.to_thread(request_profiler.list_profiles)
+    return {**request_profiler.stats(), "profiles": profiles}
+
+
+@app.get("/api/admin/profiles/{profile_id}")
+def download_request_profile(request: Request, profile_id: str, format: str = "html"):
+    """A stored profile as pyinstrument HTML or a speedscope flame graph"""
+    access_error = profile_access_error(request)
+    if access_error is not None:
+        return access_error
+    path = request_profiler.get_profile_path(profile_id, format)
+    if path is None:
+        return JSONResponse(status_code=404, content={"error": "Profile not found."})
+    return FileResponse(path, media_type=PROFILE_FORMATS[format][1], filename=os.path.basename(path))
+
+
+@app.get("/metrics")
+def read_metrics():
+    """Prometheus metrics: phase latencies, PDF render time, LLM calls, caches and token usage"""
+    return Response(content=METRICS_REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+async def process_selected_components(
+    selected_items: list,
+    combined: Optional[bool] = None,
+    batched: Optional[bool] = None
+) -> dict:
     """Process selected Dynatrace components and return structured response"""
     
     # --------------------------------------------------------------
     # Step 1: Parse selected components from request
     # --------------------------------------------------------------
     
-    # Check which components are selected
-    oneagent_selected = False
-    activegate_selected = False
-    dynatrace_api_selected = False
-    dynatrace_operator_selected = False
-    dynatrace_managed_selected = False
+    selected_components = get_selected_components(selected_items)
     
-    for item in selected_items:
-        if isinstance(item, dict):
-            if "oneagent" in item:
-                oneagent_selected = True
-            elif "active_gate" in item:
-                activegate_selected = True
-            elif "dynatrace_api" in item:
-                dynatrace_api_selected = True
-            elif "dynatrace_operator" in item:
-                dynatrace_operator_selected = True
-            elif "dynatrace_managed" in item:
-                dynatrace_managed_selected = True
+    # Check if at least one component was selected
+    if not selected_components:
+        return {"error": get_no_selection_error(), "status_code": 400}
     
     # --------------------------------------------------------------
     # Step 2: Initialize structured response template
     # --------------------------------------------------------------
     
-    # Initialize response object
-    response = {
-        "oneagent": {
-            "latestVersion": "",
-            "breaking_changes": "",
-            "announcements": "",
-            "technology_support": "",
-            "new_features": "",
-            "resolved_issues": ""
-        },
-        "active-gate": {
-            "latestVersion": "",
-            "breaking_changes": "",
-            "announcements": "",
-            "technology_support": "",
-            "new_features": "",
-            "resolved_issues": ""
-        },
-        "dynatrace-api": {
-            "latestVersion": "",
-            "breaking_changes": "",
-            "announcements": "",
-            "technology_support": "",
-            "new_features": "",
-            "resolved_issues": ""
-        },
-        "dynatrace-operator": {
-            "latestVersion": "",
-            "breaking_changes": "",
-            "announcements": "",
-            "technology_support": "",
-            "new_features": "",
-            "resolved_issues": ""
-        },
-        "dynatrace-managed": {
-            "latestVersion": "",
-            "breaking_changes": "",
-            "announcements": "",
-            "technology_support": "",
-            "new_features": "",
-            "resolved_issues": ""
-        }
-    }
+    # Initialize response object with an empty entry for every registered component
+    response = {component.key: empty_component_summary() for component in COMPONENTS}
 
     # --------------------------------------------------------------
-    # Step 3: Prepare tasks for parallel execution
+    # Step 3: Execute selected components in parallel and handle results
     # --------------------------------------------------------------
-
-    # Prepare tasks for parallel execution
-    tasks = []
-    task_mapping = []
-    
-    if oneagent_selected:
-        tasks.append(oneagent_processor.process_dynatrace_release_news())
-        task_mapping.append(("oneagent", "oneAgentLatestVersion"))
     
-    if activegate_selected:
-        tasks.append(activegate_processor.process_dynatrace_release_news())
-        task_mapping.append(("active-gate", "activeGateLatestVersion"))
-    
-    if dynatrace_api_selected:
-        tasks.append(dynatrace_api_processor.process_dynatrace_release_news())
-        task_mapping.append(("dynatrace-api", "dynatraceApiLatestVersion"))
-    
-    if dynatrace_operator_selected:
-        tasks.append(dynatrace_operator_processor.process_dynatrace_release_news())
-        task_mapping.append(("dynatrace-operator", "dynatraceOperatorLatestVersion"))
-    
-    if dynatrace_managed_selected:
-        tasks.append(dynatrace_managed_processor.process_dynatrace_release_news())
-        task_mapping.append(("dynatrace-managed", "dynatraceManagedLatestVersion"))
-    
-    # --------------------------------------------------------------
-    # Step 4: Execute processors in parallel and handle results
-    # --------------------------------------------------------------
+    results = await release_notes_engine.process_components(
+        [component.key for component in selected_components],
+        combined=combined,
+        batched=batched
+    )
     
-    # Execute all selected processors in parallel
-    if tasks:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    for component, result in zip(selected_components, results):
+        # Check if result is an exception
+        if isinstance(result, Exception):
+            return {"error": f"Error processing {component.key}: {str(result)}", "status_code": 500}
         
-        # Process results
-        for i, result in enumerate(results):
-            component_key, version_key = task_mapping[i]
-            
-            # Check if result is an exception
-            if isinstance(result, Exception):
-                return {"error": f"Error processing {component_key}: {str(result)}", "status_code": 500}
-            
-            # Check if result is a JSONResponse (error case)
-            if isinstance(result, JSONResponse):
-                return {"error": "Processing error occurred", "status_code": 500}
-            
-            # Update response with successful result from ComponentLatestReleaseSummary
-            if isinstance(result, ComponentLatestReleaseSummary):
-                response[component_key]["latestVersion"] = result.latestVersion
-                response[component_key]["breaking_changes"] = result.breaking_changes
-                response[component_key]["announcements"] = result.announcements
-                response[component_key]["technology_support"] = result.technology_support
-                response[component_key]["new_features"] = result.new_features
-                response[component_key]["resolved_issues"] = result.resolved_issues
-    
-    # --------------------------------------------------------------
-    # Step 5: Validate selection and return response
-    # --------------------------------------------------------------
-    
-    # Check if at least one component was selected
-    if not oneagent_selected and not activegate_selected and not dynatrace_api_selected and not dynatrace_operator_selected and not dynatrace_managed_selected:
-        return {"error": "No supported release notes selected. Please select OneAgent, ActiveGate, Dynatrace API, Dynatrace Operator, or Dynatrace Managed to proceed.", "status_code": 400}
+        # Check if result is a JSONResponse (error case)
+        if isinstance(result, JSONResponse):
+            return {"error": "Processing error occurred", "status_code": 500}
+        
+        # Update response with successful result from ComponentLatestReleaseSummary
+        if isinstance(result, ComponentLatestReleaseSummary):
+            response[component.key] = result.model_dump()
     
     return response
 
+
+def empty_component_summary() -> dict:
+    """Response entry for a component that was not selected"""
+    return {field: "" for field in ComponentLatestReleaseSummary.model_fields}
+
+
+def get_no_selection_error() -> str:
+    """Error message listing every registered component"""
+    names = [component.name for component in COMPONENTS]
+    return f"No supported release notes selected. Please select {', '.join(names[:-1])}, or {names[-1]} to proceed."
+
+
+def get_mode_override(request_body: dict, mode: str) -> Optional[bool]:
+    """Per-request processing mode flag (e.g. "combined"), or None to use the server default"""
+    enabled = request_body.get(mode)
+    return None if enabled is None else bool(enabled)
+
+
+def format_sse_event(event: str, data: dict) -> str:
+    """Format a Server-Sent Events message with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def get_processor_error_message(result) -> str:
+    """Extract a readable error message from a failed processing result"""
+    if isinstance(result, Exception):
+        return str(result)
+    if isinstance(result, JSONResponse):
+        try:
+            return json.loads(result.body).get("error", "Processing error occurred")
+        except ValueError:
+            pass
+    return "Processing error occurred"
+
+
+async def stream_selected_components(selected_items: list, stream_summaries: bool = False, combined: Optional[bool] = None):
+    """Yield SSE progress events and one result event per component as soon as it finishes.
+
+    With stream_summaries enabled, partial section text is also forwarded as
+    summary_delta events while the model is still generating it.
+    """
+    component_keys = [component.key for component in get_selected_components(selected_items)]
+    if not component_keys:
+        yield format_sse_event("error", {"error": get_no_selection_error()})
+        return
+
+    # Components report progress and results through one queue so events
+    # are forwarded in the order they happen across all components
+    events = asyncio.Queue()
+
+    async def run_component(component_key: str):
+        def on_progress(phase: str, detail: dict):
+            events.put_nowait(("progress", {"component": component_key, "phase": phase, **detail}))
+
+        def on_section_delta(section: str, text: str):
+            events.put_nowait(("summary_delta", {"component": component_key, "section": section, "text": text}))
+
+        try:
+            result = await release_notes_engine.process_component(
+                component_key,
+                on_progress,
+                on_section_delta if stream_summaries else None,
+                combined=combined
+            )
+        except Exception as e:
+            result = e
+
+        if isinstance(result, ComponentLatestReleaseSummary):
+            events.put_nowait(("component", {"component": component_key, **result.model_dump()}))
+        else:
+            events.put_nowait(("component_error", {"component": component_key, "error": get_processor_error_message(result)}))
+
+    tasks = [asyncio.create_task(run_component(component_key)) for component_key in component_keys]
+    remaining = len(tasks)
+    failed = 0
+    try:
+        while remaining:
+            event, data = await events.get()
+            if event in ("component", "component_error"):
+                remaining -= 1
+                failed += event == "component_error"
+            yield format_sse_event(event, data)
+
+        yield format_sse_event("done", {"components": component_keys, "failed": failed})
+    finally:
+        # Stop remaining work when the client disconnects mid-stream
+        for task in tasks:
+            task.cancel()
+
+
 # --------------------------------------------------------------
 # Define API endpoints
 # --------------------------------------------------------------
 
 
+@app.get("/api/search")
+async def search_release_summaries(q: str, component: Optional[str] = None, limit: int = 10):
+    """Find the summary sections most similar to a question across all generated summaries"""
+    if search_index is None:
+        return JSONResponse(status_code=503, content={"error": "Search is disabled."})
+    if not q.strip():
+        return JSONResponse(status_code=400, content={"error": "Query must not be empty."})
+
+    results = await search_index.search(q, limit=max(1, min(limit, 50)), component=component)
+    return {"query": q, "indexed_sections": len(search_index), "results": results}
+
+
 @app.post("/api/dynatrace-release-news-summary")
 async def build_dynatrace_release_news_summary(request: Request):
     """Main endpoint to generate Dynatrace release news summary"""
@@ -414,13 +549,15 @@ async def build_dynatrace_release_news_summary(request: Request):
     try:
         request_body = await request.json()
         selected_items = request_body.get("selectedItems", [])
+        combined = get_mode_override(request_body, "combined")
+        batched = get_mode_override(request_body, "batched")
         
         # --------------------------------------------------------------
         # Process selected components and handle response
         # --------------------------------------------------------------
         
         # Process selected components
-        result = await process_selected_components(selected_items)
+        result = await process_selected_components(selected_items, combined, batched)
         
         # Check if there was an error in processing
         if "error" in result:
@@ -435,6 +572,46 @@ async def build_dynatrace_release_news_summary(request: Request):
         return JSONResponse(status_code=400, content={"error": f"Invalid request format: {str(e)}"})
 
 
+@app.post("/api/dynatrace-release-news-summary/stream")
+async def stream_dynatrace_release_news_summary(request: Request):
+    """Streaming variant of the summary endpoint using Server-Sent Events"""
+    try:
+        request_body = await request.json()
+        selected_items = request_body.get("selectedItems", [])
+        stream_summaries = bool(request_body.get("streamSummaries", False))
+        combined = get_mode_override(request_body, "combined")
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"error": f"Invalid request format: {str(e)}"})
+
+    return StreamingResponse(
+        stream_selected_components(selected_items, stream_summaries, combined),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/api/dynatrace-release-news-summary/range")
+async def build_version_range_summary(request: Request):
+    """Summarize what changed in a component between two versions"""
+    try:
+        request_body = await request.json()
+        component_key = request_body.get("component", "")
+        from_version = parse_version(request_body.get("fromVersion", ""))
+        to_version = parse_version(request_body.get("toVersion", "")) if request_body.get("toVersion") else None
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"error": f"Invalid request format: {str(e)}"})
+
+    if component_key not in COMPONENT_REGISTRY:
+        return JSONResponse(status_code=400, content={"error": f"Unknown component: {component_key}"})
+    if not from_version or (request_body.get("toVersion") and not to_version):
+        return JSONResponse(status_code=400, content={"error": "fromVersion and toVersion must be version numbers, e.g. 1.301"})
+
+    result = await release_notes_engine.summarize_version_range(component_key, from_version, to_version)
+    if "error" in result:
+        return JSONResponse(status_code=500, content=result)
+    return result
+
+
 @app.post("/api/download-release-news-pdf")
 async def download_release_news_pdf(request: Request):
     """Endpoint to download release news as PDF from frontend releaseNews data"""
@@ -455,10 +632,7 @@ async def download_release_news_pdf(request: Request):
             )
         
         # Filter out error/info components
-        valid_release_news = [
-            item for item in release_news 
-            if item.get('component') not in ['Error', 'Info'] and item.get('summary', '').strip()
-        ]
+        valid_release_news = filter_release_news(release_news)
         
         if not valid_release_news:
             return JSONResponse(
@@ -466,18 +640,74 @@ async def download_release_news_pdf(request: Request):
                 content={"error": "No valid release data available to generate PDF"}
             )
         
-        # Generate PDF from release news data
-        pdf_buffer = generate_pdf_from_release_news(valid_release_news)
+        # Identical release news renders to the same document, so its hash is the ETag
+        etag = content_etag(valid_release_news)
+        cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
+        
+        # Generate PDF from release news data unless it was rendered before
+        pdf_bytes = pdf_cache.get(etag)
+        if pdf_bytes is None:
+            try:
+                pdf_bytes = await pdf_single_flight.do(etag, lambda: pdf_render_pool.render_release_news(valid_release_news))
+            except PdfRenderPoolFull as e:
+                return JSONResponse(
+                    status_code=503,
+                    content={"error": str(e)},
+                    headers={"Retry-After": str(int(e.retry_after_seconds))}
+                )
+            pdf_cache.set(etag, pdf_bytes)
         
         # Generate filename with current date
         filename = f"Dynatrace_Release_Notes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        # Return PDF as streaming response
-        return StreamingResponse(
-            BytesIO(pdf_buffer.read()),
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers={"Content-Disposition": f"attachment; filename={filename}", **cache_headers}
         )
         
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": f"PDF generation failed: {str(e)}"})
+
+
+@app.post("/api/export-release-news")
+async def export_release_news(request: Request):
+    """Export release news as Markdown, standalone HTML or a JSON bundle"""
+    try:
+        request_body = await request.json()
+        export_format = request_body.get("format", "markdown")
+        if "releaseSummaries" in request_body:
+            # Results of the summary endpoint, keyed by component
+            titles = {component.key: component.title for component in COMPONENTS}
+            release_news = release_news_from_summaries(request_body["releaseSummaries"], titles)
+        else:
+            release_news = request_body.get("releaseNews", [])
+        if not isinstance(export_format, str):
+            raise ValueError("format must be a string")
+        if not isinstance(release_news, list) or not all(
+            isinstance(item, dict) and all(isinstance(item.get(field, ""), str) for field in ("component", "summary"))
+            for item in release_news
+        ):
+            raise ValueError("releaseNews must be a list of objects with text component and summary fields")
+        valid_release_news = filter_release_news(release_news)
+    except Exception as e:
+        return JSONResponse(status_code=400, content={"error": f"Invalid request format: {str(e)}"})
+
+    if export_format not in EXPORT_FORMATS:
+        return JSONResponse(
+            status_code=400,
+            content={"error": f"Unsupported format: {export_format}. Use one of: {', '.join(EXPORT_FORMATS)}"}
+        )
+
+    if not valid_release_news:
+        return JSONResponse(status_code=400, content={"error": "No valid release data available to export"})
+
+    render, media_type, extension = EXPORT_FORMATS[export_format]
+    filename = f"Dynatrace_Release_Notes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    return Response(
+        content=render(valid_release_news),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
@@ -0,0 +1,82 @@
+# Splitting long release notes pages into chunks and merging the chunk summaries
+
+# --------------------------------------------------------------
+# Import dependencies for chunked summarization
+# --------------------------------------------------------------
+
+from .data_models import ComponentLatestReleaseSummary
+from .prompts.summary_instructions import SECTION_PLACEHOLDERS
+from .version_range import is_empty_section
+
+# --------------------------------------------------------------
+# Define helpers for splitting page text along headings
+# --------------------------------------------------------------
+
+
+def split_sections(text: str) -> list:
+    """Split page text into sections that each start at a "#" heading line"""
+    sections = []
+    current = []
+    for line in text.splitlines():
+        if line.startswith("#") and current:
+            sections.append("\n".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current))
+    return sections
+
+
+def split_oversized_section(section: str, max_chars: int) -> list:
+    """Split one section longer than max_chars at line boundaries, repeating its heading"""
+    lines = section.splitlines()
+    heading = lines[0] if lines and lines[0].startswith("#") else ""
+    prefix = f"{heading} (continued)\n" if heading else ""
+
+    parts = []
+    current = ""
+    for line in lines:
+        # Lines longer than a whole chunk are cut hard
+        for piece in [line[start:start + max_chars] for start in range(0, len(line), max_chars)] or [""]:
+            # Never emit a heading on its own, away from its content
+            if current and current != heading and len(current) + len(piece) + 1 > max_chars:
+                parts.append(current)
+                current = prefix + piece
+            else:
+                current = f"{current}\n{piece}" if current else piece
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_into_chunks(text: str, max_chars: int) -> list:
+    """Pack heading sections into chunks of at most about max_chars, in page order"""
+    chunks = []
+    current = ""
+    for section in split_sections(text):
+        pieces = [section] if len(section) <= max_chars else split_oversized_section(section, max_chars)
+        for piece in pieces:
+            if current and len(current) + len(piece) + 1 > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+# --------------------------------------------------------------
+# Define deterministic merge of chunk summaries
+# --------------------------------------------------------------
+
+
+def merge_chunk_summaries(summaries: list, version: str) -> ComponentLatestReleaseSummary:
+    """Merge per-chunk summaries in page order, dropping empty and repeated section text"""
+    merged = {}
+    for field, placeholder in SECTION_PLACEHOLDERS.items():
+        parts = []
+        for summary in summaries:
+            text = getattr(summary, field).strip()
+            if not is_empty_section(text) and text not in parts:
+                parts.append(text)
+        merged[field] = "\n\n".join(parts) if parts else placeholder
+    return ComponentLatestReleaseSummary(latestVersion=version, **merged)
@@ -0,0 +1,119 @@
+# Registry of Dynatrace components supported by the release notes engine
+
+# --------------------------------------------------------------
+# Import dependencies for component configuration
+# --------------------------------------------------------------
+
+from dataclasses import dataclass
+from typing import Callable
+
+from .prompts.oneagent_prompts import get_oneagent_summary_prompt, get_oneagent_version_prompt
+from .prompts.activegate_prompts import get_activegate_summary_prompt, get_activegate_version_prompt
+from .prompts.dynatrace_api_prompts import get_dynatrace_api_summary_prompt, get_dynatrace_api_version_prompt
+from .prompts.dynatrace_operator_prompts import get_dynatrace_operator_summary_prompt, get_dynatrace_operator_version_prompt
+from .prompts.dynatrace_managed_prompts import get_dynatrace_managed_summary_prompt, get_dynatrace_managed_version_prompt
+
+# --------------------------------------------------------------
+# Define component specification
+# --------------------------------------------------------------
+
+# Version sources: read the docs table first and fall back to the LLM prompt,
+# or always ask the LLM
+VERSION_SOURCE_DOCS_TABLE = "docs_table"
+VERSION_SOURCE_LLM = "llm"
+
+
+@dataclass(frozen=True)
+class ComponentSpec:
+    """Configuration for one component processed by the release notes engine"""
+    key: str                                 # Response key, e.g. "active-gate"
+    selection_id: str                        # Key used in the request's selectedItems, e.g. "active_gate"
+    name: str                                # Name used in logs and error messages
+    title: str                               # Card title shown by the frontend
+    label: str                               # Checkbox label shown by the frontend
+    docs_url: str                            # What's-new page listing every version in a table
+    version_prompt: Callable[[], str]
+    summary_prompt: Callable[[str], str]
+    version_source: str = VERSION_SOURCE_DOCS_TABLE
+
+# --------------------------------------------------------------
+# Register supported components (order is the order shown in the UI)
+# --------------------------------------------------------------
+
+COMPONENTS = (
+    ComponentSpec(
+        key="dynatrace-managed",
+        selection_id="dynatrace_managed",
+        name="Dynatrace Managed",
+        title="APM-Tool Managed",
+        label="APM-Tool Managed release notes",
+        docs_url="https://docs.dynatrace.com/managed/whats-new/managed",
+        version_prompt=get_dynatrace_managed_version_prompt,
+        summary_prompt=get_dynatrace_managed_summary_prompt,
+    ),
+    ComponentSpec(
+        key="oneagent",
+        selection_id="oneagent",
+        name="OneAgent",
+        title="OneAgent",
+        label="OneAgent release notes",
+        docs_url="https://docs.dynatrace.com/managed/whats-new/oneagent",
+        version_prompt=get_oneagent_version_prompt,
+        summary_prompt=get_oneagent_summary_prompt,
+    ),
+    ComponentSpec(
+        key="active-gate",
+        selection_id="active_gate",
+        name="ActiveGate",
+        title="ActiveGate",
+        label="ActiveGate release notes",
+        docs_url="https://docs.dynatrace.com/managed/whats-new/activegate",
+        version_prompt=get_activegate_version_prompt,
+        summary_prompt=get_activegate_summary_prompt,
+    ),
+    ComponentSpec(
+        key="dynatrace-api",
+        selection_id="dynatrace_api",
+        name="Dynatrace API",
+        title="APM-Tool API",
+        label="APM-Tool API changelog",
+        docs_url="https://docs.dynatrace.com/docs/whats-new/dynatrace-api",
+        version_prompt=get_dynatrace_api_version_prompt,
+        summary_prompt=get_dynatrace_api_summary_prompt,
+    ),
+    ComponentSpec(
+        key="dynatrace-operator",
+        selection_id="dynatrace_operator",
+        name="Dynatrace Operator",
+        title="APM-Tool Operator",
+        label="APM-Tool Operator release notes",
+        docs_url="https://docs.dynatrace.com/docs/whats-new/dynatrace-operator",
+        version_prompt=get_dynatrace_operator_version_prompt,
+        summary_prompt=get_dynatrace_operator_summary_prompt,
+    ),
+)
+
+COMPONENT_REGISTRY = {spec.key: spec for spec in COMPONENTS}
+
+# --------------------------------------------------------------
+# Define registry lookup helpers
+# --------------------------------------------------------------
+
+
+def get_selected_components(selected_items: list) -> list:
+    """Return the specs of the components selected in a request, in request order"""
+    selected = []
+    for item in selected_items:
+        if isinstance(item, dict):
+            for spec in COMPONENTS:
+                if spec.selection_id in item and spec not in selected:
+                    selected.append(spec)
+    return selected
+
+
+def describe_components() -> list:
+    """Public description of the registered components for the frontend"""
+    return [
+        {"key": spec.key, "selectionId": spec.selection_id, "title": spec.title, "label": spec.label}
+        for spec in COMPONENTS
+    ]
@@ -24,3 +24,25 @@ class ComponentLatestReleaseSummary(BaseModel):
     technology_support: str = Field(description="Technology support updates, compatibility, and platform changes")
     new_features: str = Field(description="New features and capabilities introduced in the latest release")
     resolved_issues: str = Field(description="Bug fixes and resolved issues in the latest release")
+
+
+class ComponentReleaseSummaryBatchItem(ComponentLatestReleaseSummary):
+    """Pydantic model for one component's summary inside a batched response"""
+    component: str = Field(description="The component key this summary belongs to")
+
+
+class ComponentReleaseSummaryBatch(BaseModel):
+    """Pydantic model for release summaries of several components returned by one request"""
+    summaries: list[ComponentReleaseSummaryBatchItem] = Field(description="One summary per requested component")
+
+
+class ComponentVersionRangeSummary(BaseModel):
+    """Pydantic model for the merged summary of every release in a version range"""
+    component: str = Field(description="The component key")
+    fromVersion: str = Field(description="The version upgraded from (excluded from the range)")
+    toVersion: str = Field(description="The version upgraded to (included in the range)")
+    versions: list[str] = Field(description="Versions summarized in the range, oldest first")
+    failedVersions: list[str] = Field(default_factory=list, description="Versions whose summary could not be generated")
+    breaking_changes: str = Field(description="Breaking changes across the range, grouped by version")
+    resolved_issues: str = Field(description="Resolved issues across the range, grouped by version")
+    summaries: list[ComponentLatestReleaseSummary] = Field(description="Per-version summaries, oldest first")
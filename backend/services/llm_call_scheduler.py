@@ -0,0 +1,308 @@
+# Rate-limit-aware scheduler for OpenAI calls shared by all components
+
+# --------------------------------------------------------------
+# Import dependencies for LLM call scheduling
+# --------------------------------------------------------------
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, Union
+
+from .metrics import LLM_TOKENS_TOTAL
+from .token_budget import TokenBudget
+
+# --------------------------------------------------------------
+# Configure logging and priority lanes
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# Lower values are dispatched first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+# --------------------------------------------------------------
+# Define helpers for rate limits and backoff
+# --------------------------------------------------------------
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously"""
+
+    def __init__(self, capacity_per_minute: float):
+        """Initialize full with the given per-minute capacity"""
+        self.capacity = float(capacity_per_minute)
+        self.refill_per_second = self.capacity / 60.0
+        self.available = self.capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    def seconds_until_available(self, amount: float) -> float:
+        """Seconds until amount can be consumed (requests larger than the bucket wait for a full bucket)"""
+        self._refill()
+        missing = min(amount, self.capacity) - self.available
+        return max(0.0, missing / self.refill_per_second)
+
+    def consume(self, amount: float) -> None:
+        """Take amount from the bucket; the balance may go negative to record usage overruns"""
+        self._refill()
+        self.available -= amount
+
+
+def get_retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read Retry-After (seconds or HTTP date) or retry-after-ms from an OpenAI error response"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_retryable_errors() -> tuple:
+    """OpenAI errors worth retrying; the SDK is imported here, once a call has already needed it"""
+    import openai
+    return (
+        openai.RateLimitError,
+        openai.APIConnectionError,
+        openai.APITimeoutError,
+        openai.InternalServerError,
+    )
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for an OpenAI 429 response"""
+    return isinstance(error, get_retryable_errors()[0])
+
+
+class CallPriority:
+    """Priority of a call shared by several callers, raised to the most urgent one even while it waits"""
+
+    def __init__(self, priority: int = PRIORITY_INTERACTIVE):
+        """Initialize with the first caller's priority"""
+        self.value = priority
+
+    def raise_to(self, priority: int) -> None:
+        """Adopt priority if it is more urgent (lower) than the current one"""
+        self.value = min(self.value, priority)
+
+# --------------------------------------------------------------
+# Define scheduler shared by every OpenAI call
+# --------------------------------------------------------------
+
+
+class LLMCallScheduler:
+    """Dispatches OpenAI calls within request and token rate limits.
+
+    Waiting calls are served by priority lane (interactive before background),
+    then in arrival order. Retryable failures back off exponentially with full
+    jitter; a 429 additionally pauses dispatch for every caller until the
+    provider's Retry-After has passed, so a rate limit does not turn into an
+    error storm.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 30000,
+        max_concurrency: int = 5,
+        max_retries: int = 2,
+        base_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+        token_budget: Optional[TokenBudget] = None
+    ):
+        """Initialize with provider limits, concurrency cap, retry policy and an optional daily token budget"""
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.token_budget = token_budget
+        self._waiters: list = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self.retries = 0
+        self.rate_limited = 0
+        self.failures = 0
+
+    # --------------------------------------------------------------
+    # Public methods
+    # --------------------------------------------------------------
+
+    async def run(
+        self,
+        request: Callable[[], Awaitable],
+        estimated_tokens: int,
+        priority: Union[int, CallPriority] = PRIORITY_INTERACTIVE,
+        max_retries: Optional[int] = None
+    ):
+        """Run request() once a slot and rate-limit budget are available, retrying transient failures.
+
+        Raises TokenBudgetExceeded without calling OpenAI when the daily token budget is nearly spent.
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if self.token_budget is not None:
+            self.token_budget.reserve(estimated_tokens)
+        used_tokens = 0
+        try:
+            for attempt in range(max_retries + 1):
+                await self._acquire(estimated_tokens, priority)
+                try:
+                    result = await request()
+                    used_tokens = self._record_usage(result, estimated_tokens)
+                    return result
+                except Exception as e:
+                    if not isinstance(e, get_retryable_errors()):
+                        raise
+                    retry_after = get_retry_after_seconds(e)
+                    if is_rate_limit_error(e):
+                        self.rate_limited += 1
+                        pause = retry_after if retry_after is not None else self._backoff(attempt)
+                        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+                    if attempt == max_retries:
+                        self.failures += 1
+                        raise
+
+                    delay = retry_after if retry_after is not None else self._backoff(attempt)
+                    self.retries += 1
+                    logger.warning("OpenAI request failed (%s), retry %d in %.1fs", e, attempt + 1, delay)
+                finally:
+                    self._release()
+
+                await asyncio.sleep(delay)
+        finally:
+            if self.token_budget is not None:
+                self.token_budget.settle(estimated_tokens, used_tokens)
+
+    def stats(self) -> dict:
+        """Queue depth, in-flight calls and retry counters for diagnostics"""
+        return {
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "failures": self.failures,
+        }
+
+    # --------------------------------------------------------------
+    # Dispatch methods
+    # --------------------------------------------------------------
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.max_backoff_seconds, self.base_backoff_seconds * (2 ** attempt)))
+
+    async def _acquire(self, estimated_tokens: int, priority: Union[int, CallPriority]) -> None:
+        """Wait in the priority queue until this call may start"""
+        granted = asyncio.get_running_loop().create_future()
+        current_priority = priority.value if isinstance(priority, CallPriority) else priority
+        # A list so a shared priority raised while waiting can be updated in place
+        entry = [current_priority, next(self._sequence), estimated_tokens, granted, priority]
+        heapq.heappush(self._waiters, entry)
+        self._dispatch()
+
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if granted.done() and not granted.cancelled():
+                # Granted just before cancellation: hand the slot back
+                self._release()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        """Free a concurrency slot and let the next waiter start"""
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant slots to waiters in priority order while limits allow"""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        self._reorder_waiters()
+        while self._waiters and self._in_flight < self.max_concurrency:
+            _priority, _sequence, estimated_tokens, granted, _shared_priority = self._waiters[0]
+            if granted.cancelled():
+                heapq.heappop(self._waiters)
+                continue
+
+            wait = max(
+                self._paused_until - time.monotonic(),
+                self.request_bucket.seconds_until_available(1),
+                self.token_bucket.seconds_until_available(estimated_tokens),
+            )
+            if wait > 0:
+                self._wakeup = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+
+            heapq.heappop(self._waiters)
+            self.request_bucket.consume(1)
+            self.token_bucket.consume(estimated_tokens)
+            self._in_flight += 1
+            granted.set_result(None)
+
+    def _reorder_waiters(self) -> None:
+        """Move waiters whose shared priority was raised since they were queued"""
+        reordered = False
+        for entry in self._waiters:
+            shared_priority = entry[4]
+            if isinstance(shared_priority, CallPriority) and shared_priority.value != entry[0]:
+                entry[0] = shared_priority.value
+                reordered = True
+        if reordered:
+            heapq.heapify(self._waiters)
+
+    def _record_usage(self, result, estimated_tokens: int) -> int:
+        """Charge the token bucket for the difference between estimated and actual usage and export token counts.
+
+        Returns the tokens used, or the estimate when the result carries no usage.
+        """
+        usage = getattr(result, "usage", None)
+        total_tokens = getattr(usage, "total_tokens", None)
+        if not isinstance(total_tokens, int):
+            total_tokens = estimated_tokens
+        self.token_bucket.consume(total_tokens - estimated_tokens)
+
+        model = getattr(result, "model", None) or "unknown"
+        for direction in ("input", "output"):
+            tokens = getattr(usage, f"{direction}_tokens", None)
+            if isinstance(tokens, int):
+                LLM_TOKENS_TOTAL.inc(tokens, model=model, direction=direction)
+        return total_tokens
@@ -0,0 +1,200 @@
+# Prometheus metrics for latency, caches, LLM calls and token usage
+
+# --------------------------------------------------------------
+# Import dependencies for metrics collection
+# --------------------------------------------------------------
+
+import math
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Union
+
+# --------------------------------------------------------------
+# Define helpers for the Prometheus text format
+# --------------------------------------------------------------
+
+# LLM-bound phases take from well under a second (cache hits) to minutes
+LATENCY_BUCKETS = (0.005, 0.025, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+PDF_RENDER_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def escape_label_value(value) -> str:
+    """Escape a label value for the text exposition format"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: dict) -> str:
+    """Render {name="value",...}, or nothing when there are no labels"""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+# --------------------------------------------------------------
+# Define metric types
+# --------------------------------------------------------------
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        """Initialize with the metric name, help text and label names"""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        """Add amount to the series for labels"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[tuple]:
+        for key, value in self._values.items():
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        """Initialize with the metric name, help text, label names and upper bucket bounds"""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (non-cumulative, plus +Inf), sum]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """Record one observation for labels"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        series[0][index] += 1
+        series[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with block, including when it raises"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> Iterator[tuple]:
+        for key, (counts, total) in self._series.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+class CallbackMetric:
+    """Gauge or counter read from existing state when scraped"""
+
+    def __init__(self, name: str, metric_type: str, documentation: str, callback: Callable[[], Union[float, dict]]):
+        """Initialize with a callback returning a value, or a dict of label tuples to values"""
+        self.name = name
+        self.metric_type = metric_type
+        self.documentation = documentation
+        self.callback = callback
+
+    def samples(self) -> Iterator[tuple]:
+        value = self.callback()
+        if isinstance(value, dict):
+            for labels, series_value in value.items():
+                yield self.name, dict(labels), series_value
+        else:
+            yield self.name, {}, value
+
+# --------------------------------------------------------------
+# Define registry rendering every metric
+# --------------------------------------------------------------
+
+
+class MetricsRegistry:
+    """Holds the process's metrics and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        """Initialize with no metrics"""
+        self._metrics: dict = {}
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name: str, documentation: str, callback: Callable[[], Union[float, dict]]) -> None:
+        """Expose a value computed at scrape time, e.g. from a stats() dict"""
+        self._register(CallbackMetric(name, "gauge", documentation, callback))
+
+    def counter_callback(self, name: str, documentation: str, callback: Callable[[], Union[float, dict]]) -> None:
+        """Expose a monotonic count already kept elsewhere, read at scrape time"""
+        self._register(CallbackMetric(name, "counter", documentation, callback))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+# Registry shared by the services and served on /metrics
+REGISTRY = MetricsRegistry()
+
+# --------------------------------------------------------------
+# Define metrics recorded by the services
+# --------------------------------------------------------------
+
+PHASE_DURATION_SECONDS = REGISTRY.histogram(
+    "release_notes_phase_duration_seconds",
+    "Time to resolve the latest version or produce a summary, including cache hits, by component and phase",
+    ("component", "phase")
+)
+PHASE_ERRORS_TOTAL = REGISTRY.counter(
+    "release_notes_phase_errors_total",
+    "Version lookups and summaries that ended in an error, by component and phase",
+    ("component", "phase")
+)
+PDF_RENDER_SECONDS = REGISTRY.histogram(
+    "pdf_render_duration_seconds",
+    "Time to render a PDF in the worker pool, including time queued for a worker",
+    buckets=PDF_RENDER_BUCKETS
+)
+LLM_TOKENS_TOTAL = REGISTRY.counter(
+    "llm_tokens_total",
+    "Tokens reported by OpenAI responses, by model and direction (input or output)",
+    ("model", "direction")
+)
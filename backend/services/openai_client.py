@@ -0,0 +1,53 @@
+# Deferred construction of the shared OpenAI client
+
+# --------------------------------------------------------------
+# Import dependencies for lazy client construction
+# --------------------------------------------------------------
+
+from typing import Optional
+
+# --------------------------------------------------------------
+# Define lazily constructed async OpenAI client
+# --------------------------------------------------------------
+
+
+class LazyAsyncOpenAI:
+    """Stand-in for openai.AsyncOpenAI that imports the SDK and builds the client on first use.
+
+    Importing the openai package takes longer than the rest of the app
+    together, so deferring it keeps `import main` fast. The app's lifespan
+    starts preload() in a worker thread without waiting for it, so the
+    worker takes traffic right away and the import is usually done by the
+    first LLM call.
+    """
+
+    def __init__(self, **client_options):
+        """Initialize with the keyword arguments for openai.AsyncOpenAI"""
+        self._client_options = client_options
+        self._client = None
+
+    @property
+    def client(self):
+        """The real AsyncOpenAI client, constructed on first access"""
+        if self._client is None:
+            import openai
+            self._client = openai.AsyncOpenAI(**self._client_options)
+        return self._client
+
+    def preload(self) -> None:
+        """Import the SDK without building the client; safe to run in a worker thread"""
+        import openai  # noqa: F401
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes not defined here, e.g. responses or embeddings
+        return getattr(self.client, name)
+
+    async def close(self) -> None:
+        """Close the client if it was ever constructed"""
+        if self._client is not None:
+            await self._client.close()
+
+
+def create_openai_client(api_key: Optional[str], **client_options) -> Optional[LazyAsyncOpenAI]:
+    """Return a lazily constructed client, or None when no API key is configured"""
+    return LazyAsyncOpenAI(api_key=api_key, **client_options) if api_key else None
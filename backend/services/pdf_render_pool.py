@@ -0,0 +1,98 @@
+# Bounded process pool that renders PDFs off the event loop
+
+# --------------------------------------------------------------
+# Import dependencies for off-loop PDF rendering
+# --------------------------------------------------------------
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from .metrics import PDF_RENDER_SECONDS
+
+# --------------------------------------------------------------
+# Configure logging for the PDF render pool
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------
+# Define render pool with a bounded queue
+# --------------------------------------------------------------
+
+
+def render_release_news_pdf(release_news: list) -> bytes:
+    """Worker entry point; reportlab is imported in the worker, never in the API process"""
+    from .pdf_rendering import generate_pdf_from_release_news
+    return generate_pdf_from_release_news(release_news)
+
+
+class PdfRenderPoolFull(Exception):
+    """Raised when every worker is busy and the render queue is full"""
+
+    def __init__(self, retry_after_seconds: float):
+        super().__init__("PDF rendering is at capacity, please retry shortly.")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class PdfRenderPool:
+    """Renders PDFs in worker processes so reportlab never blocks the event loop.
+
+    At most max_workers documents render at once and at most max_queued
+    more wait for a worker; further requests are rejected immediately with
+    PdfRenderPoolFull instead of piling up.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queued: int = 8, retry_after_seconds: float = 5.0):
+        """Initialize with worker count, queue bound and the Retry-After hint for rejected requests"""
+        self.max_workers = max(1, max_workers)
+        self.max_queued = max(0, max_queued)
+        self.retry_after_seconds = retry_after_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self.rendered = 0
+        self.rejected = 0
+
+    async def render_release_news(self, release_news: list) -> bytes:
+        """Render frontend releaseNews data to PDF bytes in a worker process"""
+        if self._pending >= self.max_workers + self.max_queued:
+            self.rejected += 1
+            raise PdfRenderPoolFull(self.retry_after_seconds)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            with PDF_RENDER_SECONDS.time():
+                pdf_bytes = await loop.run_in_executor(self._get_executor(), render_release_news_pdf, release_news)
+            self.rendered += 1
+            return pdf_bytes
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """Pending renders and counters for diagnostics"""
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "max_queued": self.max_queued,
+            "rendered": self.rendered,
+            "rejected": self.rejected,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start worker processes on first use; spawn avoids forking the running event loop"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info("Started PDF render pool with %d workers", self.max_workers)
+        return self._executor
@@ -0,0 +1,113 @@
+# PDF rendering of release summaries with styles built once per process
+
+# --------------------------------------------------------------
+# Import dependencies for PDF generation
+# --------------------------------------------------------------
+
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from .summary_text import strip_emoji, bold_to_markup, line_breaks_to_markup
+
+# --------------------------------------------------------------
+# Define shared PDF styles
+# --------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def get_pdf_styles() -> dict:
+    """Build the sample stylesheet and custom paragraph styles once and reuse them for every PDF"""
+    styles = getSampleStyleSheet()
+    return {
+        "normal": styles['Normal'],
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Title'],
+            fontSize=24,
+            spaceAfter=30,
+            textColor='#1496FF'
+        ),
+        "heading": ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading1'],
+            fontSize=16,
+            spaceBefore=20,
+            spaceAfter=10,
+            textColor='#1a3a6b'
+        ),
+        "body": ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceBefore=6,
+            spaceAfter=6,
+            leftIndent=20
+        ),
+    }
+
+
+def start_story() -> list:
+    """Title and generation date that open every PDF"""
+    styles = get_pdf_styles()
+    date_text = f"Generated on: {datetime.now().strftime('%B %d, %Y at %H:%M')}"
+    return [
+        Paragraph("Dynatrace Release Notes Summary", styles["title"]),
+        Spacer(1, 20),
+        Paragraph(date_text, styles["normal"]),
+        Spacer(1, 30),
+    ]
+
+
+def format_paragraph_markup(text: str) -> str:
+    """Convert markdown bold and line breaks to reportlab paragraph markup"""
+    return line_breaks_to_markup(bold_to_markup(text))
+
+
+def build_pdf(story: list) -> bytes:
+    """Render a story to PDF bytes"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch, bottomMargin=1*inch)
+    doc.build(story)
+    return buffer.getvalue()
+
+# --------------------------------------------------------------
+# Define PDF generator
+# --------------------------------------------------------------
+
+
+def generate_pdf_from_release_news(release_news: list) -> bytes:
+    """Generate PDF content from frontend releaseNews array format"""
+    styles = get_pdf_styles()
+    story = start_story()
+    
+    # Process each release news item
+    for item in release_news:
+        component = item.get('component', '')
+        version = item.get('version', '')
+        summary = item.get('summary', '')
+        
+        # Skip error components
+        if component in ['Error', 'Info']:
+            continue
+        
+        # Component title with version
+        component_title = f"{component}"
+        if version:
+            component_title += f" - Version {version}"
+            
+        story.append(Paragraph(component_title, styles["heading"]))
+        story.append(Spacer(1, 15))
+        
+        # Clean and format summary content
+        if summary:
+            # Remove emoji and markdown formatting for PDF
+            clean_content = strip_emoji(summary)
+            story.append(Paragraph(format_paragraph_markup(clean_content), styles["body"]))
+            story.append(Spacer(1, 20))
+    
+    return build_pdf(story)
@@ -0,0 +1,129 @@
+# Background scheduler that pre-generates release summaries for new versions
+
+# --------------------------------------------------------------
+# Import dependencies for background pre-warming
+# --------------------------------------------------------------
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+# --------------------------------------------------------------
+# Configure logging for the pre-warm scheduler
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------
+# Define registration record for a pre-warmed component
+# --------------------------------------------------------------
+
+
+@dataclass
+class PrewarmTarget:
+    """Version probe and summary generator registered for one component"""
+    component: str
+    get_latest_version: Callable[[], Awaitable]
+    get_release_summary: Callable[[str], Awaitable]
+    known_version: Optional[str] = None
+
+# --------------------------------------------------------------
+# Define scheduler that polls versions and warms the summary cache
+# --------------------------------------------------------------
+
+
+class PrewarmScheduler:
+    """Polls registered components and generates summaries ahead of user requests"""
+
+    def __init__(self, interval_seconds: float = 900.0, jitter_seconds: float = 60.0, max_concurrency: int = 2):
+        """Initialize with poll interval, random jitter and a cap on concurrent components"""
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._targets: dict[str, PrewarmTarget] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    def register(
+        self,
+        component: str,
+        get_latest_version: Callable[[], Awaitable],
+        get_release_summary: Callable[[str], Awaitable]
+    ) -> None:
+        """Register a component's version probe and summary generator"""
+        self._targets[component] = PrewarmTarget(component, get_latest_version, get_release_summary)
+
+    def known_versions(self) -> dict:
+        """Latest version already warmed for each registered component"""
+        return {component: target.known_version for component, target in self._targets.items()}
+
+    # --------------------------------------------------------------
+    # Lifecycle methods
+    # --------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the polling loop in the background"""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+            logger.info("Pre-warm scheduler started for %s", ", ".join(self._targets))
+
+    async def stop(self, timeout_seconds: float = 10.0) -> None:
+        """Signal the loop to stop, wait for in-progress work, then cancel what remains"""
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("Pre-warm scheduler stopped")
+
+    # --------------------------------------------------------------
+    # Polling methods
+    # --------------------------------------------------------------
+
+    async def _run(self) -> None:
+        """Poll every target, then sleep for the interval plus jitter until stopped"""
+        while not self._stopping.is_set():
+            await self.poll_once()
+
+            delay = self.interval_seconds + random.uniform(0, self.jitter_seconds)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def poll_once(self) -> None:
+        """Check every registered component once, bounded by the concurrency cap"""
+        await asyncio.gather(*(self._warm(target) for target in self._targets.values()))
+
+    async def _warm(self, target: PrewarmTarget) -> None:
+        """Make sure the summary for a component's latest version is cached"""
+        async with self._semaphore:
+            if self._stopping.is_set():
+                return
+
+            try:
+                latest_version = await target.get_latest_version()
+                if not isinstance(latest_version, str):
+                    logger.warning("Pre-warm version probe failed for %s: %s", target.component, latest_version)
+                    return
+                if latest_version != target.known_version:
+                    logger.info("Pre-warming %s summary for new version %s", target.component, latest_version)
+
+                # For a version that is already warm this is a cache hit; it only
+                # regenerates the summary once the cached entry has expired
+                summary = await target.get_release_summary(latest_version)
+                if isinstance(summary, dict) and "error" in summary:
+                    logger.warning("Pre-warm summary failed for %s: %s", target.component, summary["error"])
+                    return
+
+                target.known_version = latest_version
+            except Exception as e:
+                logger.exception("Pre-warm failed for %s: %s", target.component, e)
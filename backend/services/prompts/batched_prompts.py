@@ -0,0 +1,24 @@
+# Prompts that summarize several components' releases in a single request
+
+# --------------------------------------------------------------
+# Define prompt batching several component summary prompts
+# --------------------------------------------------------------
+
+
+def get_batched_summary_prompt(component_prompts: list) -> str:
+    """Returns prompt to summarize every (component key, summary prompt) pair in one response"""
+    component_keys = ", ".join(f"'{component_key}'" for component_key, _ in component_prompts)
+    sections = "\n".join(
+        f"""
+        ===== Component '{component_key}' =====
+        {summary_prompt}
+        """
+        for component_key, summary_prompt in component_prompts
+    )
+    return f"""
+        You will summarize the release notes of {len(component_prompts)} components: {component_keys}.
+        Follow the instructions for each component separately and do not mix information between components.
+        Return exactly one entry in summaries per component, with its component field set to the component key
+        and its latestVersion field set to the version named in that component's instructions.
+        {sections}
+        """
@@ -0,0 +1,19 @@
+# Prompts that resolve the latest version and summarize it in a single request
+
+# --------------------------------------------------------------
+# Define prompt combining version lookup and summary extraction
+# --------------------------------------------------------------
+
+from typing import Callable
+
+LATEST_VERSION_PLACEHOLDER = "LATEST_VERSION"
+
+
+def get_combined_summary_prompt(docs_url: str, summary_prompt: Callable[[str], str]) -> str:
+    """Returns prompt to find the latest version on the docs page and summarize it in one response"""
+    return f"""
+        Step 0: open {docs_url} and find the latest version in the table column 'version'. The latest version is the largest number.
+        In the instructions below, {LATEST_VERSION_PLACEHOLDER} refers to that version.
+        Set the latestVersion field of your response to that version number only.
+        {summary_prompt(LATEST_VERSION_PLACEHOLDER)}
+        """
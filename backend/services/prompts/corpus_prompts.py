@@ -0,0 +1,39 @@
+# Prompts that summarize release notes text supplied from the local corpus
+
+# --------------------------------------------------------------
+# Define prompts wrapping a summary prompt with the page text
+# --------------------------------------------------------------
+
+
+def without_navigation(summary_prompt: str) -> str:
+    """Returns summary prompt without its "Navigate to ..." line, which contradicts supplied page text"""
+    return "\n".join(line for line in summary_prompt.splitlines() if not line.strip().startswith("Navigate to "))
+
+
+def get_corpus_summary_prompt(summary_prompt: str, page_text: str) -> str:
+    """Returns summary prompt with the release notes page text attached, so no browsing is needed"""
+    return f"""
+        {without_navigation(summary_prompt)}
+
+        The complete release notes page is provided below. Do not open any URLs; use only this text.
+
+        ----- RELEASE NOTES PAGE -----
+        {page_text}
+        ----- END OF RELEASE NOTES PAGE -----
+        """
+
+
+def get_chunk_summary_prompt(summary_prompt: str, chunk_text: str, chunk_number: int, chunk_count: int) -> str:
+    """Returns summary prompt for one part of a long release notes page"""
+    return f"""
+        {without_navigation(summary_prompt)}
+
+        The release notes page is too long for one request, so it is provided in {chunk_count} parts.
+        Below is part {chunk_number} of {chunk_count}. Do not open any URLs; use only this text.
+        Categorize only the information contained in this part. When this part has nothing for a category,
+        write that category's "none" statement; parts are merged without those statements.
+
+        ----- RELEASE NOTES PAGE, PART {chunk_number} OF {chunk_count} -----
+        {chunk_text}
+        ----- END OF PART {chunk_number} -----
+        """
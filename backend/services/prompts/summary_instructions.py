@@ -0,0 +1,40 @@
+# Shared instructions for every release summary request
+
+# --------------------------------------------------------------
+# Define the five summary categories
+# --------------------------------------------------------------
+
+# Keeps each section short enough that a summary fits the output cap
+SUMMARY_SECTION_MAX_WORDS = 150
+
+# What each summary section collects, in prompt order
+SECTION_DESCRIPTIONS = {
+    "breaking_changes": "breaking changes, deprecations, removed features, or changes that might affect existing deployments",
+    "announcements": "important announcements, general information, roadmap updates, or high-level communications about the release",
+    "technology_support": "technology support updates, platform compatibility changes, newly supported technologies, operating system support, or infrastructure requirements",
+    "new_features": "new features, capabilities, enhancements, or functionality added in this version",
+    "resolved_issues": "bug fixes, resolved issues, performance improvements, or stability enhancements",
+}
+
+# Statement the model writes for a section with nothing to report
+SECTION_PLACEHOLDERS = {
+    "breaking_changes": "No breaking changes reported for this version.",
+    "announcements": "No major announcements for this version.",
+    "technology_support": "No technology support updates for this version.",
+    "new_features": "No new features in this version.",
+    "resolved_issues": "No resolved issues reported for this version.",
+}
+
+# --------------------------------------------------------------
+# Define system prompt with the five summary categories
+# --------------------------------------------------------------
+
+SUMMARY_SYSTEM_PROMPT = "\n".join([
+    "You summarize Dynatrace release notes. Read the complete release notes, not just a preview, "
+    "and sort every item into exactly one of these sections:",
+    *(
+        f'- {field}: {description}. If none, write "{SECTION_PLACEHOLDERS[field]}"'
+        for field, description in SECTION_DESCRIPTIONS.items()
+    ),
+    f"Be concise: at most {SUMMARY_SECTION_MAX_WORDS} words per section.",
+])
@@ -0,0 +1,244 @@
+# Local corpus of release notes pages refreshed with conditional HTTP requests
+
+# --------------------------------------------------------------
+# Import dependencies for downloading and storing release notes
+# --------------------------------------------------------------
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+import aiohttp
+from bs4 import BeautifulSoup
+from .version_discovery import extract_version_links_from_html
+
+# --------------------------------------------------------------
+# Configure logging for the release notes corpus
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# Page elements that never contain release notes content
+NON_CONTENT_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "svg"]
+HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+# --------------------------------------------------------------
+# Define page record and text extraction helpers
+# --------------------------------------------------------------
+
+
+@dataclass
+class CorpusPage:
+    """Extracted text of one docs page with the validators needed to refresh it"""
+    url: str
+    text: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    version_links: dict = field(default_factory=dict)
+
+
+def extract_page_text(html: str) -> str:
+    """Return the readable text of a docs page's main content, with headings marked as "#" lines"""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(NON_CONTENT_TAGS):
+        tag.decompose()
+    # Keep heading boundaries so long pages can be split into sections
+    for heading in soup(HEADING_TAGS):
+        heading.replace_with(f"\n{'#' * int(heading.name[1])} {heading.get_text(' ', strip=True)}\n")
+    content = soup.find("main") or soup.find("article") or soup.body or soup
+    lines = (line.strip() for line in content.get_text("\n").splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def content_hash(text: str) -> str:
+    """Hash of extracted page text; markup-only changes do not alter it"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+# --------------------------------------------------------------
+# Define corpus service storing pages and summaries on disk
+# --------------------------------------------------------------
+
+
+class ReleaseNotesCorpus:
+    """Downloads release notes pages, keeps their text on disk and refreshes them conditionally.
+
+    Pages are re-requested at most once per refresh interval, with
+    If-None-Match / If-Modified-Since so unchanged pages cost a 304. Summaries
+    are stored by page content hash and prompt hash, so a page whose text has
+    not changed is never summarized twice, even across restarts.
+    """
+
+    def __init__(
+        self,
+        storage_dir: str,
+        refresh_interval_seconds: float = 3600.0,
+        timeout_seconds: float = 10.0,
+        max_page_chars: int = 200000
+    ):
+        """Initialize with a storage directory, refresh interval, request timeout and page size limit"""
+        self.pages_dir = os.path.join(storage_dir, "pages")
+        self.summaries_dir = os.path.join(storage_dir, "summaries")
+        os.makedirs(self.pages_dir, exist_ok=True)
+        os.makedirs(self.summaries_dir, exist_ok=True)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self.max_page_chars = max_page_chars
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pages = {}
+        self._locks = {}
+        self.downloads = 0
+        self.not_modified = 0
+        self.changed = 0
+
+    # --------------------------------------------------------------
+    # Public methods
+    # --------------------------------------------------------------
+
+    async def get_page(self, url: str) -> Optional[CorpusPage]:
+        """Return the stored page, refreshing it first when the refresh interval has passed"""
+        async with self._locks.setdefault(url, asyncio.Lock()):
+            stored_page = await self._load_page(url)
+            if stored_page is not None and time.time() - stored_page.fetched_at < self.refresh_interval_seconds:
+                return stored_page
+
+            try:
+                return await self._refresh_page(url, stored_page)
+            except Exception as e:
+                # A stale copy is better than no context at all
+                logger.warning("Corpus refresh failed for %s: %s", url, e)
+                return stored_page
+
+    async def get_version_page(self, docs_url: str, version: str) -> Optional[CorpusPage]:
+        """Return the release notes page linked from a what's-new table for one version"""
+        index_page = await self.get_page(docs_url)
+        if index_page is None:
+            return None
+        version_url = index_page.version_links.get(version)
+        if version_url is None:
+            logger.info("No release notes link for version %s on %s", version, docs_url)
+            return None
+        return await self.get_page(version_url)
+
+    async def load_summary(self, page_hash: str, prompt_hash: str) -> Optional[dict]:
+        """Return the stored summary of a page's content for a prompt, if any"""
+        try:
+            return await asyncio.to_thread(self._read_json, self._summary_path(page_hash, prompt_hash))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable stored summary %s: %s", page_hash, e)
+            return None
+
+    async def store_summary(self, page_hash: str, prompt_hash: str, summary: dict) -> None:
+        """Store the summary of a page's content for a prompt"""
+        await asyncio.to_thread(self._write_json, self._summary_path(page_hash, prompt_hash), summary)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def stats(self) -> dict:
+        """Download, 304 and content change counters for diagnostics"""
+        return {
+            "pages": len(self._pages),
+            "downloads": self.downloads,
+            "not_modified": self.not_modified,
+            "changed": self.changed,
+        }
+
+    # --------------------------------------------------------------
+    # Fetch and storage methods
+    # --------------------------------------------------------------
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session lazily inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self._session
+
+    async def _refresh_page(self, url: str, stored_page: Optional[CorpusPage]) -> CorpusPage:
+        """Fetch a page conditionally and store it when its content changed"""
+        headers = {}
+        if stored_page is not None:
+            if stored_page.etag:
+                headers["If-None-Match"] = stored_page.etag
+            if stored_page.last_modified:
+                headers["If-Modified-Since"] = stored_page.last_modified
+
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and stored_page is not None:
+                self.not_modified += 1
+                stored_page.fetched_at = time.time()
+                await self._save_page(stored_page)
+                return stored_page
+
+            response.raise_for_status()
+            html = await response.text()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        self.downloads += 1
+        # Parsing a large page takes long enough to stall every other request
+        text, version_links = await asyncio.to_thread(self._parse_page, html, url)
+        page = CorpusPage(
+            url=url,
+            text=text,
+            content_hash=content_hash(text),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+            version_links=version_links
+        )
+        if stored_page is not None and stored_page.content_hash != page.content_hash:
+            self.changed += 1
+            logger.info("Release notes page changed: %s", url)
+        await self._save_page(page)
+        return page
+
+    def _parse_page(self, html: str, url: str) -> tuple:
+        """Extract a page's text and version links; runs in a worker thread"""
+        return extract_page_text(html)[:self.max_page_chars], extract_version_links_from_html(html, url)
+
+    def _page_path(self, url: str) -> str:
+        return os.path.join(self.pages_dir, hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".json")
+
+    def _summary_path(self, page_hash: str, prompt_hash: str) -> str:
+        return os.path.join(self.summaries_dir, f"{page_hash[:32]}-{prompt_hash}.json")
+
+    async def _load_page(self, url: str) -> Optional[CorpusPage]:
+        """Return a page from memory or disk"""
+        if url in self._pages:
+            return self._pages[url]
+        try:
+            page = CorpusPage(**await asyncio.to_thread(self._read_json, self._page_path(url)))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Ignoring unreadable corpus page for %s: %s", url, e)
+            return None
+        self._pages[url] = page
+        return page
+
+    async def _save_page(self, page: CorpusPage) -> None:
+        self._pages[page.url] = page
+        await asyncio.to_thread(self._write_json, self._page_path(page.url), asdict(page))
+
+    def _read_json(self, path: str):
+        with open(path, encoding="utf-8") as input_file:
+            return json.load(input_file)
+
+    def _write_json(self, path: str, data: dict) -> None:
+        """Write JSON atomically so a crash never leaves a truncated file"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as output_file:
+            json.dump(data, output_file)
+        os.replace(temp_path, path)
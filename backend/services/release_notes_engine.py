@@ -0,0 +1,707 @@
+# Generic release notes processing engine driven by the component registry
+
+# --------------------------------------------------------------
+# Import dependencies for release notes processing
+# --------------------------------------------------------------
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Union
+
+from fastapi.responses import JSONResponse
+from .data_models import (
+    ComponentLatestReleaseVersion,
+    ComponentLatestReleaseSummary,
+    ComponentReleaseSummaryBatch,
+    ComponentVersionRangeSummary
+)
+from .component_registry import COMPONENT_REGISTRY, ComponentSpec, VERSION_SOURCE_DOCS_TABLE
+from .summary_cache import SummaryCache, prompt_template_hash, summary_cache_key
+from .single_flight import SingleFlight
+from .version_discovery import VersionDiscovery, parse_version, version_key
+from .summary_streaming import SectionDeltaFanout, stream_release_summary, get_search_tools
+from .llm_call_scheduler import CallPriority, LLMCallScheduler, PRIORITY_INTERACTIVE
+from .token_budget import TokenBudget, TokenBudgetExceeded, count_tokens
+from .prompts.combined_prompts import get_combined_summary_prompt
+from .prompts.batched_prompts import get_batched_summary_prompt
+from .prompts.summary_instructions import SUMMARY_SYSTEM_PROMPT
+from .version_range import select_range_versions, merge_range_sections
+from .release_notes_corpus import ReleaseNotesCorpus
+from .search_index import SearchIndex
+from .prompts.corpus_prompts import get_corpus_summary_prompt, get_chunk_summary_prompt
+from .chunked_summary import SECTION_PLACEHOLDERS, split_into_chunks, merge_chunk_summaries
+from .metrics import PHASE_DURATION_SECONDS, PHASE_ERRORS_TOTAL
+from .structured_logging import log_llm_payload
+
+if TYPE_CHECKING:
+    import openai
+
+# --------------------------------------------------------------
+# Configure logging and output token caps for the release notes engine
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# Hard caps on output tokens per call, also charged as the output estimate when budgeting
+VERSION_MAX_OUTPUT_TOKENS = 100
+CHUNK_MAX_OUTPUT_TOKENS = 1000
+
+# --------------------------------------------------------------
+# Define state shared by coalesced callers
+# --------------------------------------------------------------
+
+
+class SharedCall:
+    """Priority and streamed section text of one call shared by concurrent callers"""
+
+    def __init__(self, priority: int):
+        """Initialize with the first caller's priority"""
+        self.priority = CallPriority(priority)
+        self.section_deltas = SectionDeltaFanout()
+
+# --------------------------------------------------------------
+# Define engine that processes any registered component
+# --------------------------------------------------------------
+
+
+class ReleaseNotesEngine:
+    """Resolves versions and generates release summaries for every registered component.
+
+    One engine owns the shared OpenAI client, the summary cache, single-flight
+    coalescing and the LLM call scheduler (rate limits, concurrency, retries),
+    so every optimization applies to every component in the registry.
+    """
+
+    def __init__(
+        self,
+        openai_client: "openai.AsyncOpenAI",
+        registry: Optional[dict] = None,
+        summary_cache: Optional[SummaryCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        version_discovery: Optional[VersionDiscovery] = None,
+        llm_scheduler: Optional[LLMCallScheduler] = None,
+        corpus: Optional[ReleaseNotesCorpus] = None,
+        search_index: Optional[SearchIndex] = None,
+        combined_mode: bool = False,
+        batched_mode: bool = False,
+        max_range_versions: int = 20,
+        chunk_max_chars: int = 12000,
+        chunk_parallelism: int = 4,
+        token_budget: Optional[TokenBudget] = None,
+        summary_max_output_tokens: int = 2000
+    ):
+        """Initialize with the shared async OpenAI client and shared services"""
+        self.openai_client = openai_client
+        self.registry = registry if registry is not None else COMPONENT_REGISTRY
+        self.summary_cache = summary_cache
+        self.single_flight = single_flight
+        self.version_discovery = version_discovery
+        self.llm_scheduler = llm_scheduler or LLMCallScheduler()
+        self.corpus = corpus
+        self.search_index = search_index
+        self.combined_mode = combined_mode
+        self.batched_mode = batched_mode
+        self.max_range_versions = max_range_versions
+        self.chunk_max_chars = chunk_max_chars
+        self.chunk_parallelism = max(1, chunk_parallelism)
+        self.token_budget = token_budget
+        self.summary_max_output_tokens = summary_max_output_tokens
+        # Latest version resolved per component, used to validate combined-mode answers
+        self._known_versions = {}
+        # Latest summary generated per component, served when the token budget runs low
+        self._latest_summaries = {}
+        # Callers' state for each call currently coalesced by single_flight
+        self._shared_calls: dict[tuple, SharedCall] = {}
+
+    def get_component(self, component_key: str) -> ComponentSpec:
+        """Look up a registered component by its response key"""
+        return self.registry[component_key]
+
+    async def _coalesce(
+        self,
+        key: tuple,
+        call: Callable[[Optional[Callable[[str, str], None]], CallPriority], Awaitable],
+        on_section_delta: Optional[Callable[[str, str], None]] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ):
+        """Run call once for concurrent callers with the same key.
+
+        Streaming and plain callers share separate calls, since streams are
+        not retried. Every streaming caller receives all section text,
+        including text generated before it joined, and the shared call runs
+        at the most urgent priority among its callers.
+        """
+        if self.single_flight is None:
+            return await call(on_section_delta, priority)
+
+        if on_section_delta:
+            key += ("stream",)
+        shared_call = self._shared_calls.get(key)
+        if shared_call is None:
+            shared_call = self._shared_calls[key] = SharedCall(priority)
+        shared_call.priority.raise_to(priority)
+
+        async def run_shared_call():
+            try:
+                return await call(shared_call.section_deltas.publish if on_section_delta else None, shared_call.priority)
+            finally:
+                if self._shared_calls.get(key) is shared_call:
+                    del self._shared_calls[key]
+
+        if on_section_delta:
+            shared_call.section_deltas.subscribe(on_section_delta)
+        try:
+            return await self.single_flight.do(key, run_shared_call)
+        finally:
+            if on_section_delta:
+                shared_call.section_deltas.unsubscribe(on_section_delta)
+
+    def _summary_request_options(self, max_output_tokens: Optional[int] = None) -> dict:
+        """Shared section instructions and output cap for a summary request"""
+        return {
+            "instructions": SUMMARY_SYSTEM_PROMPT,
+            "max_output_tokens": max_output_tokens or self.summary_max_output_tokens,
+        }
+
+    def _estimate_summary_tokens(self, prompt: str, max_output_tokens: Optional[int] = None) -> int:
+        """Tokens to budget for a summary request: instructions, prompt and the output cap"""
+        output_tokens = max_output_tokens or self.summary_max_output_tokens
+        return count_tokens(SUMMARY_SYSTEM_PROMPT) + count_tokens(prompt) + output_tokens
+
+    # --------------------------------------------------------------
+    # Main processing methods
+    # --------------------------------------------------------------
+
+    async def process_component(
+        self,
+        component_key: str,
+        on_progress: Optional[Callable[[str, dict], None]] = None,
+        on_section_delta: Optional[Callable[[str, str], None]] = None,
+        combined: Optional[bool] = None
+    ):
+        """Resolve the latest version of a component and return its release summary"""
+        spec = self.get_component(component_key)
+        logger.info("Received request for %s release news", spec.name)
+
+        if self.combined_mode if combined is None else combined:
+            return await self._process_component_combined(spec, on_progress, on_section_delta)
+
+        if on_progress:
+            on_progress("resolving_version", {})
+
+        latest_version = await self.get_latest_version(component_key)
+        if "error" in latest_version:
+            return JSONResponse(status_code=500, content=latest_version)
+
+        return await self._summarize_version(spec, latest_version, on_progress, on_section_delta)
+
+    async def process_components(
+        self,
+        component_keys: list,
+        combined: Optional[bool] = None,
+        batched: Optional[bool] = None
+    ) -> list:
+        """Process several components, returning one result (or exception) per key in order.
+
+        In batched mode the versions are resolved first and every uncached
+        summary is requested in one structured call; components missing from
+        the batch or failing its validation are summarized individually.
+        """
+        if not (self.batched_mode if batched is None else batched) or len(component_keys) < 2:
+            return await asyncio.gather(
+                *(self.process_component(key, combined=combined) for key in component_keys),
+                return_exceptions=True
+            )
+
+        specs = [self.get_component(key) for key in component_keys]
+        latest_versions = await asyncio.gather(*(self.get_latest_version(spec.key) for spec in specs), return_exceptions=True)
+
+        results = {}
+        pending = {}
+        for spec, latest_version in zip(specs, latest_versions):
+            if isinstance(latest_version, Exception):
+                results[spec.key] = latest_version
+            elif "error" in latest_version:
+                results[spec.key] = JSONResponse(status_code=500, content=latest_version)
+            else:
+                cached_summary = self._get_cached_summary(spec, latest_version)
+                if cached_summary is not None:
+                    results[spec.key] = cached_summary
+                else:
+                    pending[spec.key] = latest_version
+
+        if len(pending) > 1:
+            started = time.perf_counter()
+            results.update(await self._generate_batched_summaries(pending))
+            for component_key in pending:
+                PHASE_DURATION_SECONDS.observe(time.perf_counter() - started, component=component_key, phase="batched_summary")
+                if component_key not in results:
+                    PHASE_ERRORS_TOTAL.inc(component=component_key, phase="batched_summary")
+
+        fallback_keys = [key for key in pending if key not in results]
+        if fallback_keys:
+            fallback_results = await asyncio.gather(
+                *(self._summarize_version(self.get_component(key), pending[key]) for key in fallback_keys),
+                return_exceptions=True
+            )
+            results.update(zip(fallback_keys, fallback_results))
+
+        return [results[spec.key] for spec in specs]
+
+    async def _process_component_combined(
+        self,
+        spec: ComponentSpec,
+        on_progress: Optional[Callable[[str, dict], None]] = None,
+        on_section_delta: Optional[Callable[[str, str], None]] = None
+    ):
+        """Resolve version and summary in one LLM call, falling back to separate calls if it fails validation"""
+        if on_progress:
+            on_progress("resolving_version", {})
+
+        # A docs-table version already makes the two-step path a single LLM call
+        # (or none, on a cache hit), so the combined prompt is only needed without one
+        latest_version = await self._discover_version(spec)
+        if not latest_version:
+            if on_progress:
+                on_progress("summarizing", {})
+
+            with PHASE_DURATION_SECONDS.time(component=spec.key, phase="combined"):
+                result = await self._coalesce(
+                    (spec.key, "combined"),
+                    lambda shared_on_section_delta, _priority: self._generate_combined_summary(spec, shared_on_section_delta),
+                    on_section_delta
+                )
+
+            if "error" not in result:
+                if on_progress:
+                    on_progress("version_resolved", {"version": result.latestVersion})
+                return result
+
+            PHASE_ERRORS_TOTAL.inc(component=spec.key, phase="combined")
+            logger.warning("Combined %s request failed, using separate version and summary calls: %s", spec.name, result["error"])
+            if on_progress:
+                # Restart progress so clients discard text streamed by the rejected answer
+                on_progress("resolving_version", {})
+
+            latest_version = await self.get_latest_version(spec.key)
+            if "error" in latest_version:
+                return JSONResponse(status_code=500, content=latest_version)
+
+        return await self._summarize_version(spec, latest_version, on_progress, on_section_delta)
+
+    async def _summarize_version(
+        self,
+        spec: ComponentSpec,
+        version: str,
+        on_progress: Optional[Callable[[str, dict], None]] = None,
+        on_section_delta: Optional[Callable[[str, str], None]] = None
+    ):
+        """Summarize a resolved version, reporting progress and wrapping errors in a 500 response"""
+        if on_progress:
+            on_progress("version_resolved", {"version": version})
+            on_progress("summarizing", {"version": version})
+
+        summary_result = await self.get_release_summary(spec.key, version, on_section_delta)
+        if "error" in summary_result:
+            return JSONResponse(status_code=500, content=summary_result)
+
+        return summary_result
+
+    async def _generate_combined_summary(
+        self,
+        spec: ComponentSpec,
+        on_section_delta: Optional[Callable[[str, str], None]] = None
+    ):
+        """Ask OpenAI for the latest version and its summary together, then validate and cache the result"""
+        if not self.openai_client:
+            return {"error": "OpenAI API key not configured."}
+
+        try:
+            combined_prompt = get_combined_summary_prompt(spec.docs_url, spec.summary_prompt)
+            log_llm_payload(logger, "Sending combined prompt to OpenAI", combined_prompt, spec.key, "combined")
+            estimated_tokens = self._estimate_summary_tokens(combined_prompt)
+
+            if on_section_delta:
+                combined_response = await self.llm_scheduler.run(
+                    lambda: stream_release_summary(
+                        self.openai_client, combined_prompt, on_section_delta, **self._summary_request_options()
+                    ),
+                    estimated_tokens=estimated_tokens,
+                    max_retries=0
+                )
+            else:
+                combined_response = await self.llm_scheduler.run(
+                    lambda: self.openai_client.responses.parse(
+                        model="gpt-4o",
+                        input=combined_prompt,
+                        tools=[{"type": "web_search_preview"}],
+                        text_format=ComponentLatestReleaseSummary,
+                        **self._summary_request_options()
+                    ),
+                    estimated_tokens=estimated_tokens
+                )
+            result = combined_response.output_parsed
+            log_llm_payload(logger, "Received combined summary from OpenAI", result, spec.key, "combined")
+
+            if result is None:
+                return {"error": "Failed to get summary from OpenAI."}
+
+            # Reject answers without a usable version or older than one already resolved
+            version = parse_version(result.latestVersion)
+            if version is None:
+                return {"error": f"Combined response has no valid {spec.name} version: {result.latestVersion!r}"}
+            known_version = self._known_versions.get(spec.key)
+            if known_version and version_key(version) < version_key(known_version):
+                return {"error": f"Combined response version {version} is older than known version {known_version}"}
+
+            result.latestVersion = version
+            self._known_versions[spec.key] = version
+            await self._remember_summary(spec, result)
+            return result
+
+        except TokenBudgetExceeded as e:
+            # A combined call resolves the version itself, so only the last resolved one can be served
+            return self._latest_summary_or_error(spec, self._known_versions.get(spec.key), e)
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def _generate_batched_summaries(self, versions: dict) -> dict:
+        """Summarize several component versions in one OpenAI call, returning the entries that pass validation"""
+        if not self.openai_client:
+            return {}
+
+        try:
+            batched_prompt = get_batched_summary_prompt([
+                (component_key, self.get_component(component_key).summary_prompt(version))
+                for component_key, version in versions.items()
+            ])
+            log_llm_payload(logger, "Sending batched summary prompt to OpenAI", batched_prompt, ",".join(versions), "batched_summary")
+
+            max_output_tokens = self.summary_max_output_tokens * len(versions)
+            batch_response = await self.llm_scheduler.run(
+                lambda: self.openai_client.responses.parse(
+                    model="gpt-4o",
+                    input=batched_prompt,
+                    tools=[{"type": "web_search_preview"}],
+                    text_format=ComponentReleaseSummaryBatch,
+                    **self._summary_request_options(max_output_tokens)
+                ),
+                estimated_tokens=self._estimate_summary_tokens(batched_prompt, max_output_tokens)
+            )
+            batch = batch_response.output_parsed
+            log_llm_payload(logger, "Received batched summary from OpenAI", batch, ",".join(versions), "batched_summary")
+        except Exception as e:
+            logger.warning("Batched summary request failed, summarizing components individually: %s", e)
+            return {}
+
+        if batch is None:
+            logger.warning("Batched summary response could not be parsed, summarizing components individually")
+            return {}
+
+        # Accept one complete entry per requested component for the requested version
+        summaries = {}
+        for item in batch.summaries:
+            version = versions.get(item.component)
+            if version is None or item.component in summaries:
+                logger.warning("Ignoring unexpected or duplicate batched summary for %r", item.component)
+                continue
+            if parse_version(item.latestVersion) != version:
+                logger.warning("Batched %s summary is for version %r instead of %s", item.component, item.latestVersion, version)
+                continue
+
+            summary = ComponentLatestReleaseSummary(**item.model_dump(exclude={"component"}))
+            if not all(getattr(summary, field).strip() for field in ComponentLatestReleaseSummary.model_fields):
+                logger.warning("Batched %s summary has empty sections", item.component)
+                continue
+
+            summary.latestVersion = version
+            spec = self.get_component(item.component)
+            await self._remember_summary(spec, summary)
+            summaries[spec.key] = summary
+
+        return summaries
+
+    # --------------------------------------------------------------
+    # Version range methods
+    # --------------------------------------------------------------
+
+    async def summarize_version_range(self, component_key: str, from_version: str, to_version: Optional[str] = None):
+        """Summarize every release after from_version up to to_version (latest by default) and merge them"""
+        spec = self.get_component(component_key)
+        if spec.version_source != VERSION_SOURCE_DOCS_TABLE or self.version_discovery is None:
+            return {"error": f"Version ranges require the {spec.name} docs table, which is not enabled."}
+
+        available_versions = await self.version_discovery.list_versions(spec.docs_url)
+        if not available_versions:
+            return {"error": f"Failed to list {spec.name} versions from {spec.docs_url}."}
+
+        to_version = to_version or available_versions[0]
+        range_versions = select_range_versions(available_versions, from_version, to_version)
+        if not range_versions:
+            return {"error": f"No {spec.name} versions found after {from_version} up to {to_version}."}
+        if len(range_versions) > self.max_range_versions:
+            return {"error": f"Range covers {len(range_versions)} {spec.name} versions; the maximum is {self.max_range_versions}."}
+
+        # Summaries are cached per version, so only versions not seen before reach OpenAI
+        results = await asyncio.gather(
+            *(self.get_release_summary(spec.key, version) for version in range_versions),
+            return_exceptions=True
+        )
+        summaries = [result for result in results if isinstance(result, ComponentLatestReleaseSummary)]
+        failed_versions = [version for version, result in zip(range_versions, results) if not isinstance(result, ComponentLatestReleaseSummary)]
+        if not summaries:
+            return {"error": f"Failed to summarize {spec.name} versions {', '.join(failed_versions)}."}
+
+        return ComponentVersionRangeSummary(
+            component=spec.key,
+            fromVersion=from_version,
+            toVersion=to_version,
+            versions=[summary.latestVersion for summary in summaries],
+            failedVersions=failed_versions,
+            summaries=summaries,
+            **merge_range_sections(summaries, from_version, to_version)
+        )
+
+    # --------------------------------------------------------------
+    # Version retrieval methods
+    # --------------------------------------------------------------
+
+    async def get_latest_version(self, component_key: str, priority: int = PRIORITY_INTERACTIVE):
+        """Get the latest version of a component, sharing one lookup between concurrent callers"""
+        spec = self.get_component(component_key)
+        with PHASE_DURATION_SECONDS.time(component=spec.key, phase="version"):
+            latest_version = await self._coalesce(
+                (spec.key, "version"),
+                lambda _on_section_delta, call_priority: self._fetch_latest_version(spec, call_priority),
+                priority=priority
+            )
+        if isinstance(latest_version, str):
+            self._known_versions[spec.key] = latest_version
+        else:
+            PHASE_ERRORS_TOTAL.inc(component=spec.key, phase="version")
+        return latest_version
+
+    async def _discover_version(self, spec: ComponentSpec) -> Optional[str]:
+        """Read the latest version from the component's docs table, or None when unavailable"""
+        if spec.version_source != VERSION_SOURCE_DOCS_TABLE or self.version_discovery is None:
+            return None
+        discovered_version = await self.version_discovery.latest_version(spec.docs_url)
+        if discovered_version:
+            logger.info("Discovered latest %s version %s from docs table", spec.name, discovered_version)
+            self._known_versions[spec.key] = discovered_version
+        return discovered_version
+
+    async def _fetch_latest_version(self, spec: ComponentSpec, priority: Union[int, CallPriority] = PRIORITY_INTERACTIVE):
+        """Read the latest version from the docs table, falling back to OpenAI"""
+        discovered_version = await self._discover_version(spec)
+        if discovered_version:
+            return discovered_version
+
+        if not self.openai_client:
+            return {"error": "OpenAI API key not configured."}
+
+        try:
+            version_prompt = spec.version_prompt()
+            log_llm_payload(logger, "Sending version prompt to OpenAI", version_prompt, spec.key, "version")
+
+            version_response = await self.llm_scheduler.run(
+                lambda: self.openai_client.responses.parse(
+                    model="gpt-4o",  # Use gpt-4o instead of gpt-4.1
+                    input=version_prompt,
+                    tools=[{"type": "web_search_preview"}],
+                    text_format=ComponentLatestReleaseVersion,
+                    max_output_tokens=VERSION_MAX_OUTPUT_TOKENS
+                ),
+                estimated_tokens=count_tokens(version_prompt) + VERSION_MAX_OUTPUT_TOKENS,
+                priority=priority
+            )
+            result = version_response.output_parsed
+            if result is None:
+                return {"error": f"Failed to extract the latest {spec.name} version."}
+
+            log_llm_payload(logger, "Received version from OpenAI", result, spec.key, "version")
+            return result.version
+
+        except TokenBudgetExceeded as e:
+            known_version = self._known_versions.get(spec.key)
+            if known_version is None:
+                return {"error": str(e)}
+            logger.warning("%s Serving last known %s version %s", e, spec.name, known_version)
+            return known_version
+        except Exception as e:
+            return {"error": str(e)}
+
+    # --------------------------------------------------------------
+    # Release summary methods
+    # --------------------------------------------------------------
+
+    async def get_release_summary(
+        self,
+        component_key: str,
+        version: str,
+        on_section_delta: Optional[Callable[[str, str], None]] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ):
+        """Get the summary for a component version from cache or OpenAI, streaming sections if requested"""
+        spec = self.get_component(component_key)
+        with PHASE_DURATION_SECONDS.time(component=spec.key, phase="summary"):
+            cached_summary = self._get_cached_summary(spec, version)
+            if cached_summary is not None:
+                return cached_summary
+
+            summary_result = await self._coalesce(
+                (spec.key, "summary", version),
+                lambda shared_on_section_delta, call_priority: self._generate_release_summary(
+                    spec, version, shared_on_section_delta, call_priority
+                ),
+                on_section_delta,
+                priority
+            )
+        if isinstance(summary_result, dict):
+            PHASE_ERRORS_TOTAL.inc(component=spec.key, phase="summary")
+        return summary_result
+
+    def _get_cached_summary(self, spec: ComponentSpec, version: str) -> Optional[ComponentLatestReleaseSummary]:
+        """Return the cached summary for a component version, if any"""
+        if self.summary_cache is None:
+            return None
+        cached_summary = self.summary_cache.get(summary_cache_key(spec.key, version, spec.summary_prompt))
+        if cached_summary is not None:
+            logger.info("Serving cached %s summary for version %s", spec.name, version)
+        return cached_summary
+
+    async def _remember_summary(self, spec: ComponentSpec, summary: ComponentLatestReleaseSummary) -> None:
+        """Cache a generated summary and add its sections to the search index"""
+        self._latest_summaries[spec.key] = summary
+        if self.summary_cache is not None:
+            self.summary_cache.set(summary_cache_key(spec.key, summary.latestVersion, spec.summary_prompt), summary)
+        if self.search_index is not None:
+            try:
+                await self.search_index.add_summary(spec.key, summary)
+            except Exception as e:
+                logger.warning("Failed to index %s summary for version %s: %s", spec.name, summary.latestVersion, e)
+
+    async def _generate_release_summary(
+        self,
+        spec: ComponentSpec,
+        version: str,
+        on_section_delta: Optional[Callable[[str, str], None]] = None,
+        priority: Union[int, CallPriority] = PRIORITY_INTERACTIVE
+    ):
+        """Generate the summary for a component version with OpenAI and cache it"""
+        if not self.openai_client:
+            return {"error": "OpenAI API key not configured."}
+
+        try:
+            summary_prompt = spec.summary_prompt(version)
+            use_web_search = True
+
+            # Summarize the stored page text instead of browsing when the corpus has the page
+            page = await self.corpus.get_version_page(spec.docs_url, version) if self.corpus is not None else None
+            if page is not None:
+                prompt_hash = prompt_template_hash(spec.summary_prompt)
+                stored_summary = await self.corpus.load_summary(page.content_hash, prompt_hash)
+                if stored_summary is not None:
+                    logger.info("Serving stored %s summary for unchanged version %s page", spec.name, version)
+                    result = ComponentLatestReleaseSummary(**stored_summary)
+                    await self._remember_summary(spec, result)
+                    return result
+                use_web_search = False
+
+            if page is not None and len(page.text) > self.chunk_max_chars:
+                # Long pages are summarized part by part and merged
+                result = await self._summarize_page_chunks(spec, version, page.text, priority)
+                if on_section_delta and result is not None:
+                    for field in SECTION_PLACEHOLDERS:
+                        on_section_delta(field, getattr(result, field))
+            else:
+                if page is not None:
+                    summary_prompt = get_corpus_summary_prompt(summary_prompt, page.text)
+                log_llm_payload(logger, "Sending summary prompt to OpenAI", summary_prompt, spec.key, "summary")
+                estimated_tokens = self._estimate_summary_tokens(summary_prompt)
+
+                if on_section_delta:
+                    # Streams are not retried: sections already forwarded cannot be taken back
+                    summary_response = await self.llm_scheduler.run(
+                        lambda: stream_release_summary(
+                            self.openai_client, summary_prompt, on_section_delta, use_web_search,
+                            **self._summary_request_options()
+                        ),
+                        estimated_tokens=estimated_tokens,
+                        priority=priority,
+                        max_retries=0
+                    )
+                else:
+                    summary_response = await self.llm_scheduler.run(
+                        lambda: self.openai_client.responses.parse(
+                            model="gpt-4o",  # Use gpt-4o instead of gpt-4.1 for better web access
+                            input=summary_prompt,
+                            text_format=ComponentLatestReleaseSummary,
+                            **get_search_tools(use_web_search),
+                            **self._summary_request_options()
+                        ),
+                        estimated_tokens=estimated_tokens,
+                        priority=priority
+                    )
+                result = summary_response.output_parsed
+                log_llm_payload(logger, "Received summary from OpenAI", result, spec.key, "summary")
+
+            if result is None:
+                return {"error": "Failed to get summary from OpenAI."}
+
+            # Ensure latestVersion is set
+            result.latestVersion = version
+            await self._remember_summary(spec, result)
+            if page is not None:
+                await self.corpus.store_summary(page.content_hash, prompt_hash, result.model_dump())
+            return result
+
+        except TokenBudgetExceeded as e:
+            return self._latest_summary_or_error(spec, version, e)
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _latest_summary_or_error(self, spec: ComponentSpec, version: Optional[str], error: TokenBudgetExceeded):
+        """The last summary generated for a component, if it is for the requested version, once the token budget refuses new calls"""
+        latest_summary = self._latest_summaries.get(spec.key)
+        if latest_summary is None or latest_summary.latestVersion != version:
+            return {"error": str(error)}
+        logger.warning("%s Serving last %s summary for version %s", error, spec.name, latest_summary.latestVersion)
+        return latest_summary
+
+    async def _summarize_page_chunks(
+        self,
+        spec: ComponentSpec,
+        version: str,
+        page_text: str,
+        priority: Union[int, CallPriority] = PRIORITY_INTERACTIVE
+    ) -> Optional[ComponentLatestReleaseSummary]:
+        """Summarize a long page in heading-aligned chunks in parallel and merge the results in page order"""
+        chunks = split_into_chunks(page_text, self.chunk_max_chars)
+        summary_prompt = spec.summary_prompt(version)
+        logger.info("Summarizing %s version %s page in %d chunks", spec.name, version, len(chunks))
+        semaphore = asyncio.Semaphore(self.chunk_parallelism)
+
+        async def summarize_chunk(chunk_number: int, chunk_text: str):
+            chunk_prompt = get_chunk_summary_prompt(summary_prompt, chunk_text, chunk_number, len(chunks))
+            async with semaphore:
+                chunk_response = await self.llm_scheduler.run(
+                    lambda: self.openai_client.responses.parse(
+                        model="gpt-4o",
+                        input=chunk_prompt,
+                        text_format=ComponentLatestReleaseSummary,
+                        **self._summary_request_options(CHUNK_MAX_OUTPUT_TOKENS)
+                    ),
+                    estimated_tokens=self._estimate_summary_tokens(chunk_prompt, CHUNK_MAX_OUTPUT_TOKENS),
+                    priority=priority
+                )
+            return chunk_response.output_parsed
+
+        chunk_summaries = await asyncio.gather(
+            *(summarize_chunk(chunk_number, chunk_text) for chunk_number, chunk_text in enumerate(chunks, start=1))
+        )
+        # Every part must be covered; a partial merge would silently drop release notes
+        if any(chunk_summary is None for chunk_summary in chunk_summaries):
+            return None
+        return merge_chunk_summaries(chunk_summaries, version)
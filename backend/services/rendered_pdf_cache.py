@@ -0,0 +1,80 @@
+# Size-bounded in-memory cache of rendered PDF documents
+
+# --------------------------------------------------------------
+# Import dependencies for PDF caching
+# --------------------------------------------------------------
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Optional
+
+# --------------------------------------------------------------
+# Define helpers for content-hash keys
+# --------------------------------------------------------------
+
+
+def content_etag(payload) -> str:
+    """Strong ETag derived from the canonical JSON of a request payload"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return '"' + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header lists etag (or *), ignoring weak validators"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+# --------------------------------------------------------------
+# Define LRU cache bounded by total size in bytes
+# --------------------------------------------------------------
+
+
+class RenderedPdfCache:
+    """LRU cache of PDF bytes keyed by content hash, evicting once the total size exceeds max_bytes"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """Initialize with the maximum total size of cached documents"""
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached PDF bytes and mark them recently used"""
+        pdf_bytes = self._entries.get(key)
+        if pdf_bytes is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return pdf_bytes
+
+    def set(self, key: str, pdf_bytes: bytes) -> None:
+        """Store PDF bytes, evicting least recently used documents to stay within max_bytes"""
+        if len(pdf_bytes) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= len(previous)
+        self._entries[key] = pdf_bytes
+        self.total_bytes += len(pdf_bytes)
+        while self.total_bytes > self.max_bytes:
+            _key, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Entry count, size and hit/miss counters for diagnostics"""
+        return {
+            "entries": len(self._entries),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,221 @@
+# Opt-in sampled request profiling with stored flame profiles
+
+# --------------------------------------------------------------
+# Import dependencies for request profiling
+# --------------------------------------------------------------
+
+import asyncio
+import hmac
+import json
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# --------------------------------------------------------------
+# Configure logging and profile file layout
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# Each profile is stored as <id>.json (metadata), <id>.html and <id>.speedscope.json
+PROFILE_FORMATS = {
+    "html": (".html", "text/html"),
+    "speedscope": (".speedscope.json", "application/json"),
+}
+PROFILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# --------------------------------------------------------------
+# Define request profiler
+# --------------------------------------------------------------
+
+
+class RequestProfiler:
+    """Profiles a sample of requests, or those carrying the trigger header, with pyinstrument.
+
+    pyinstrument samples the wall-clock stack in async mode, so time spent
+    awaiting OpenAI or a PDF worker shows up as an await in the handler
+    that waited, next to CPU time in pydantic parsing, JSON assembly or
+    rendering. Only the newest max_profiles are kept.
+
+    Profiles contain stack contents, so reading them and the trigger header
+    require the admin token; without a token both stay closed.
+    """
+
+    def __init__(
+        self,
+        profile_dir: str,
+        sample_rate: float = 0.0,
+        header_name: str = "X-Profile-Request",
+        max_profiles: int = 50,
+        interval_seconds: float = 0.001,
+        admin_token: Optional[str] = None,
+        header_enabled: bool = False
+    ):
+        """Initialize with the profile directory, sampling rate, trigger header, retention and admin token"""
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+        self.header_name = header_name
+        self.admin_token = admin_token or None
+        self.header_enabled = header_enabled
+        self.max_profiles = max(1, max_profiles)
+        self.interval_seconds = interval_seconds
+        self.profiled = 0
+
+    def is_authorized(self, token: Optional[str]) -> bool:
+        """True when token is the admin token; always False when no admin token is configured"""
+        if self.admin_token is None or not token:
+            return False
+        return hmac.compare_digest(token.encode("utf-8"), self.admin_token.encode("utf-8"))
+
+    def is_header_triggered(self, headers: Headers) -> bool:
+        """True when the trigger header is enabled and carries the admin token"""
+        return self.header_enabled and self.is_authorized(headers.get(self.header_name))
+
+    def should_profile(self, headers: Headers) -> bool:
+        """Profile requests carrying the trigger header and a random sample of the rest"""
+        if self.is_header_triggered(headers):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def list_profiles(self) -> list:
+        """Metadata of the stored profiles, newest first"""
+        profiles = []
+        try:
+            names = os.listdir(self.profile_dir)
+        except FileNotFoundError:
+            return []
+        for name in names:
+            if not name.endswith(".json") or name.endswith(".speedscope.json"):
+                continue
+            try:
+                with open(os.path.join(self.profile_dir, name), encoding="utf-8") as file:
+                    profiles.append(json.load(file))
+            except (OSError, ValueError):
+                continue
+        return sorted(profiles, key=lambda profile: profile["created_at"], reverse=True)
+
+    def get_profile_path(self, profile_id: str, profile_format: str = "html") -> Optional[str]:
+        """Path of a stored profile file, or None if the id or format is unknown"""
+        if profile_format not in PROFILE_FORMATS or not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = os.path.join(self.profile_dir, profile_id + PROFILE_FORMATS[profile_format][0])
+        return path if os.path.isfile(path) else None
+
+    def stats(self) -> dict:
+        """Sampling settings and the number of profiles written since startup"""
+        return {
+            "sample_rate": self.sample_rate,
+            "header": self.header_name if self.header_enabled else None,
+            "max_profiles": self.max_profiles,
+            "profiled": self.profiled,
+        }
+
+    # --------------------------------------------------------------
+    # Storage methods
+    # --------------------------------------------------------------
+
+    def new_profile_id(self, path: str) -> str:
+        """Unique id starting with a UTC timestamp, so ids sort by age"""
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", path).strip("-") or "root"
+        return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')}-{slug[:60]}-{uuid.uuid4().hex[:8]}"
+
+    async def store(self, profiler, metadata: dict) -> None:
+        """Write the profile without blocking the event loop"""
+        try:
+            await asyncio.to_thread(self._write_profile, profiler, metadata)
+            self.profiled += 1
+        except Exception as e:
+            logger.warning("Failed to store profile %s: %s", metadata["id"], e)
+
+    def _write_profile(self, profiler, metadata: dict) -> None:
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base_path = os.path.join(self.profile_dir, metadata["id"])
+        with open(base_path + ".html", "w", encoding="utf-8") as file:
+            file.write(profiler.output_html())
+        with open(base_path + ".speedscope.json", "w", encoding="utf-8") as file:
+            file.write(profiler.output(renderer=SpeedscopeRenderer()))
+        # Metadata last: a profile is listed only once all of its files exist
+        with open(base_path + ".json", "w", encoding="utf-8") as file:
+            json.dump(metadata, file)
+        self._rotate()
+
+    def _rotate(self) -> None:
+        """Delete the oldest profiles beyond max_profiles"""
+        metadata_names = sorted(
+            name for name in os.listdir(self.profile_dir)
+            if name.endswith(".json") and not name.endswith(".speedscope.json")
+        )
+        for name in metadata_names[:-self.max_profiles]:
+            profile_id = name[:-len(".json")]
+            for suffix in [".json"] + [suffix for suffix, _ in PROFILE_FORMATS.values()]:
+                try:
+                    os.remove(os.path.join(self.profile_dir, profile_id + suffix))
+                except FileNotFoundError:
+                    pass
+
+# --------------------------------------------------------------
+# Define ASGI middleware
+# --------------------------------------------------------------
+
+
+class RequestProfilingMiddleware:
+    """ASGI middleware running selected requests under the profiler.
+
+    A plain ASGI middleware rather than an http middleware: the profile
+    spans the whole response, including streamed bodies, in one task, and
+    unprofiled requests only pay for the sampling check.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.should_profile(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+
+        # Imported on first profiled request so the dependency costs nothing when unused
+        from pyinstrument import Profiler
+
+        profile_id = self.profiler.new_profile_id(scope["path"])
+        status_code = 500
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode("ascii"))]
+            await send(message)
+
+        profiler = Profiler(interval=self.profiler.interval_seconds, async_mode="enabled")
+        started_at = datetime.now(timezone.utc)
+        cpu_started = time.process_time()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            session = profiler.stop()
+            # process_time covers the whole process, so concurrent requests add to it
+            cpu_seconds = time.process_time() - cpu_started
+            await self.profiler.store(profiler, {
+                "id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "trigger": "header" if self.profiler.is_header_triggered(Headers(scope=scope)) else "sample",
+                "created_at": started_at.isoformat(timespec="milliseconds"),
+                "wall_seconds": round(session.duration, 4),
+                "cpu_seconds": round(cpu_seconds, 4),
+                "sampled_cpu_seconds": round(session.cpu_time, 4),
+            })
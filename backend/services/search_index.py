@@ -0,0 +1,181 @@
+# Semantic search index over generated release summary sections
+
+# --------------------------------------------------------------
+# Import dependencies for embedding and similarity search
+# --------------------------------------------------------------
+
+import logging
+import math
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .version_range import is_empty_section
+
+# numpy and the OpenAI SDK load on first use so they stay off the startup path
+if TYPE_CHECKING:
+    import numpy as np
+    import openai
+
+# --------------------------------------------------------------
+# Configure logging and indexed sections
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# Summary fields indexed as separate documents
+INDEXED_SECTIONS = ("breaking_changes", "announcements", "technology_support", "new_features", "resolved_issues")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[._-][a-z0-9]+)*")
+
+# --------------------------------------------------------------
+# Define embedders
+# --------------------------------------------------------------
+
+
+def normalize_rows(vectors: "np.ndarray") -> "np.ndarray":
+    """Scale each row to unit length so dot products are cosine similarities"""
+    import numpy as np
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class HashingEmbedder:
+    """Local embedder hashing words and word pairs into a fixed-size TF vector.
+
+    Needs no model or network, so search works offline; similar wording
+    ("memory leak" in a question and a resolved issue) lands in the same buckets.
+    """
+
+    def __init__(self, dimensions: int = 1024):
+        """Initialize with the vector size"""
+        self.dimensions = dimensions
+
+    def tokenize(self, text: str) -> list:
+        """Lowercase words plus adjacent word pairs"""
+        words = TOKEN_PATTERN.findall(text.lower())
+        return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+    async def embed(self, texts: list) -> "np.ndarray":
+        """Embed texts as unit-length rows of a float32 matrix"""
+        import numpy as np
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token, count in Counter(self.tokenize(text)).items():
+                # crc32 is stable across processes, unlike hash()
+                bucket = zlib.crc32(token.encode("utf-8"))
+                sign = 1.0 if bucket & 0x80000000 else -1.0
+                vectors[row, bucket % self.dimensions] += sign * (1.0 + math.log(count))
+        return normalize_rows(vectors)
+
+
+class OpenAIEmbedder:
+    """Embedder backed by the OpenAI embeddings API"""
+
+    def __init__(self, openai_client: "openai.AsyncOpenAI", model: str = "text-embedding-3-small"):
+        """Initialize with the shared async OpenAI client and an embedding model"""
+        self.openai_client = openai_client
+        self.model = model
+
+    async def embed(self, texts: list) -> "np.ndarray":
+        """Embed texts in one API request as unit-length rows of a float32 matrix"""
+        import numpy as np
+        response = await self.openai_client.embeddings.create(model=self.model, input=texts)
+        vectors = np.array([item.embedding for item in response.data], dtype=np.float32)
+        return normalize_rows(vectors)
+
+# --------------------------------------------------------------
+# Define incremental similarity index
+# --------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class IndexedSection:
+    """One summary section stored in the index"""
+    component: str
+    version: str
+    section: str
+    text: str
+
+
+class SearchIndex:
+    """In-memory vector index over summary sections with incremental updates.
+
+    Embeddings live in one preallocated float32 matrix that grows by
+    doubling; a query is scored against every row with a single
+    matrix-vector product.
+    """
+
+    def __init__(self, embedder, initial_capacity: int = 256):
+        """Initialize with an embedder (anything with an async embed(texts) method)"""
+        self.embedder = embedder
+        self._vectors: Optional["np.ndarray"] = None
+        self._initial_capacity = initial_capacity
+        self._sections = []
+        self._rows = {}
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    async def add_summary(self, component: str, summary) -> None:
+        """Index the sections of a summary, replacing sections indexed for the same version"""
+        sections = [
+            IndexedSection(component, summary.latestVersion, field, getattr(summary, field).strip())
+            for field in INDEXED_SECTIONS
+            if not is_empty_section(getattr(summary, field, ""))
+        ]
+        if not sections:
+            return
+
+        vectors = await self.embedder.embed([f"{section.section.replace('_', ' ')}: {section.text}" for section in sections])
+        for section, vector in zip(sections, vectors):
+            key = (section.component, section.version, section.section)
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._sections)
+                self._ensure_capacity(row + 1, vector.shape[0])
+                self._sections.append(section)
+                self._rows[key] = row
+            else:
+                self._sections[row] = section
+            self._vectors[row] = vector
+
+    async def search(self, query: str, limit: int = 10, component: Optional[str] = None) -> list:
+        """Return the sections most similar to query, best first"""
+        if not self._sections or limit <= 0:
+            return []
+
+        import numpy as np
+        query_vector = (await self.embedder.embed([query]))[0]
+        scores = self._vectors[:len(self._sections)] @ query_vector
+        if component is not None:
+            mask = np.array([section.component == component for section in self._sections])
+            scores = np.where(mask, scores, -np.inf)
+
+        limit = min(limit, len(self._sections))
+        top_rows = np.argpartition(-scores, limit - 1)[:limit]
+        top_rows = top_rows[np.argsort(-scores[top_rows])]
+        return [
+            {
+                "component": self._sections[row].component,
+                "version": self._sections[row].version,
+                "section": self._sections[row].section,
+                "text": self._sections[row].text,
+                "score": round(float(scores[row]), 4),
+            }
+            for row in top_rows
+            # Unrelated sections (and those filtered out by component) score zero or less
+            if scores[row] > 0
+        ]
+
+    def _ensure_capacity(self, rows: int, dimensions: int) -> None:
+        """Grow the embedding matrix by doubling so appends stay amortized O(1)"""
+        import numpy as np
+        if self._vectors is None:
+            self._vectors = np.zeros((max(self._initial_capacity, rows), dimensions), dtype=np.float32)
+        elif rows > self._vectors.shape[0]:
+            grown = np.zeros((max(rows, 2 * self._vectors.shape[0]), dimensions), dtype=np.float32)
+            grown[:self._vectors.shape[0]] = self._vectors
+            self._vectors = grown
@@ -0,0 +1,54 @@
+# Single-flight coalescing of concurrent identical async calls
+
+# --------------------------------------------------------------
+# Import dependencies for request coalescing
+# --------------------------------------------------------------
+
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+# --------------------------------------------------------------
+# Define single-flight group shared by the processors
+# --------------------------------------------------------------
+
+
+class SingleFlight:
+    """Run at most one in-flight call per key and share its outcome.
+
+    Concurrent callers for a key that is already running await the same
+    task and receive its result or exception. The key is released once the
+    call finishes, so later callers start a fresh call.
+    """
+
+    def __init__(self):
+        """Initialize with no in-flight calls"""
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable]):
+        """Await call() for key, joining an identical in-flight call if present"""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _task: self._release(key, _task))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        # Shield the shared task so one cancelled caller does not cancel it
+        # for everyone else waiting on the same key
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished call so the next caller starts a new one"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Number of calls currently running"""
+        return len(self._in_flight)
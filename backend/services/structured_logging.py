@@ -0,0 +1,167 @@
+# Structured JSON logging written off the event loop, with request correlation IDs
+
+# --------------------------------------------------------------
+# Import dependencies for structured logging
+# --------------------------------------------------------------
+
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# --------------------------------------------------------------
+# Configure correlation state and prompt logging limits
+# --------------------------------------------------------------
+
+# Set per HTTP request; tasks spawned while handling it inherit the value
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Attributes every LogRecord has; anything else was passed with extra=
+STANDARD_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+
+class PromptLogSettings:
+    """Limits for logging prompt and response text, set by configure_logging"""
+    max_chars = 500
+    sample_rate = 0.1
+
+# --------------------------------------------------------------
+# Define formatter, filter and setup
+# --------------------------------------------------------------
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request ID while still in the caller's context, before they are queued"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, request ID and any extra= fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for name, value in vars(record).items():
+            if name not in STANDARD_RECORD_ATTRIBUTES:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_output: bool = True,
+    prompt_max_chars: int = 500,
+    prompt_sample_rate: float = 0.1
+) -> logging.handlers.QueueListener:
+    """Route root logging through a queue so stream writes happen on a background thread.
+
+    Returns the started listener; stop it on shutdown to flush queued records.
+    """
+    PromptLogSettings.max_chars = max(0, prompt_max_chars)
+    PromptLogSettings.sample_rate = prompt_sample_rate
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        JsonFormatter() if json_output
+        else logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s")
+    )
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level.upper())
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+# --------------------------------------------------------------
+# Define prompt and response logging helpers
+# --------------------------------------------------------------
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """At most max_chars of text, noting how much was cut"""
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... [{len(text) - max_chars} more chars]"
+
+
+def log_llm_payload(logger: logging.Logger, message: str, payload, component: Optional[str] = None, phase: Optional[str] = None) -> None:
+    """Log an LLM prompt or response: always its size, and a capped excerpt for a sample of calls.
+
+    The cost does not depend on the payload size: the text is only
+    rendered for sampled calls, and then only up to max_chars.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    fields = {"phase": phase} if phase else {}
+    if component:
+        fields["component"] = component
+        # Shared by the version and summary phases of one component in one request
+        fields["correlation_id"] = f"{request_id_var.get() or 'background'}:{component}"
+    if isinstance(payload, str):
+        fields["chars"] = len(payload)
+
+    if PromptLogSettings.max_chars and random.random() < PromptLogSettings.sample_rate:
+        text = payload if isinstance(payload, str) else repr(payload)
+        fields["excerpt"] = truncate_text(text, PromptLogSettings.max_chars)
+
+    logger.info(message, extra=fields)
+
+# --------------------------------------------------------------
+# Define ASGI middleware assigning request IDs
+# --------------------------------------------------------------
+
+
+class RequestIdMiddleware:
+    """Use the caller's X-Request-ID or a new one for each request, and echo it on the response"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = (Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid.uuid4().hex[:16])[:64]
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,95 @@
+# In-memory cache for generated component release summaries
+
+# --------------------------------------------------------------
+# Import dependencies for summary caching
+# --------------------------------------------------------------
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Hashable, Optional
+
+from .prompts.summary_instructions import SUMMARY_SYSTEM_PROMPT
+
+# --------------------------------------------------------------
+# Define helpers for building cache keys
+# --------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def prompt_template_hash(prompt_builder: Callable[[str], str]) -> str:
+    """Return a stable hash of a summary prompt template and the shared summary instructions.
+
+    The template is rendered with a placeholder version so the hash only
+    changes when the prompt wording changes, not when the version does.
+    """
+    template = prompt_builder("{version}")
+    return hashlib.sha256(f"{SUMMARY_SYSTEM_PROMPT}\n{template}".encode("utf-8")).hexdigest()[:16]
+
+
+def summary_cache_key(component: str, version: str, prompt_builder: Callable[[str], str]) -> tuple:
+    """Build the (component, version, prompt template hash) cache key"""
+    return (component, version, prompt_template_hash(prompt_builder))
+
+# --------------------------------------------------------------
+# Define bounded LRU cache with TTL expiry and hit/miss counters
+# --------------------------------------------------------------
+
+
+class SummaryCache:
+    """Bounded LRU cache with per-entry TTL for release summaries"""
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: Optional[float] = 86400.0):
+        """Initialize with a maximum size and a TTL (None or 0 disables expiry)"""
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds or None
+        self._entries: "OrderedDict[Hashable, tuple[float, object]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        """Return the cached value for key, or None on miss or expiry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, value = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters for diagnostics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,90 @@
+# Markdown, HTML and JSON exports of release news that do not need reportlab
+
+# --------------------------------------------------------------
+# Import dependencies for lightweight exports
+# --------------------------------------------------------------
+
+import html
+import json
+from datetime import datetime
+from typing import Optional
+
+from .summary_text import strip_emoji_for_export, bold_to_markup
+
+# --------------------------------------------------------------
+# Define export formats
+# --------------------------------------------------------------
+
+EXPORT_TITLE = "Dynatrace Release Notes Summary"
+
+HTML_STYLE = (
+    "body{font-family:Helvetica,Arial,sans-serif;max-width:860px;margin:2rem auto;color:#222;line-height:1.5}"
+    "h1{color:#1496FF}h2{color:#1a3a6b;margin-top:2rem}.generated{color:#666}"
+)
+
+# --------------------------------------------------------------
+# Define renderers
+# --------------------------------------------------------------
+
+
+def component_title(item: dict) -> str:
+    """Component name with its version, as used by the PDF headings"""
+    title = item.get('component', '')
+    if item.get('version'):
+        title += f" - Version {item['version']}"
+    return title
+
+
+def generated_on(now: Optional[datetime] = None) -> str:
+    """Generation date in the format used by the PDF"""
+    return (now or datetime.now()).strftime('%B %d, %Y at %H:%M')
+
+
+def render_markdown(release_news: list, now: Optional[datetime] = None) -> str:
+    """Render release news as Markdown for Confluence, Slack or a README"""
+    parts = [f"# {EXPORT_TITLE}", f"_Generated on: {generated_on(now)}_"]
+    for item in release_news:
+        parts.append(f"## {component_title(item)}")
+        parts.append(strip_emoji_for_export(item.get('summary', '')).strip())
+    return "\n\n".join(parts) + "\n"
+
+
+def render_html(release_news: list, now: Optional[datetime] = None) -> str:
+    """Render release news as a standalone HTML document"""
+    sections = []
+    for item in release_news:
+        summary = bold_to_markup(html.escape(strip_emoji_for_export(item.get('summary', '')).strip()))
+        paragraphs = "".join(f"<p>{paragraph.replace(chr(10), '<br/>')}</p>" for paragraph in summary.split("\n\n"))
+        sections.append(f"<section><h2>{html.escape(component_title(item))}</h2>{paragraphs}</section>")
+
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        f"<title>{EXPORT_TITLE}</title><style>{HTML_STYLE}</style></head><body>"
+        f"<h1>{EXPORT_TITLE}</h1><p class=\"generated\">Generated on: {generated_on(now)}</p>"
+        + "".join(sections)
+        + "</body></html>"
+    )
+
+
+def render_json(release_news: list, now: Optional[datetime] = None) -> str:
+    """Render release news as a JSON bundle with emoji-free Markdown summaries"""
+    return json.dumps({
+        "title": EXPORT_TITLE,
+        "generatedAt": (now or datetime.now()).isoformat(timespec="seconds"),
+        "components": [
+            {
+                "component": item.get('component', ''),
+                "version": item.get('version', ''),
+                "summary": strip_emoji_for_export(item.get('summary', '')).strip(),
+            }
+            for item in release_news
+        ],
+    }, ensure_ascii=False, indent=2)
+
+
+# Format name -> (renderer, media type, file extension)
+EXPORT_FORMATS = {
+    "markdown": (render_markdown, "text/markdown", "md"),
+    "html": (render_html, "text/html", "html"),
+    "json": (render_json, "application/json", "json"),
+}
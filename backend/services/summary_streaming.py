@@ -0,0 +1,191 @@
+# Token-level streaming of structured release summaries from OpenAI
+
+# --------------------------------------------------------------
+# Import dependencies for streaming summary generation
+# --------------------------------------------------------------
+
+import logging
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .data_models import ComponentLatestReleaseSummary
+
+if TYPE_CHECKING:
+    import openai
+
+# --------------------------------------------------------------
+# Configure logging for summary streaming
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+JSON_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+# --------------------------------------------------------------
+# Define incremental parser for partial structured output
+# --------------------------------------------------------------
+
+
+class SummarySectionStreamParser:
+    """Incrementally reads the streamed JSON object of a summary.
+
+    Structured output arrives as raw JSON text in arbitrary chunks. feed()
+    returns the decoded text added to each string field by a chunk, as
+    (field, text) pairs, so sections can be forwarded while the model is
+    still writing them.
+    """
+
+    def __init__(self):
+        """Initialize parser state before the opening brace"""
+        self._expecting = None  # "key" after "{" or ",", "value" after ":"
+        self._in_string = None  # "key" or "value" while inside a string literal
+        self._escape: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        self._key_chars: list = []
+        self._field: Optional[str] = None
+
+    def feed(self, chunk: str) -> list:
+        """Consume a chunk of JSON text and return the (field, text) deltas it contained"""
+        deltas = []
+        value_chars = []
+
+        def flush():
+            if value_chars and self._field is not None:
+                deltas.append((self._field, "".join(value_chars)))
+            value_chars.clear()
+
+        for char in chunk:
+            if self._in_string is None:
+                if char in "{,":
+                    self._expecting = "key"
+                elif char == ":":
+                    self._expecting = "value"
+                elif char == '"' and self._expecting is not None:
+                    self._in_string = self._expecting
+                    self._expecting = None
+                continue
+
+            if self._escape is not None:
+                decoded = self._decode_escape(char)
+                if decoded is None:
+                    continue
+            elif char == "\\":
+                self._escape = ""
+                continue
+            elif char == '"':
+                if self._in_string == "key":
+                    self._field = "".join(self._key_chars)
+                    self._key_chars = []
+                else:
+                    flush()
+                self._in_string = None
+                continue
+            else:
+                decoded = char
+
+            if self._in_string == "key":
+                self._key_chars.append(decoded)
+            else:
+                value_chars.append(decoded)
+
+        flush()
+        return deltas
+
+    def _decode_escape(self, char: str) -> Optional[str]:
+        """Decode one character of an escape sequence; None while the sequence is incomplete"""
+        if self._escape == "":
+            if char == "u":
+                self._escape = "u"
+                return None
+            self._escape = None
+            return JSON_ESCAPES.get(char, char)
+
+        self._escape += char
+        if len(self._escape) < 5:
+            return None
+
+        code_point = int(self._escape[1:], 16)
+        self._escape = None
+        if 0xD800 <= code_point < 0xDC00:
+            self._high_surrogate = code_point
+            return None
+        if 0xDC00 <= code_point < 0xE000 and self._high_surrogate is not None:
+            code_point = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code_point - 0xDC00)
+            self._high_surrogate = None
+        return chr(code_point)
+
+
+class SectionDeltaFanout:
+    """Forwards the section text of one streamed summary to every caller sharing it.
+
+    Callers that join mid-stream first receive the text generated so far.
+    """
+
+    def __init__(self):
+        """Initialize with no text and no subscribers"""
+        self._sections: dict[str, list] = {}
+        self._subscribers: list = []
+
+    def subscribe(self, on_section_delta: Callable[[str, str], None]) -> None:
+        """Replay the text generated so far to on_section_delta, then forward new text to it"""
+        for section, texts in self._sections.items():
+            on_section_delta(section, "".join(texts))
+        self._subscribers.append(on_section_delta)
+
+    def unsubscribe(self, on_section_delta: Callable[[str, str], None]) -> None:
+        """Stop forwarding text to a caller that finished or was cancelled"""
+        if on_section_delta in self._subscribers:
+            self._subscribers.remove(on_section_delta)
+
+    def publish(self, section: str, text: str) -> None:
+        """Record section text and forward it to every subscriber"""
+        self._sections.setdefault(section, []).append(text)
+        for on_section_delta in list(self._subscribers):
+            on_section_delta(section, text)
+
+# --------------------------------------------------------------
+# Define streaming summary request helper
+# --------------------------------------------------------------
+
+
+def get_search_tools(use_web_search: bool) -> dict:
+    """Request arguments enabling the web search tool, or none when the prompt carries the page text"""
+    return {"tools": [{"type": "web_search_preview"}]} if use_web_search else {}
+
+
+async def stream_release_summary(
+    openai_client: "openai.AsyncOpenAI",
+    summary_prompt: str,
+    on_section_delta: Callable[[str, str], None],
+    use_web_search: bool = True,
+    **request_options
+) -> "openai.types.responses.ParsedResponse":
+    """Stream a summary, forwarding section text as generated, and return the final response.
+
+    The final response carries the validated result in output_parsed and
+    the token usage the scheduler charges against its budgets.
+    """
+    parser = SummarySectionStreamParser()
+
+    async with openai_client.responses.stream(
+        model="gpt-4o",
+        input=summary_prompt,
+        text_format=ComponentLatestReleaseSummary,
+        **get_search_tools(use_web_search),
+        **request_options
+    ) as stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                for section, text in parser.feed(event.delta):
+                    on_section_delta(section, text)
+
+        # Validation into the pydantic model only happens on the complete output
+        return await stream.get_final_response()
@@ -0,0 +1,79 @@
+# Text cleaning shared by every release news export format
+
+# --------------------------------------------------------------
+# Import dependencies for summary text cleaning
+# --------------------------------------------------------------
+
+import re
+
+# --------------------------------------------------------------
+# Define cleaning patterns
+# --------------------------------------------------------------
+
+EMOJI_PATTERN = re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF🚨📢✨🔧🐛]')
+# Exports also drop the space after a marker; the PDF keeps it so its output is unchanged
+EXPORT_EMOJI_PATTERN = re.compile(EMOJI_PATTERN.pattern + ' ?')
+BOLD_PATTERN = re.compile(r'\*\*(.*?)\*\*')
+
+# Items the frontend adds to releaseNews that are not component summaries
+NON_SUMMARY_COMPONENTS = ('Error', 'Info')
+
+# Section titles and emoji used by the frontend cards, in display order
+SUMMARY_SECTIONS = (
+    ('breaking_changes', '🚨 Breaking Changes'),
+    ('announcements', '📢 Announcements'),
+    ('new_features', '✨ New Features'),
+    ('technology_support', '🔧 Technology Support'),
+    ('resolved_issues', '🐛 Resolved Issues'),
+)
+
+# --------------------------------------------------------------
+# Define cleaning and conversion helpers
+# --------------------------------------------------------------
+
+
+def strip_emoji(text: str) -> str:
+    """Remove the emoji used as section markers, as the PDF has always done"""
+    return EMOJI_PATTERN.sub('', text)
+
+
+def strip_emoji_for_export(text: str) -> str:
+    """Remove the emoji used as section markers, with the space that follows them"""
+    return EXPORT_EMOJI_PATTERN.sub('', text)
+
+
+def bold_to_markup(text: str) -> str:
+    """Convert markdown **bold** to <b>bold</b>"""
+    return BOLD_PATTERN.sub(r'<b>\1</b>', text)
+
+
+def line_breaks_to_markup(text: str) -> str:
+    """Convert newlines to <br/> tags"""
+    return text.replace('\n\n', '<br/><br/>').replace('\n', '<br/>')
+
+
+def filter_release_news(release_news: list) -> list:
+    """Keep only component summaries, dropping error/info items and empty summaries"""
+    return [
+        item for item in release_news
+        if item.get('component') not in NON_SUMMARY_COMPONENTS and (item.get('summary') or '').strip()
+    ]
+
+
+def release_news_from_summaries(release_summaries: dict, titles: dict) -> list:
+    """Convert summary endpoint results into releaseNews items, formatted like the frontend cards"""
+    release_news = []
+    for component_key, component_data in release_summaries.items():
+        if not component_data.get('latestVersion'):
+            continue
+        sections = [
+            f"**{title}:**\n{component_data[field]}"
+            for field, title in SUMMARY_SECTIONS
+            if (component_data.get(field) or '').strip()
+        ]
+        release_news.append({
+            'component': titles.get(component_key, component_key),
+            'version': component_data['latestVersion'],
+            'summary': '\n\n'.join(sections),
+        })
+    return release_news
@@ -0,0 +1,160 @@
+# Prompt token counting and a per-day token budget for OpenAI calls
+
+# --------------------------------------------------------------
+# Import dependencies for token budgeting
+# --------------------------------------------------------------
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+
+# --------------------------------------------------------------
+# Configure logging for token budgeting
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+# Tokenizer used by gpt-4o
+TOKEN_ENCODING = "o200k_base"
+
+# --------------------------------------------------------------
+# Define token counting
+# --------------------------------------------------------------
+
+_token_encoder = None
+_token_encoder_lock = threading.Lock()
+
+
+def get_token_encoder():
+    """The tiktoken encoder once load_token_encoder has loaded it, else None"""
+    return _token_encoder
+
+
+def load_token_encoder() -> bool:
+    """Load the tiktoken encoding, downloading it into TIKTOKEN_CACHE_DIR the first time.
+
+    Blocks on the download, so call it from a worker thread. Returns False
+    when loading failed or another thread is still loading, and True once
+    there is nothing left to retry: the encoder is loaded or tiktoken is
+    not installed. Failures are not remembered, so a later call tries again.
+    """
+    global _token_encoder
+    if not _token_encoder_lock.acquire(blocking=False):
+        return False
+    try:
+        if _token_encoder is not None:
+            return True
+        try:
+            import tiktoken
+        except ImportError:
+            logger.info("tiktoken is not installed, estimating token counts from text length")
+            return True
+        try:
+            _token_encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            logger.warning("Could not load the %s encoding (%s), estimating token counts for now", TOKEN_ENCODING, e)
+            return False
+        return True
+    finally:
+        _token_encoder_lock.release()
+
+
+async def load_token_encoder_with_retries(timeout_seconds: float = 30.0, retry_seconds: float = 30.0, max_attempts: int = 5) -> bool:
+    """Load the encoder in a worker thread, retrying failed or timed-out attempts with doubling delays"""
+    for attempt in range(max_attempts):
+        try:
+            if await asyncio.wait_for(asyncio.to_thread(load_token_encoder), timeout_seconds):
+                return get_token_encoder() is not None
+        except asyncio.TimeoutError:
+            # The download cannot be interrupted; a retry succeeds once it finishes
+            logger.warning("Loading the %s encoding is taking over %.0f s", TOKEN_ENCODING, timeout_seconds)
+        if attempt + 1 < max_attempts:
+            await asyncio.sleep(retry_seconds * 2 ** attempt)
+    logger.warning("Gave up loading the %s encoding after %d attempts, estimating token counts", TOKEN_ENCODING, max_attempts)
+    return False
+
+
+def count_tokens(text: str) -> int:
+    """Tokens in text: exact once the tiktoken encoder is loaded, otherwise about four characters per token"""
+    encoder = get_token_encoder()
+    if encoder is None:
+        return max(1, len(text) // 4)
+    return len(encoder.encode(text, disallowed_special=()))
+
+# --------------------------------------------------------------
+# Define daily token budget
+# --------------------------------------------------------------
+
+
+class TokenBudgetExceeded(Exception):
+    """Raised instead of starting an OpenAI call once the daily budget is nearly spent"""
+
+    def __init__(self, used_tokens: int, daily_tokens: int):
+        super().__init__(f"Daily token budget nearly exhausted ({used_tokens} of {daily_tokens} tokens used).")
+
+
+class TokenBudget:
+    """Tracks tokens spent per UTC day against a daily limit.
+
+    Each call reserves its estimate before it starts and settles it with
+    the usage OpenAI reports. New calls are refused once used plus
+    reserved tokens would pass near_limit_fraction of the limit; the rest
+    is headroom for calls whose actual usage exceeds their estimate.
+    """
+
+    def __init__(self, daily_tokens: int, near_limit_fraction: float = 0.9):
+        """Initialize with the daily token limit and the fraction at which new calls are refused"""
+        self.daily_tokens = daily_tokens
+        self.near_limit_fraction = near_limit_fraction
+        self._day = self._today()
+        self.used_tokens = 0
+        self.reserved_tokens = 0
+        self.refused = 0
+
+    def reserve(self, estimated_tokens: int) -> None:
+        """Reserve tokens for a call, raising TokenBudgetExceeded if that would pass the soft limit"""
+        self._roll_over()
+        if self.used_tokens + self.reserved_tokens + estimated_tokens > self.soft_limit:
+            self.refused += 1
+            raise TokenBudgetExceeded(self.used_tokens, self.daily_tokens)
+        self.reserved_tokens += estimated_tokens
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Release a reservation and charge the tokens the call actually used"""
+        self._roll_over()
+        self.reserved_tokens = max(0, self.reserved_tokens - estimated_tokens)
+        self.used_tokens += actual_tokens
+
+    def is_near_limit(self) -> bool:
+        """True once new calls are being refused for the rest of the day"""
+        self._roll_over()
+        return self.used_tokens + self.reserved_tokens >= self.soft_limit
+
+    @property
+    def soft_limit(self) -> float:
+        return self.daily_tokens * self.near_limit_fraction
+
+    def stats(self) -> dict:
+        """Today's usage against the limit and the number of refused calls"""
+        self._roll_over()
+        return {
+            "day": self._day.isoformat(),
+            "daily_tokens": self.daily_tokens,
+            "near_limit_fraction": self.near_limit_fraction,
+            "used_tokens": self.used_tokens,
+            "reserved_tokens": self.reserved_tokens,
+            "near_limit": self.is_near_limit(),
+            "refused": self.refused,
+        }
+
+    def _today(self):
+        return datetime.now(timezone.utc).date()
+
+    def _roll_over(self) -> None:
+        """Start a new day's budget at UTC midnight; reservations of running calls carry over"""
+        today = self._today()
+        if today != self._day:
+            logger.info("Token budget day %s closed with %d tokens used", self._day, self.used_tokens)
+            self._day = today
+            self.used_tokens = 0
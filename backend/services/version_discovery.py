@@ -0,0 +1,134 @@
+# Deterministic version discovery from Dynatrace "what's new" documentation pages
+
+# --------------------------------------------------------------
+# Import dependencies for fetching and parsing docs pages
+# --------------------------------------------------------------
+
+import logging
+import re
+from typing import Optional
+from urllib.parse import urljoin
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+# --------------------------------------------------------------
+# Configure logging for version discovery
+# --------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+VERSION_PATTERN = re.compile(r"\d+(?:\.\d+)+")
+
+# --------------------------------------------------------------
+# Define helpers for parsing and ordering versions
+# --------------------------------------------------------------
+
+
+def parse_version(text: str) -> Optional[str]:
+    """Return the first dotted version number found in text (e.g. "v1.305.49" -> "1.305.49")"""
+    match = VERSION_PATTERN.search(text or "")
+    return match.group(0) if match else None
+
+
+def version_key(version: str) -> tuple:
+    """Sort key that orders versions numerically per segment (1.10 > 1.9)"""
+    return tuple(int(part) for part in version.split("."))
+
+
+def sort_versions(versions: list, descending: bool = True) -> list:
+    """Return unique versions ordered semantically, newest first by default"""
+    return sorted(set(versions), key=version_key, reverse=descending)
+
+
+def iter_version_rows(html: str):
+    """Yield (version, row) for every row of the page's tables that has a version in its "version" column"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    for table in soup.find_all("table"):
+        rows = table.find_all("tr")
+        if not rows:
+            continue
+
+        # Locate the "version" column from the header row
+        header_cells = rows[0].find_all(["th", "td"])
+        column_index = next(
+            (index for index, cell in enumerate(header_cells) if "version" in cell.get_text(strip=True).lower()),
+            None
+        )
+        if column_index is None:
+            continue
+
+        for row in rows[1:]:
+            cells = row.find_all(["td", "th"])
+            if column_index >= len(cells):
+                continue
+            version = parse_version(cells[column_index].get_text(" ", strip=True))
+            if version:
+                yield version, row
+
+
+def extract_versions_from_html(html: str) -> list:
+    """Collect every version listed in the "version" column of the page's tables"""
+    return sort_versions([version for version, _row in iter_version_rows(html)])
+
+
+def extract_version_links_from_html(html: str, base_url: str) -> dict:
+    """Map each version in the page's version table to the release notes page linked from its row"""
+    links = {}
+    for version, row in iter_version_rows(html):
+        link = row.find("a", href=True)
+        if link and version not in links:
+            links[version] = urljoin(base_url, link["href"])
+    return links
+
+
+def latest_version_from_html(html: str) -> Optional[str]:
+    """Return the highest version found in the page's version table"""
+    versions = extract_versions_from_html(html)
+    return versions[0] if versions else None
+
+# --------------------------------------------------------------
+# Define service class for fetching versions over HTTP
+# --------------------------------------------------------------
+
+
+class VersionDiscovery:
+    """Fetches what's-new pages and reads component versions from their tables"""
+
+    def __init__(self, timeout_seconds: float = 10.0):
+        """Initialize with a request timeout"""
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session lazily inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def list_versions(self, url: str) -> list:
+        """Return every version listed on a what's-new page, newest first (empty on failure)"""
+        try:
+            session = await self._get_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                html = await response.text()
+        except Exception as e:
+            logger.warning("Version discovery failed for %s: %s", url, e)
+            return []
+
+        versions = extract_versions_from_html(html)
+        if not versions:
+            logger.warning("No version table found at %s", url)
+        return versions
+
+    async def latest_version(self, url: str) -> Optional[str]:
+        """Return the latest version on a what's-new page, or None so callers can fall back to the LLM"""
+        versions = await self.list_versions(url)
+        return versions[0] if versions else None
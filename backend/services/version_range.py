@@ -0,0 +1,64 @@
+# Merging per-version release summaries into one summary for a version range
+
+# --------------------------------------------------------------
+# Import dependencies for version range summaries
+# --------------------------------------------------------------
+
+from typing import Optional
+
+from .prompts.summary_instructions import SECTION_PLACEHOLDERS
+from .version_discovery import version_key
+
+# --------------------------------------------------------------
+# Define merge configuration
+# --------------------------------------------------------------
+
+# Sections merged across a range, with the placeholder used when no version reports anything
+MERGED_SECTIONS = {
+    "breaking_changes": "No breaking changes reported between {from_version} and {to_version}.",
+    "resolved_issues": "No resolved issues reported between {from_version} and {to_version}.",
+}
+
+# Statements the summary prompt asks for when a section is empty, lowercased without the final period
+EMPTY_SECTION_STATEMENTS = frozenset(placeholder.rstrip(".").lower() for placeholder in SECTION_PLACEHOLDERS.values())
+
+# --------------------------------------------------------------
+# Define helpers for selecting and merging versions
+# --------------------------------------------------------------
+
+
+def select_range_versions(versions: list, from_version: str, to_version: str) -> list:
+    """Versions after from_version up to and including to_version, oldest first.
+
+    Each version is compared at the precision of the bound, so a partial
+    bound like "1.305" stands for every 1.305.x release.
+    """
+    lower, upper = version_key(from_version), version_key(to_version)
+    return sorted(
+        (v for v in set(versions) if lower < version_key(v)[:len(lower)] and version_key(v)[:len(upper)] <= upper),
+        key=version_key
+    )
+
+
+def is_empty_section(text: Optional[str]) -> bool:
+    """True when a section holds nothing or exactly the prompt's "nothing reported" statement.
+
+    Case and a missing final period are tolerated, but not other wording, so
+    a real item such as "No longer supports Java 8" is kept.
+    """
+    stripped = (text or "").strip()
+    return not stripped or stripped.rstrip(".").lower() in EMPTY_SECTION_STATEMENTS
+
+
+def merge_range_sections(summaries: list, from_version: str, to_version: str) -> dict:
+    """Merge the breaking changes and resolved issues of per-version summaries (oldest first) by version"""
+    merged = {}
+    for field, placeholder in MERGED_SECTIONS.items():
+        parts = [
+            f"Version {summary.latestVersion}:\n{getattr(summary, field).strip()}"
+            for summary in summaries
+            if not is_empty_section(getattr(summary, field))
+        ]
+        merged[field] = "\n\n".join(parts) if parts else placeholder.format(from_version=from_version, to_version=to_version)
+    return merged
+
@@ -0,0 +1,138 @@
+# Tests for splitting long release notes pages into chunks and merging the chunk summaries
+
+# --------------------------------------------------------------
+# Import dependencies for the chunked summary tests
+# --------------------------------------------------------------
+
+import asyncio
+from types import SimpleNamespace
+
+from services.chunked_summary import merge_chunk_summaries, split_into_chunks, split_sections
+from services.data_models import ComponentLatestReleaseSummary
+from services.prompts.summary_instructions import SECTION_PLACEHOLDERS, SUMMARY_SYSTEM_PROMPT
+from services.release_notes_engine import ReleaseNotesEngine
+
+PAGE_TEXT = "\n".join([
+    "# OneAgent 1.305",
+    "Release date: January 27, 2025",
+    "## New features",
+    "Java 23 is now supported.",
+    "## Resolved issues",
+    "Fixed a memory leak in the Java agent.",
+])
+
+
+def make_summary(**sections) -> ComponentLatestReleaseSummary:
+    return ComponentLatestReleaseSummary(latestVersion="", **{**SECTION_PLACEHOLDERS, **sections})
+
+# --------------------------------------------------------------
+# Shared placeholders
+# --------------------------------------------------------------
+
+
+def test_prompt_asks_for_the_placeholders_used_by_the_merge():
+    for placeholder in SECTION_PLACEHOLDERS.values():
+        assert f'If none, write "{placeholder}"' in SUMMARY_SYSTEM_PROMPT
+
+# --------------------------------------------------------------
+# Chunk splitting
+# --------------------------------------------------------------
+
+
+def test_sections_start_at_headings():
+    assert split_sections(PAGE_TEXT) == [
+        "# OneAgent 1.305\nRelease date: January 27, 2025",
+        "## New features\nJava 23 is now supported.",
+        "## Resolved issues\nFixed a memory leak in the Java agent.",
+    ]
+
+
+def test_sections_are_packed_into_chunks_in_page_order():
+    chunks = split_into_chunks(PAGE_TEXT, max_chars=100)
+
+    assert chunks == [
+        "# OneAgent 1.305\nRelease date: January 27, 2025\n## New features\nJava 23 is now supported.",
+        "## Resolved issues\nFixed a memory leak in the Java agent.",
+    ]
+    assert "\n".join(chunks) == PAGE_TEXT
+    assert split_into_chunks(PAGE_TEXT, max_chars=len(PAGE_TEXT)) == [PAGE_TEXT]
+
+
+def test_oversized_sections_are_split_at_lines_with_their_heading_repeated():
+    section = "\n".join(["## Resolved issues"] + [f"Fixed issue number {number}." for number in range(1, 7)])
+    chunks = split_into_chunks(section, max_chars=60)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert chunks[0].startswith("## Resolved issues\nFixed issue number 1.")
+    assert all(chunk.startswith("## Resolved issues (continued)\n") for chunk in chunks[1:])
+    fixes = [line for chunk in chunks for line in chunk.splitlines() if line.startswith("Fixed")]
+    assert fixes == [f"Fixed issue number {number}." for number in range(1, 7)]
+
+
+def test_lines_longer_than_a_chunk_are_cut():
+    chunks = split_into_chunks("## New features\n" + "x" * 100, max_chars=40)
+    pieces = [line for chunk in chunks for line in chunk.splitlines() if line.startswith("x")]
+
+    # A heading always stays with content, so a chunk may pass max_chars by its heading
+    assert [len(piece) for piece in pieces] == [40, 40, 20]
+    assert chunks[1].startswith("## New features (continued)\n")
+
+
+def test_empty_page_has_no_chunks():
+    assert split_into_chunks("", max_chars=100) == []
+
+# --------------------------------------------------------------
+# Merging chunk summaries
+# --------------------------------------------------------------
+
+
+def test_chunk_summaries_are_merged_in_page_order_without_placeholders_or_repeats():
+    merged = merge_chunk_summaries([
+        make_summary(new_features="Java 23 is now supported.", announcements="OneAgent for AIX reaches end of life."),
+        make_summary(resolved_issues="Fixed a memory leak in the Java agent."),
+        make_summary(new_features="Go 1.23 is now supported.", announcements="OneAgent for AIX reaches end of life."),
+    ], "1.305.49")
+
+    assert merged.latestVersion == "1.305.49"
+    assert merged.new_features == "Java 23 is now supported.\n\nGo 1.23 is now supported."
+    assert merged.announcements == "OneAgent for AIX reaches end of life."
+    assert merged.resolved_issues == "Fixed a memory leak in the Java agent."
+    assert merged.breaking_changes == SECTION_PLACEHOLDERS["breaking_changes"]
+    assert merged.technology_support == SECTION_PLACEHOLDERS["technology_support"]
+
+
+class FakeResponses:
+    """Answers each chunk prompt with the chunk's headings as new features"""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def parse(self, input: str, **options):
+        self.prompts.append(input)
+        headings = [line.strip() for line in input.splitlines() if line.strip().startswith("## ")]
+        summary = make_summary(new_features=", ".join(headings)) if headings else None
+        return SimpleNamespace(output_parsed=summary, usage=None)
+
+
+def test_long_pages_are_summarized_per_chunk_and_merged():
+    responses = FakeResponses()
+    engine = ReleaseNotesEngine(SimpleNamespace(responses=responses), chunk_max_chars=100)
+    spec = engine.get_component("oneagent")
+
+    merged = asyncio.run(engine._summarize_page_chunks(spec, "1.305.49", PAGE_TEXT))
+
+    assert len(responses.prompts) == 2
+    assert "part 1 of 2" in responses.prompts[0] and "part 2 of 2" in responses.prompts[1]
+    assert merged.new_features == "## New features\n\n## Resolved issues"
+    assert merged.latestVersion == "1.305.49"
+
+
+def test_a_chunk_without_a_summary_fails_the_whole_page():
+    responses = FakeResponses()
+    engine = ReleaseNotesEngine(SimpleNamespace(responses=responses), chunk_max_chars=100)
+    spec = engine.get_component("oneagent")
+
+    # The first chunk has no "##" heading, so the fake client returns no summary for it
+    page_text = "# OneAgent 1.305\n" + "Release date: January 27, 2025\n" * 3 + "## New features\nJava 23 is now supported."
+    assert asyncio.run(engine._summarize_page_chunks(spec, "1.305.49", page_text)) is None
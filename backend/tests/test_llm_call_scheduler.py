@@ -0,0 +1,297 @@
+# Tests for the LLM call scheduler with a fake clock and a fake OpenAI client
+
+# --------------------------------------------------------------
+# Import dependencies for the scheduler tests
+# --------------------------------------------------------------
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from services import llm_call_scheduler
+from services.llm_call_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    CallPriority,
+    LLMCallScheduler,
+    TokenBucket,
+    get_retry_after_seconds
+)
+from services.token_budget import TokenBudget
+
+OPENAI_URL = "https://api.openai.com/v1/responses"
+
+
+class FakeClock:
+    """Stands in for the time module in the scheduler; only moves when advanced"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(llm_call_scheduler, "time", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def sleeps(monkeypatch, clock) -> list:
+    """Record the scheduler's retry sleeps and advance the fake clock instead of waiting"""
+    recorded = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, result=None):
+        recorded.append(delay)
+        clock.advance(delay)
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return recorded
+
+
+def rate_limit_error(headers: dict) -> openai.RateLimitError:
+    response = httpx.Response(429, headers=headers, request=httpx.Request("POST", OPENAI_URL))
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+def connection_error() -> openai.APIConnectionError:
+    return openai.APIConnectionError(request=httpx.Request("POST", OPENAI_URL))
+
+
+class FakeClient:
+    """Fails with the given errors in turn, then answers with a result reporting total_tokens"""
+
+    def __init__(self, errors: list = (), total_tokens: int = 100):
+        self.errors = list(errors)
+        self.total_tokens = total_tokens
+        self.calls = 0
+
+    async def create(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(model="gpt-4o", usage=SimpleNamespace(total_tokens=self.total_tokens))
+
+# --------------------------------------------------------------
+# Token buckets
+# --------------------------------------------------------------
+
+
+def test_bucket_refills_continuously(clock):
+    bucket = TokenBucket(60)
+    bucket.consume(60)
+
+    assert bucket.seconds_until_available(30) == 30
+    clock.advance(10)
+    assert bucket.seconds_until_available(30) == 20
+    clock.advance(20)
+    assert bucket.seconds_until_available(30) == 0
+
+
+def test_bucket_never_refills_past_capacity(clock):
+    bucket = TokenBucket(60)
+    clock.advance(3600)
+    assert bucket.available == 60
+    bucket.consume(1)
+    assert bucket.seconds_until_available(60) == 1
+
+
+def test_requests_larger_than_the_bucket_wait_for_a_full_bucket(clock):
+    bucket = TokenBucket(60)
+    # Usage overruns drive the balance negative
+    bucket.consume(90)
+    assert bucket.seconds_until_available(600) == 90
+
+
+def test_calls_wait_for_tokens_to_refill(clock):
+    scheduler = LLMCallScheduler(tokens_per_minute=60, max_concurrency=2)
+    started = []
+    finish_first = asyncio.Event()
+
+    async def call(name: str, finish: asyncio.Event = None):
+        started.append(name)
+        if finish:
+            await finish.wait()
+        return SimpleNamespace(usage=None)
+
+    async def scenario():
+        first = asyncio.create_task(scheduler.run(lambda: call("first", finish_first), estimated_tokens=60))
+        second = asyncio.create_task(scheduler.run(lambda: call("second"), estimated_tokens=30))
+        await asyncio.sleep(0)
+        # A slot is free, but the first call took every token of the minute
+        assert started == ["first"]
+        assert scheduler.stats()["queued"] == 1
+
+        clock.advance(30)
+        finish_first.set()
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+    assert started == ["first", "second"]
+
+# --------------------------------------------------------------
+# Priority lanes
+# --------------------------------------------------------------
+
+
+def test_interactive_calls_are_dispatched_before_background_calls(clock):
+    scheduler = LLMCallScheduler(max_concurrency=1)
+    started = []
+    finish_blocker = asyncio.Event()
+
+    async def call(name: str):
+        started.append(name)
+        if name == "blocker":
+            await finish_blocker.wait()
+
+    async def scenario():
+        tasks = [asyncio.create_task(scheduler.run(lambda: call("blocker"), estimated_tokens=1))]
+        await asyncio.sleep(0)
+        raised_priority = CallPriority(PRIORITY_BACKGROUND)
+        for name, priority in [
+            ("background-1", PRIORITY_BACKGROUND),
+            ("interactive-1", PRIORITY_INTERACTIVE),
+            ("background-2", raised_priority),
+            ("background-3", PRIORITY_BACKGROUND),
+            ("interactive-2", PRIORITY_INTERACTIVE),
+        ]:
+            tasks.append(asyncio.create_task(scheduler.run(lambda name=name: call(name), estimated_tokens=1, priority=priority)))
+        await asyncio.sleep(0)
+        # An interactive caller joined the shared background call while it waited
+        raised_priority.raise_to(PRIORITY_INTERACTIVE)
+        finish_blocker.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    # Interactive calls first, then in arrival order within a lane
+    assert started == ["blocker", "interactive-1", "background-2", "interactive-2", "background-1", "background-3"]
+
+
+def test_cancelled_waiter_does_not_hold_a_slot(clock):
+    scheduler = LLMCallScheduler(max_concurrency=1)
+    started = []
+    finish_blocker = asyncio.Event()
+
+    async def call(name: str):
+        started.append(name)
+        if name == "blocker":
+            await finish_blocker.wait()
+
+    async def scenario():
+        blocker = asyncio.create_task(scheduler.run(lambda: call("blocker"), estimated_tokens=1))
+        cancelled = asyncio.create_task(scheduler.run(lambda: call("cancelled"), estimated_tokens=1))
+        waiting = asyncio.create_task(scheduler.run(lambda: call("waiting"), estimated_tokens=1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        finish_blocker.set()
+        await asyncio.gather(blocker, waiting)
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    asyncio.run(scenario())
+    assert started == ["blocker", "waiting"]
+    assert scheduler.stats()["in_flight"] == 0
+
+# --------------------------------------------------------------
+# Retries, Retry-After and backoff
+# --------------------------------------------------------------
+
+
+def test_retry_after_is_parsed_from_seconds_milliseconds_and_dates(clock):
+    assert get_retry_after_seconds(rate_limit_error({"retry-after": "7"})) == 7
+    assert get_retry_after_seconds(rate_limit_error({"retry-after-ms": "250", "retry-after": "7"})) == 0.25
+    # 1000 s after the fake clock's epoch time
+    assert get_retry_after_seconds(rate_limit_error({"retry-after": "Thu, 01 Jan 1970 00:33:20 GMT"})) == 1000
+    assert get_retry_after_seconds(rate_limit_error({})) is None
+    assert get_retry_after_seconds(ValueError("no response")) is None
+
+
+def test_rate_limited_calls_wait_for_retry_after(clock, sleeps):
+    scheduler = LLMCallScheduler(max_retries=2)
+    client = FakeClient([rate_limit_error({"retry-after": "7"}), rate_limit_error({"retry-after": "3"})])
+
+    result = asyncio.run(scheduler.run(client.create, estimated_tokens=100))
+
+    assert result.usage.total_tokens == 100
+    assert client.calls == 3
+    assert sleeps == [7, 3]
+    assert scheduler.stats() == {"in_flight": 0, "queued": 0, "retries": 2, "rate_limited": 2, "failures": 0}
+
+
+def test_rate_limit_pauses_dispatch_for_every_caller(clock):
+    scheduler = LLMCallScheduler(max_retries=0)
+    rate_limited_client = FakeClient([rate_limit_error({"retry-after-ms": "50"})])
+    other_client = FakeClient()
+
+    async def scenario():
+        with pytest.raises(openai.RateLimitError):
+            await scheduler.run(rate_limited_client.create, estimated_tokens=1)
+
+        other = asyncio.create_task(scheduler.run(other_client.create, estimated_tokens=1))
+        await asyncio.sleep(0)
+        assert other_client.calls == 0
+        assert scheduler.stats()["queued"] == 1
+
+        # The scheduler's wakeup fires after the pause, once the fake clock has passed it
+        clock.advance(0.05)
+        await other
+
+    asyncio.run(scenario())
+    assert other_client.calls == 1
+    assert scheduler.stats()["failures"] == 1
+
+
+def test_errors_without_retry_after_back_off_exponentially(clock, sleeps, monkeypatch):
+    # Full jitter draws from [0, backoff]; take the upper bound
+    monkeypatch.setattr(llm_call_scheduler.random, "uniform", lambda low, high: high)
+    scheduler = LLMCallScheduler(max_retries=3, base_backoff_seconds=1, max_backoff_seconds=3)
+    client = FakeClient([connection_error(), connection_error(), connection_error(), connection_error()])
+
+    with pytest.raises(openai.APIConnectionError):
+        asyncio.run(scheduler.run(client.create, estimated_tokens=100))
+
+    assert client.calls == 4
+    assert sleeps == [1, 2, 3]
+    assert scheduler.stats()["failures"] == 1
+    assert scheduler.stats()["rate_limited"] == 0
+
+
+def test_other_errors_are_not_retried(clock, sleeps):
+    scheduler = LLMCallScheduler(max_retries=2)
+    client = FakeClient([ValueError("invalid schema")])
+
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run(client.create, estimated_tokens=100))
+
+    assert client.calls == 1
+    assert sleeps == []
+
+# --------------------------------------------------------------
+# Token usage and the daily budget
+# --------------------------------------------------------------
+
+
+def test_actual_usage_is_charged_to_the_bucket_and_the_budget(clock):
+    token_budget = TokenBudget(daily_tokens=10000)
+    scheduler = LLMCallScheduler(tokens_per_minute=600, token_budget=token_budget)
+    client = FakeClient(total_tokens=250)
+
+    asyncio.run(scheduler.run(client.create, estimated_tokens=100))
+
+    assert scheduler.token_bucket.available == 350
+    assert token_budget.used_tokens == 250
+    assert token_budget.reserved_tokens == 0
@@ -0,0 +1,238 @@
+# Tests for the release notes corpus against a local HTTP stand-in for the docs site
+
+# --------------------------------------------------------------
+# Import dependencies for the corpus tests
+# --------------------------------------------------------------
+
+import asyncio
+import hashlib
+import os
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from services.component_registry import COMPONENT_REGISTRY
+from services.prompts.corpus_prompts import get_chunk_summary_prompt, get_corpus_summary_prompt
+from services.release_notes_corpus import ReleaseNotesCorpus
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+LAST_MODIFIED = "Mon, 27 Jan 2025 08:00:00 GMT"
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as file:
+        return file.read()
+
+# --------------------------------------------------------------
+# Define local docs site serving fixture pages
+# --------------------------------------------------------------
+
+
+class DocsSite:
+    """Serves fixture pages with ETag and/or Last-Modified validators and records request headers"""
+
+    def __init__(self, pages: dict, etag: bool = True, last_modified: bool = True):
+        """Initialize with HTML per path and the validators to send"""
+        self.pages = pages
+        self.etag = etag
+        self.last_modified = last_modified
+        self.requests = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append((request.path, dict(request.headers)))
+        html = self.pages.get(request.path)
+        if html is None:
+            raise web.HTTPNotFound()
+
+        headers = {}
+        etag = f'"{hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]}"'
+        if self.etag:
+            headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers=headers)
+        if self.last_modified:
+            headers["Last-Modified"] = LAST_MODIFIED
+            if not self.etag and request.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                return web.Response(status=304, headers=headers)
+        return web.Response(text=html, content_type="text/html", headers=headers)
+
+
+async def run_against_site(site: DocsSite, scenario):
+    """Run scenario(server) with a local server for site"""
+    app = web.Application()
+    app.router.add_get("/{path:.*}", site.handle)
+    async with TestServer(app) as server:
+        return await scenario(server)
+
+
+def make_corpus(storage_dir, refresh_interval_seconds: float = 0.0) -> ReleaseNotesCorpus:
+    return ReleaseNotesCorpus(str(storage_dir), refresh_interval_seconds=refresh_interval_seconds, timeout_seconds=5)
+
+# --------------------------------------------------------------
+# Download, conditional refresh and change detection
+# --------------------------------------------------------------
+
+
+def test_first_download_is_stored(tmp_path):
+    site = DocsSite({"/sprint-305": load_fixture("oneagent_sprint_305.html")})
+    corpus = make_corpus(tmp_path)
+    # A second process sharing the storage directory, within its refresh interval
+    reloaded_corpus = make_corpus(tmp_path, refresh_interval_seconds=3600)
+
+    async def scenario(server):
+        url = str(server.make_url("/sprint-305"))
+        try:
+            return await corpus.get_page(url), await reloaded_corpus.get_page(url)
+        finally:
+            await corpus.close()
+            await reloaded_corpus.close()
+
+    page, reloaded_page = asyncio.run(run_against_site(site, scenario))
+    assert corpus.stats()["downloads"] == 1
+    assert page.etag and page.last_modified == LAST_MODIFIED
+    # Headings are kept as markers; scripts, navigation and footers are dropped
+    assert "# OneAgent 1.305" in page.text
+    assert "## New features" in page.text
+    assert "Java 23 is now supported." in page.text
+    assert "dataLayer" not in page.text and "Dynatrace LLC" not in page.text
+    assert os.listdir(tmp_path / "pages")
+
+    # The stored page is read from disk without another request
+    assert reloaded_page.content_hash == page.content_hash
+    assert len(site.requests) == 1
+    assert reloaded_corpus.stats()["downloads"] == 0
+
+
+def test_unchanged_page_is_reused_via_etag(tmp_path):
+    site = DocsSite({"/sprint-305": load_fixture("oneagent_sprint_305.html")})
+    corpus = make_corpus(tmp_path)
+
+    async def scenario(server):
+        url = str(server.make_url("/sprint-305"))
+        try:
+            return await corpus.get_page(url), await corpus.get_page(url)
+        finally:
+            await corpus.close()
+
+    first_page, second_page = asyncio.run(run_against_site(site, scenario))
+    assert site.requests[1][1]["If-None-Match"] == first_page.etag
+    assert corpus.stats()["downloads"] == 1
+    assert corpus.stats()["not_modified"] == 1
+    assert second_page.content_hash == first_page.content_hash
+
+
+def test_unchanged_page_is_reused_via_if_modified_since(tmp_path):
+    site = DocsSite({"/sprint-305": load_fixture("oneagent_sprint_305.html")}, etag=False)
+    corpus = make_corpus(tmp_path)
+
+    async def scenario(server):
+        url = str(server.make_url("/sprint-305"))
+        try:
+            return await corpus.get_page(url), await corpus.get_page(url)
+        finally:
+            await corpus.close()
+
+    first_page, second_page = asyncio.run(run_against_site(site, scenario))
+    assert "If-None-Match" not in site.requests[1][1]
+    assert site.requests[1][1]["If-Modified-Since"] == LAST_MODIFIED
+    assert corpus.stats()["not_modified"] == 1
+    assert second_page is first_page
+
+
+def test_changed_content_gets_a_new_hash(tmp_path):
+    html = load_fixture("oneagent_sprint_305.html")
+    site = DocsSite({"/sprint-305": html})
+    corpus = make_corpus(tmp_path)
+
+    async def scenario(server):
+        url = str(server.make_url("/sprint-305"))
+        try:
+            first_page = await corpus.get_page(url)
+            site.pages["/sprint-305"] = html.replace("Java 23 is now supported.", "Java 24 is now supported.")
+            return first_page, await corpus.get_page(url)
+        finally:
+            await corpus.close()
+
+    first_page, changed_page = asyncio.run(run_against_site(site, scenario))
+    assert changed_page.content_hash != first_page.content_hash
+    assert "Java 24 is now supported." in changed_page.text
+    assert corpus.stats()["downloads"] == 2
+    assert corpus.stats()["changed"] == 1
+
+
+def test_markup_only_change_keeps_the_hash(tmp_path):
+    html = load_fixture("oneagent_sprint_305.html")
+    site = DocsSite({"/sprint-305": html})
+    corpus = make_corpus(tmp_path)
+
+    async def scenario(server):
+        url = str(server.make_url("/sprint-305"))
+        try:
+            first_page = await corpus.get_page(url)
+            site.pages["/sprint-305"] = html.replace("window.dataLayer = [];", "window.dataLayer = [1];")
+            return first_page, await corpus.get_page(url)
+        finally:
+            await corpus.close()
+
+    first_page, refreshed_page = asyncio.run(run_against_site(site, scenario))
+    assert corpus.stats()["downloads"] == 2
+    assert corpus.stats()["changed"] == 0
+    assert refreshed_page.content_hash == first_page.content_hash
+
+# --------------------------------------------------------------
+# Version pages and stored summaries
+# --------------------------------------------------------------
+
+
+def test_version_page_is_followed_from_the_whats_new_table(tmp_path):
+    site = DocsSite({
+        "/docs/whats-new/oneagent/": load_fixture("oneagent_whats_new.html"),
+        "/docs/whats-new/oneagent/sprint-305": load_fixture("oneagent_sprint_305.html"),
+    })
+    corpus = make_corpus(tmp_path)
+
+    async def scenario(server):
+        docs_url = str(server.make_url("/docs/whats-new/oneagent/"))
+        try:
+            return await corpus.get_version_page(docs_url, "1.305.49"), await corpus.get_version_page(docs_url, "1.1.0")
+        finally:
+            await corpus.close()
+
+    version_page, unknown_version_page = asyncio.run(run_against_site(site, scenario))
+    assert version_page.url.endswith("/docs/whats-new/oneagent/sprint-305")
+    assert "Java 23 is now supported." in version_page.text
+    assert unknown_version_page is None
+
+
+def test_summaries_are_stored_by_page_and_prompt_hash(tmp_path):
+    corpus = make_corpus(tmp_path)
+    summary = {"latestVersion": "1.305.49", "new_features": "Java 23 is now supported."}
+
+    async def scenario():
+        await corpus.store_summary("a" * 64, "prompt1", summary)
+        return (
+            await corpus.load_summary("a" * 64, "prompt1"),
+            await corpus.load_summary("a" * 64, "prompt2"),
+            await corpus.load_summary("b" * 64, "prompt1"),
+        )
+
+    assert asyncio.run(scenario()) == (summary, None, None)
+
+# --------------------------------------------------------------
+# Prompts for supplied page text
+# --------------------------------------------------------------
+
+
+def test_prompts_with_page_text_do_not_ask_to_navigate():
+    for spec in COMPONENT_REGISTRY.values():
+        summary_prompt = spec.summary_prompt("1.305.49")
+        assert "Navigate to" in summary_prompt
+
+        for prompt in (
+            get_corpus_summary_prompt(summary_prompt, "Java 23 is now supported."),
+            get_chunk_summary_prompt(summary_prompt, "Java 23 is now supported.", 1, 2),
+        ):
+            assert "Navigate to" not in prompt
+            assert "Do not open any URLs" in prompt
+            assert "1.305.49" in prompt and "Java 23 is now supported." in prompt
@@ -0,0 +1,84 @@
+# Tests for access to request profiles and the profiling trigger header
+
+# --------------------------------------------------------------
+# Import dependencies for the request profiler tests
+# --------------------------------------------------------------
+
+import json
+
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+import main
+from services.request_profiler import RequestProfiler
+
+ADMIN_TOKEN = "s3cret-admin-token"
+
+PROFILE_ID = "20250127T080000000000-api-components-0123abcd"
+
+
+def make_profiler(tmp_path, **options) -> RequestProfiler:
+    """Profiler whose directory holds one stored profile"""
+    (tmp_path / f"{PROFILE_ID}.json").write_text(json.dumps({"id": PROFILE_ID, "created_at": "2025-01-27T08:00:00.000+00:00"}))
+    (tmp_path / f"{PROFILE_ID}.html").write_text("<html>stack</html>")
+    return RequestProfiler(str(tmp_path), **options)
+
+# --------------------------------------------------------------
+# Trigger header
+# --------------------------------------------------------------
+
+
+def test_trigger_header_is_off_by_default(tmp_path):
+    profiler = make_profiler(tmp_path, admin_token=ADMIN_TOKEN)
+    assert not profiler.should_profile(Headers({"X-Profile-Request": ADMIN_TOKEN}))
+
+
+def test_enabled_trigger_header_needs_the_admin_token(tmp_path):
+    profiler = make_profiler(tmp_path, admin_token=ADMIN_TOKEN, header_enabled=True)
+
+    assert profiler.should_profile(Headers({"X-Profile-Request": ADMIN_TOKEN}))
+    assert not profiler.should_profile(Headers({"X-Profile-Request": "1"}))
+    assert not profiler.should_profile(Headers({}))
+    # Without an admin token the header can never trigger a profile
+    assert not make_profiler(tmp_path, header_enabled=True).should_profile(Headers({"X-Profile-Request": "1"}))
+
+# --------------------------------------------------------------
+# Profile endpoints
+# --------------------------------------------------------------
+
+
+def test_profiles_require_the_admin_token(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "request_profiler", make_profiler(tmp_path, admin_token=ADMIN_TOKEN))
+    client = TestClient(main.app)
+
+    for headers in [{}, {"Authorization": "Bearer wrong"}, {"Authorization": ADMIN_TOKEN}]:
+        assert client.get("/api/admin/profiles", headers=headers).status_code == 403
+        assert client.get(f"/api/admin/profiles/{PROFILE_ID}", headers=headers).status_code == 403
+
+
+def test_profiles_are_closed_without_a_configured_token(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "request_profiler", make_profiler(tmp_path))
+    client = TestClient(main.app)
+
+    assert client.get("/api/admin/profiles", headers={"Authorization": "Bearer "}).status_code == 403
+    assert client.get("/api/admin/profiles", headers={"Authorization": "Bearer None"}).status_code == 403
+
+
+def test_profiles_are_listed_and_downloaded_with_the_admin_token(monkeypatch, tmp_path):
+    monkeypatch.setattr(main, "request_profiler", make_profiler(tmp_path, admin_token=ADMIN_TOKEN))
+    client = TestClient(main.app)
+    headers = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+
+    listing = client.get("/api/admin/profiles", headers=headers)
+    assert listing.status_code == 200
+    assert [profile["id"] for profile in listing.json()["profiles"]] == [PROFILE_ID]
+
+    download = client.get(f"/api/admin/profiles/{PROFILE_ID}", headers=headers)
+    assert download.status_code == 200
+    assert download.text == "<html>stack</html>"
+    assert client.get("/api/admin/profiles/unknown", headers=headers).status_code == 404
+
+
+def test_profiles_are_unavailable_when_profiling_is_disabled(monkeypatch):
+    monkeypatch.setattr(main, "request_profiler", None)
+    assert TestClient(main.app).get("/api/admin/profiles").status_code == 503
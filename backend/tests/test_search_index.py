@@ -0,0 +1,125 @@
+# Tests for the search index over summary sections, using the offline hashing embedder
+
+# --------------------------------------------------------------
+# Import dependencies for the search index tests
+# --------------------------------------------------------------
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import main
+from services.data_models import ComponentLatestReleaseSummary
+from services.prompts.summary_instructions import SECTION_PLACEHOLDERS
+from services.search_index import HashingEmbedder, SearchIndex
+
+
+def make_summary(version: str, **sections) -> ComponentLatestReleaseSummary:
+    return ComponentLatestReleaseSummary(latestVersion=version, **{**SECTION_PLACEHOLDERS, **sections})
+
+
+def build_index(summaries: list, initial_capacity: int = 256) -> SearchIndex:
+    """Index (component, summary) pairs with the hashing embedder"""
+    index = SearchIndex(HashingEmbedder(dimensions=1024), initial_capacity=initial_capacity)
+
+    async def add_all():
+        for component, summary in summaries:
+            await index.add_summary(component, summary)
+
+    asyncio.run(add_all())
+    return index
+
+
+def search(index: SearchIndex, query: str, **options) -> list:
+    return asyncio.run(index.search(query, **options))
+
+
+SUMMARIES = [
+    ("oneagent", make_summary(
+        "1.305.49",
+        new_features="Java 23 is now supported by the Java code module.",
+        resolved_issues="Fixed a memory leak in the Java agent when tracing async servlets.",
+    )),
+    ("activegate", make_summary(
+        "1.10.0",
+        announcements="Environment ActiveGate for Windows will reach end of life in 2026.",
+        resolved_issues="Fixed a memory leak in the extension execution controller.",
+    )),
+    ("dynatrace-api", make_summary(
+        "1.309",
+        breaking_changes="The v1 timeseries endpoint was removed; use the v2 metrics API.",
+    )),
+]
+
+# --------------------------------------------------------------
+# Indexing
+# --------------------------------------------------------------
+
+
+def test_only_sections_with_content_are_indexed():
+    index = build_index(SUMMARIES)
+    assert len(index) == 5
+
+
+def test_reindexing_a_version_replaces_its_sections():
+    updated = make_summary("1.305.49", new_features="Java 24 is now supported by the Java code module.")
+    index = build_index(SUMMARIES + [("oneagent", updated)])
+
+    assert len(index) == 5
+    results = search(index, "java code module support", component="oneagent")
+    assert results[0]["text"] == "Java 24 is now supported by the Java code module."
+
+
+def test_the_embedding_matrix_grows_past_its_initial_capacity():
+    index = build_index(SUMMARIES, initial_capacity=1)
+    assert len(index) == 5
+    assert search(index, "v1 timeseries endpoint")[0]["component"] == "dynatrace-api"
+
+# --------------------------------------------------------------
+# Ranking and filters
+# --------------------------------------------------------------
+
+
+def test_the_most_similar_section_ranks_first():
+    results = search(build_index(SUMMARIES), "java agent memory leak")
+
+    assert (results[0]["component"], results[0]["section"]) == ("oneagent", "resolved_issues")
+    assert results[0]["version"] == "1.305.49"
+    scores = [result["score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_component_filter_only_returns_that_component():
+    results = search(build_index(SUMMARIES), "memory leak", component="activegate")
+
+    assert results
+    assert {result["component"] for result in results} == {"activegate"}
+    assert results[0]["section"] == "resolved_issues"
+
+
+def test_limit_and_unrelated_queries():
+    index = build_index(SUMMARIES)
+
+    assert len(search(index, "memory leak", limit=1)) == 1
+    assert search(index, "memory leak", limit=0) == []
+    # Sections sharing no words with the query are not returned
+    assert search(index, "kubernetes") == []
+    assert search(SearchIndex(HashingEmbedder()), "memory leak") == []
+
+# --------------------------------------------------------------
+# Search endpoint
+# --------------------------------------------------------------
+
+
+def test_search_endpoint(monkeypatch):
+    monkeypatch.setattr(main, "search_index", build_index(SUMMARIES))
+    client = TestClient(main.app)
+
+    response = client.get("/api/search", params={"q": "java agent memory leak", "component": "oneagent", "limit": 1})
+    assert response.status_code == 200
+    assert response.json()["indexed_sections"] == 5
+    assert [result["section"] for result in response.json()["results"]] == ["resolved_issues"]
+
+    assert client.get("/api/search", params={"q": " "}).status_code == 400
+    monkeypatch.setattr(main, "search_index", None)
+    assert client.get("/api/search", params={"q": "memory leak"}).status_code == 503
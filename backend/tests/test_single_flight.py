@@ -0,0 +1,143 @@
+# Tests for single-flight coalescing of concurrent identical calls
+
+# --------------------------------------------------------------
+# Import dependencies for the single-flight tests
+# --------------------------------------------------------------
+
+import asyncio
+import gc
+
+import pytest
+
+from services.single_flight import SingleFlight
+
+
+class GatedCall:
+    """Call that blocks until released and counts how often it was started"""
+
+    def __init__(self, result="summary", error: Exception = None):
+        self.result = result
+        self.error = error
+        self.starts = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.starts += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+# --------------------------------------------------------------
+# Coalescing
+# --------------------------------------------------------------
+
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        single_flight = SingleFlight()
+        call = GatedCall()
+        callers = [asyncio.create_task(single_flight.do("oneagent", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert single_flight.in_flight() == 1
+
+        call.release.set()
+        return single_flight, call, await asyncio.gather(*callers)
+
+    single_flight, call, results = asyncio.run(scenario())
+    assert results == ["summary"] * 5
+    assert call.starts == 1
+    assert (single_flight.started, single_flight.coalesced) == (1, 4)
+    assert single_flight.in_flight() == 0
+
+
+def test_different_keys_run_separately():
+    async def scenario():
+        single_flight = SingleFlight()
+        oneagent, activegate = GatedCall("oneagent"), GatedCall("activegate")
+        callers = [
+            asyncio.create_task(single_flight.do("oneagent", oneagent)),
+            asyncio.create_task(single_flight.do("activegate", activegate)),
+        ]
+        await asyncio.sleep(0)
+        oneagent.release.set()
+        activegate.release.set()
+        return await asyncio.gather(*callers)
+
+    assert asyncio.run(scenario()) == ["oneagent", "activegate"]
+
+
+def test_every_caller_receives_the_exception():
+    async def scenario():
+        single_flight = SingleFlight()
+        call = GatedCall(error=RuntimeError("OpenAI unavailable"))
+        callers = [asyncio.create_task(single_flight.do("oneagent", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        call.release.set()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert [str(result) for result in results] == ["OpenAI unavailable"] * 3
+
+
+def test_key_is_released_once_the_call_finishes():
+    async def scenario():
+        single_flight = SingleFlight()
+        first, second = GatedCall("first"), GatedCall("second")
+        first.release.set()
+        second.release.set()
+        return single_flight, await single_flight.do("oneagent", first), await single_flight.do("oneagent", second)
+
+    single_flight, first_result, second_result = asyncio.run(scenario())
+    assert (first_result, second_result) == ("first", "second")
+    assert single_flight.started == 2
+
+# --------------------------------------------------------------
+# Cancellation
+# --------------------------------------------------------------
+
+
+def test_cancelling_one_waiter_does_not_cancel_the_shared_call():
+    async def scenario():
+        single_flight = SingleFlight()
+        call = GatedCall()
+        cancelled = asyncio.create_task(single_flight.do("oneagent", call))
+        waiting = asyncio.create_task(single_flight.do("oneagent", call))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        assert cancelled.cancelled()
+        assert single_flight.in_flight() == 1
+
+        call.release.set()
+        return call, await waiting
+
+    call, result = asyncio.run(scenario())
+    assert result == "summary"
+    assert call.starts == 1
+
+
+def test_call_finishes_when_every_waiter_is_cancelled():
+    unhandled = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        single_flight = SingleFlight()
+        call = GatedCall(error=RuntimeError("OpenAI unavailable"))
+        caller = asyncio.create_task(single_flight.do("oneagent", call))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        # The call runs to completion and its exception is not reported as unretrieved
+        call.release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        gc.collect()
+        return single_flight
+
+    single_flight = asyncio.run(scenario())
+    assert single_flight.in_flight() == 0
+    assert unhandled == []
@@ -0,0 +1,119 @@
+# Tests for the summary cache: TTL expiry, LRU eviction and prompt-aware keys
+
+# --------------------------------------------------------------
+# Import dependencies for the summary cache tests
+# --------------------------------------------------------------
+
+import pytest
+
+from services import summary_cache
+from services.summary_cache import SummaryCache, summary_cache_key
+
+
+class FakeClock:
+    """Stands in for the time module in the cache; only moves when advanced"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(summary_cache, "time", fake_clock)
+    return fake_clock
+
+# --------------------------------------------------------------
+# TTL expiry
+# --------------------------------------------------------------
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = SummaryCache(ttl_seconds=60)
+    cache.set("oneagent", "summary")
+
+    clock.advance(60)
+    assert cache.get("oneagent") == "summary"
+    clock.advance(1)
+    assert cache.get("oneagent") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_storing_again_restarts_the_ttl(clock):
+    cache = SummaryCache(ttl_seconds=60)
+    cache.set("oneagent", "old summary")
+    clock.advance(50)
+    cache.set("oneagent", "new summary")
+    clock.advance(50)
+    assert cache.get("oneagent") == "new summary"
+
+
+@pytest.mark.parametrize("ttl_seconds", [None, 0])
+def test_ttl_can_be_disabled(clock, ttl_seconds):
+    cache = SummaryCache(ttl_seconds=ttl_seconds)
+    cache.set("oneagent", "summary")
+    clock.advance(10 * 365 * 86400)
+    assert cache.get("oneagent") == "summary"
+
+# --------------------------------------------------------------
+# LRU eviction
+# --------------------------------------------------------------
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = SummaryCache(max_entries=2)
+    cache.set("oneagent", "a")
+    cache.set("activegate", "b")
+    # Reading oneagent makes activegate the least recently used entry
+    assert cache.get("oneagent") == "a"
+    cache.set("kubernetes", "c")
+
+    assert cache.get("activegate") is None
+    assert cache.get("oneagent") == "a"
+    assert cache.get("kubernetes") == "c"
+    assert cache.evictions == 1
+
+
+def test_stats_and_clear(clock):
+    cache = SummaryCache(max_entries=1, ttl_seconds=60)
+    cache.set("oneagent", "a")
+    cache.set("activegate", "b")
+    cache.get("activegate")
+    cache.get("oneagent")
+
+    assert cache.stats() == {
+        "entries": 1,
+        "max_entries": 1,
+        "ttl_seconds": 60,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "hit_ratio": 0.5,
+    }
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 1
+
+# --------------------------------------------------------------
+# Cache keys
+# --------------------------------------------------------------
+
+
+def test_keys_change_with_the_prompt_template_but_not_the_version():
+    def prompt(version: str) -> str:
+        return f"Summarize OneAgent {version}."
+
+    def reworded_prompt(version: str) -> str:
+        return f"Summarize the OneAgent {version} release notes."
+
+    key = summary_cache_key("oneagent", "1.305.49", prompt)
+    assert key[:2] == ("oneagent", "1.305.49")
+    assert summary_cache_key("oneagent", "1.307.40", prompt)[2] == key[2]
+    assert summary_cache_key("oneagent", "1.305.49", reworded_prompt)[2] != key[2]
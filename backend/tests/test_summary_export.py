@@ -0,0 +1,76 @@
+# Tests for the PDF, Markdown, HTML and JSON exports and the export endpoint
+
+# --------------------------------------------------------------
+# Import dependencies for the export tests
+# --------------------------------------------------------------
+
+import json
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+import main
+from services import pdf_rendering
+from services.summary_export import render_html, render_json, render_markdown
+
+EXPORT_PATH = "/api/export-release-news"
+
+RELEASE_NEWS = [
+    {"component": "OneAgent", "version": "1.305.49", "summary": "**✨ New Features:**\nJava 23 is now supported."},
+    {"component": "Error", "summary": "ActiveGate could not be summarized."},
+]
+
+GENERATED_AT = datetime(2025, 1, 27, 8, 0)
+
+# --------------------------------------------------------------
+# Emoji section markers in the PDF and the exports
+# --------------------------------------------------------------
+
+
+def test_pdf_keeps_the_space_after_a_removed_emoji(monkeypatch):
+    # Capture the story instead of rendering it
+    monkeypatch.setattr(pdf_rendering, "build_pdf", lambda story: story)
+    story = pdf_rendering.generate_pdf_from_release_news(RELEASE_NEWS)
+
+    texts = [getattr(flowable, "text", None) for flowable in story]
+    assert "OneAgent - Version 1.305.49" in texts
+    assert "<b> New Features:</b><br/>Java 23 is now supported." in texts
+
+
+def test_exports_drop_the_emoji_with_its_space():
+    assert "**New Features:**\nJava 23 is now supported." in render_markdown(RELEASE_NEWS[:1], GENERATED_AT)
+    assert "<p><b>New Features:</b><br/>Java 23 is now supported.</p>" in render_html(RELEASE_NEWS[:1], GENERATED_AT)
+    bundle = json.loads(render_json(RELEASE_NEWS[:1], GENERATED_AT))
+    assert bundle["components"][0]["summary"] == "**New Features:**\nJava 23 is now supported."
+    assert bundle["generatedAt"] == "2025-01-27T08:00:00"
+
+# --------------------------------------------------------------
+# Export endpoint
+# --------------------------------------------------------------
+
+
+def test_release_news_is_exported_as_markdown():
+    response = TestClient(main.app).post(EXPORT_PATH, json={"format": "markdown", "releaseNews": RELEASE_NEWS})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/markdown")
+    assert "## OneAgent - Version 1.305.49" in response.text
+    assert "could not be summarized" not in response.text
+
+
+def test_malformed_requests_are_rejected_with_400():
+    client = TestClient(main.app)
+    bodies = [
+        {"format": "markdown", "releaseNews": "OneAgent"},
+        {"format": "markdown", "releaseNews": ["OneAgent"]},
+        {"format": "markdown", "releaseNews": [{"component": "OneAgent", "summary": 42}]},
+        {"format": "markdown", "releaseNews": [{"component": ["OneAgent"], "summary": "Fixes."}]},
+        {"format": ["markdown"], "releaseNews": RELEASE_NEWS},
+        {"format": "docx", "releaseNews": RELEASE_NEWS},
+        {"format": "markdown", "releaseNews": RELEASE_NEWS[1:]},
+    ]
+
+    for body in bodies:
+        response = client.post(EXPORT_PATH, json=body)
+        assert response.status_code == 400, body
+        assert "error" in response.json()
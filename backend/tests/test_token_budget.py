@@ -0,0 +1,76 @@
+# Tests for loading the tiktoken encoder and counting prompt tokens
+
+# --------------------------------------------------------------
+# Import dependencies for the token budget tests
+# --------------------------------------------------------------
+
+import asyncio
+
+import pytest
+import tiktoken
+
+from services import token_budget
+from services.token_budget import count_tokens, get_token_encoder, load_token_encoder, load_token_encoder_with_retries
+
+
+class FakeEncoder:
+    """Counts one token per word"""
+
+    def encode(self, text: str, disallowed_special=()) -> list:
+        return text.split()
+
+
+@pytest.fixture(autouse=True)
+def unloaded_encoder(monkeypatch):
+    monkeypatch.setattr(token_budget, "_token_encoder", None)
+
+
+def fail_then_load(monkeypatch, failures: int) -> list:
+    """Make tiktoken.get_encoding fail failures times before returning a FakeEncoder; returns the call log"""
+    calls = []
+
+    def get_encoding(name: str):
+        calls.append(name)
+        if len(calls) <= failures:
+            raise ConnectionError("Name resolution failed")
+        return FakeEncoder()
+
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+    return calls
+
+# --------------------------------------------------------------
+# Loading the encoder
+# --------------------------------------------------------------
+
+
+def test_tokens_are_estimated_until_the_encoder_is_loaded(monkeypatch):
+    fail_then_load(monkeypatch, failures=0)
+    assert count_tokens("one two three four") == len("one two three four") // 4
+
+    assert load_token_encoder()
+    assert count_tokens("one two three four") == 4
+
+
+def test_a_failed_load_is_not_remembered(monkeypatch):
+    calls = fail_then_load(monkeypatch, failures=1)
+
+    assert not load_token_encoder()
+    assert get_token_encoder() is None
+    assert load_token_encoder()
+    assert isinstance(get_token_encoder(), FakeEncoder)
+    assert calls == ["o200k_base", "o200k_base"]
+
+
+def test_failed_loads_are_retried_in_the_background(monkeypatch):
+    calls = fail_then_load(monkeypatch, failures=2)
+
+    assert asyncio.run(load_token_encoder_with_retries(timeout_seconds=5, retry_seconds=0))
+    assert len(calls) == 3
+
+
+def test_retries_give_up_after_max_attempts(monkeypatch):
+    calls = fail_then_load(monkeypatch, failures=10)
+
+    assert not asyncio.run(load_token_encoder_with_retries(timeout_seconds=5, retry_seconds=0, max_attempts=3))
+    assert len(calls) == 3
+    assert get_token_encoder() is None
@@ -0,0 +1,123 @@
+# Tests for version discovery from saved Dynatrace "what's new" docs pages
+
+# --------------------------------------------------------------
+# Import dependencies for the version discovery tests
+# --------------------------------------------------------------
+
+import asyncio
+import os
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from services.version_discovery import (
+    VersionDiscovery,
+    extract_version_links_from_html,
+    extract_versions_from_html,
+    latest_version_from_html,
+    parse_version,
+    sort_versions,
+    version_key
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ONEAGENT_URL = "https://docs.dynatrace.com/docs/whats-new/oneagent/"
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as file:
+        return file.read()
+
+# --------------------------------------------------------------
+# Version parsing and ordering
+# --------------------------------------------------------------
+
+
+def test_parse_version_reads_first_dotted_number():
+    assert parse_version("v1.305.49 (LTS)") == "1.305.49"
+    assert parse_version("OneAgent 1.309") == "1.309"
+    assert parse_version("Preview") is None
+    assert parse_version(None) is None
+
+
+def test_versions_are_ordered_semantically():
+    assert version_key("1.10.0") > version_key("1.9.0")
+    assert sort_versions(["1.9.0", "1.10.0", "1.9.10", "1.9.0"]) == ["1.10.0", "1.9.10", "1.9.0"]
+    assert sort_versions(["1.10.0", "1.9.0"], descending=False) == ["1.9.0", "1.10.0"]
+
+
+def test_latest_version_is_the_semantically_highest():
+    assert latest_version_from_html(load_fixture("activegate_whats_new.html")) == "1.10.0"
+
+# --------------------------------------------------------------
+# Version table detection
+# --------------------------------------------------------------
+
+
+def test_version_column_is_found_from_the_header_row():
+    # Kubernetes versions in a neighbouring column and the "Preview" row are not versions of the component
+    assert extract_versions_from_html(load_fixture("oneagent_whats_new.html")) == ["1.309.58", "1.307.40", "1.305.49"]
+
+
+def test_tables_without_a_version_column_are_skipped():
+    # The first table of the ActiveGate page lists platforms, not versions
+    assert extract_versions_from_html(load_fixture("activegate_whats_new.html")) == ["1.10.0", "1.9.10", "1.9.0"]
+
+
+def test_page_without_a_version_table_has_no_versions():
+    html = load_fixture("no_version_table.html")
+    assert extract_versions_from_html(html) == []
+    assert latest_version_from_html(html) is None
+    assert extract_version_links_from_html(html, ONEAGENT_URL) == {}
+
+# --------------------------------------------------------------
+# Release notes link extraction
+# --------------------------------------------------------------
+
+
+def test_links_are_resolved_against_the_page_url():
+    links = extract_version_links_from_html(load_fixture("oneagent_whats_new.html"), ONEAGENT_URL)
+    assert links == {
+        "1.309.58": "https://docs.dynatrace.com/docs/whats-new/oneagent/sprint-309",
+        "1.307.40": "https://docs.dynatrace.com/docs/whats-new/oneagent/sprint-307",
+        # The first link of a row wins over later ones such as LTS notes
+        "1.305.49": "https://docs.dynatrace.com/docs/whats-new/oneagent/sprint-305",
+    }
+
+
+def test_first_row_of_a_repeated_version_keeps_its_link():
+    links = extract_version_links_from_html(load_fixture("activegate_whats_new.html"), ONEAGENT_URL)
+    assert links["1.9.0"] == "https://docs.dynatrace.com/docs/whats-new/activegate/sprint-9"
+    assert links["1.10.0"] == "https://docs.dynatrace.com/docs/whats-new/activegate/sprint-10"
+
+# --------------------------------------------------------------
+# Fetching pages over HTTP
+# --------------------------------------------------------------
+
+
+async def discover_from_local_server(path: str):
+    """Latest version read by VersionDiscovery from a local server serving the fixture pages"""
+    async def handle_page(request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        if name == "missing":
+            raise web.HTTPNotFound()
+        return web.Response(text=load_fixture(f"{name}.html"), content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{name}", handle_page)
+    discovery = VersionDiscovery(timeout_seconds=5)
+    async with TestServer(app) as server:
+        try:
+            return await discovery.latest_version(str(server.make_url(path)))
+        finally:
+            await discovery.close()
+
+
+def test_latest_version_is_fetched_from_the_page():
+    assert asyncio.run(discover_from_local_server("/oneagent_whats_new")) == "1.309.58"
+
+
+def test_missing_page_or_table_falls_back_to_none():
+    assert asyncio.run(discover_from_local_server("/missing")) is None
+    assert asyncio.run(discover_from_local_server("/no_version_table")) is None
@@ -0,0 +1,155 @@
+# Tests for version range selection, merging and the range summary endpoint
+
+# --------------------------------------------------------------
+# Import dependencies for the version range tests
+# --------------------------------------------------------------
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import main
+from services.data_models import ComponentLatestReleaseSummary
+from services.release_notes_engine import ReleaseNotesEngine
+from services.summary_cache import SummaryCache, summary_cache_key
+from services.version_range import is_empty_section, merge_range_sections, select_range_versions
+
+# Versions of the what's-new table in the README example, newest first
+TABLE_VERSIONS = ["1.309.58", "1.307.40", "1.305.49", "1.303.20", "1.301.12"]
+
+
+class FakeVersionDiscovery:
+    """Lists fixed table versions instead of fetching the docs page"""
+
+    def __init__(self, versions: list):
+        self.versions = versions
+
+    async def list_versions(self, url: str) -> list:
+        return list(self.versions)
+
+
+def make_summary(version: str, breaking_changes: str = "No breaking changes reported for this version.") -> ComponentLatestReleaseSummary:
+    return ComponentLatestReleaseSummary(
+        latestVersion=version,
+        breaking_changes=breaking_changes,
+        announcements="No major announcements for this version.",
+        technology_support="No technology support updates for this version.",
+        new_features=f"Features of {version}.",
+        resolved_issues=f"Fixes of {version}.",
+    )
+
+
+def make_engine(cached_versions: list) -> ReleaseNotesEngine:
+    """Engine without an OpenAI client whose summary cache holds cached_versions"""
+    summary_cache = SummaryCache()
+    engine = ReleaseNotesEngine(
+        None,
+        summary_cache=summary_cache,
+        version_discovery=FakeVersionDiscovery(TABLE_VERSIONS)
+    )
+    spec = engine.get_component("oneagent")
+    for version in cached_versions:
+        summary_cache.set(summary_cache_key(spec.key, version, spec.summary_prompt), make_summary(version))
+    return engine
+
+# --------------------------------------------------------------
+# Range selection
+# --------------------------------------------------------------
+
+
+def test_partial_bounds_cover_every_release_of_the_sprint():
+    # "after 1.301" excludes 1.301.12; "up to 1.305" includes 1.305.49
+    assert select_range_versions(TABLE_VERSIONS, "1.301", "1.305") == ["1.303.20", "1.305.49"]
+
+
+def test_full_bounds_are_exclusive_below_and_inclusive_above():
+    assert select_range_versions(TABLE_VERSIONS, "1.301.12", "1.305.49") == ["1.303.20", "1.305.49"]
+    assert select_range_versions(TABLE_VERSIONS, "1.303.20", "1.309.58") == ["1.305.49", "1.307.40", "1.309.58"]
+
+
+def test_mixed_precision_bounds():
+    assert select_range_versions(TABLE_VERSIONS, "1.305.49", "1.309") == ["1.307.40", "1.309.58"]
+    assert select_range_versions(TABLE_VERSIONS, "1.300", "1.301.12") == ["1.301.12"]
+
+
+def test_empty_range():
+    assert select_range_versions(TABLE_VERSIONS, "1.305", "1.305") == []
+    assert select_range_versions(TABLE_VERSIONS, "1.309", "1.301") == []
+    assert select_range_versions([], "1.301", "1.305") == []
+
+# --------------------------------------------------------------
+# Empty sections
+# --------------------------------------------------------------
+
+
+def test_only_the_exact_placeholder_counts_as_empty():
+    assert is_empty_section("No breaking changes reported for this version.")
+    assert is_empty_section("  no new features in this version\n")
+    assert is_empty_section("")
+    assert is_empty_section(None)
+    # Real items that happen to start like a placeholder
+    assert not is_empty_section("No longer supports Java 8.")
+    assert not is_empty_section("No breaking changes reported for this version, but the v1 API is deprecated.")
+
+
+def test_real_sections_starting_with_no_are_merged():
+    merged = merge_range_sections(
+        [make_summary("1.303.20", "No longer supports Java 8."), make_summary("1.305.49")],
+        "1.301", "1.305"
+    )
+    assert merged["breaking_changes"] == "Version 1.303.20:\nNo longer supports Java 8."
+
+# --------------------------------------------------------------
+# Range summaries in the engine
+# --------------------------------------------------------------
+
+
+def test_range_summary_merges_cached_versions():
+    engine = make_engine(["1.303.20", "1.305.49"])
+    result = asyncio.run(engine.summarize_version_range("oneagent", "1.301", "1.305"))
+
+    assert result.versions == ["1.303.20", "1.305.49"]
+    assert result.failedVersions == []
+    assert result.resolved_issues == "Version 1.303.20:\nFixes of 1.303.20.\n\nVersion 1.305.49:\nFixes of 1.305.49."
+    assert result.breaking_changes == "No breaking changes reported between 1.301 and 1.305."
+
+
+def test_versions_that_cannot_be_summarized_are_reported():
+    # Without an OpenAI client only cached versions can be summarized
+    engine = make_engine(["1.305.49"])
+    result = asyncio.run(engine.summarize_version_range("oneagent", "1.301", "1.305"))
+
+    assert result.versions == ["1.305.49"]
+    assert result.failedVersions == ["1.303.20"]
+
+
+def test_empty_range_is_an_error():
+    engine = make_engine([])
+    result = asyncio.run(engine.summarize_version_range("oneagent", "1.305", "1.305"))
+    assert "error" in result
+
+# --------------------------------------------------------------
+# Range summary endpoint
+# --------------------------------------------------------------
+
+
+def test_range_endpoint_returns_the_merged_summary(monkeypatch):
+    monkeypatch.setattr(main, "release_notes_engine", make_engine(["1.303.20", "1.305.49"]))
+    response = TestClient(main.app).post(
+        "/api/dynatrace-release-news-summary/range",
+        json={"component": "oneagent", "fromVersion": "v1.301", "toVersion": "1.305"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["versions"] == ["1.303.20", "1.305.49"]
+
+
+def test_range_endpoint_rejects_invalid_requests(monkeypatch):
+    monkeypatch.setattr(main, "release_notes_engine", make_engine([]))
+    client = TestClient(main.app)
+    path = "/api/dynatrace-release-news-summary/range"
+
+    assert client.post(path, json={"component": "unknown", "fromVersion": "1.301"}).status_code == 400
+    assert client.post(path, json={"component": "oneagent", "fromVersion": "latest"}).status_code == 400
+    assert client.post(path, json={"component": "oneagent", "fromVersion": "1.301", "toVersion": "soon"}).status_code == 400
+    assert client.post(path, json={"component": "oneagent", "fromVersion": "1.305", "toVersion": "1.305"}).status_code == 500
@@ -1,17 +1,38 @@
-import React, { useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
+
+// Components shown until the backend registry has been loaded from /api/components
+const defaultComponents = [
+  { key: "dynatrace-managed", selectionId: "dynatrace_managed", title: "APM-Tool Managed", label: "APM-Tool Managed release notes" },
+  { key: "oneagent", selectionId: "oneagent", title: "OneAgent", label: "OneAgent release notes" },
+  { key: "active-gate", selectionId: "active_gate", title: "ActiveGate", label: "ActiveGate release notes" },
+  { key: "dynatrace-api", selectionId: "dynatrace_api", title: "APM-Tool API", label: "APM-Tool API changelog" },
+  { key: "dynatrace-operator", selectionId: "dynatrace_operator", title: "APM-Tool Operator", label: "APM-Tool Operator release notes" }
+];
 
 function App() {
   const [releaseNews, setReleaseNews] = useState([]);
   const [isLoading, setIsLoading] = useState(false);
+  const [progress, setProgress] = useState({});
+  const [partialSummaries, setPartialSummaries] = useState({});
+  // Last downloaded PDF and its ETag, reused when the backend answers 304
+  const lastPdfRef = useRef(null);
 
-  const releaseNoteItems = [
-    "APM-Tool Managed release notes",
-    "OneAgent release notes",
-    "ActiveGate release notes",
-    "APM-Tool API changelog",
-    "APM-Tool Operator release notes"
-  ];
-  const [checkedItems, setCheckedItems] = useState(Array(releaseNoteItems.length).fill(false));
+  const [components, setComponents] = useState(defaultComponents);
+  const releaseNoteItems = components.map(component => component.label);
+  const [checkedItems, setCheckedItems] = useState(Array(defaultComponents.length).fill(false));
+
+  // Load the supported components from the backend registry
+  useEffect(() => {
+    fetch("http://localhost:8000/api/components")
+      .then(res => (res.ok ? res.json() : Promise.reject(new Error(res.statusText))))
+      .then(registered => {
+        if (Array.isArray(registered) && registered.length > 0) {
+          setComponents(registered);
+          setCheckedItems(Array(registered.length).fill(false));
+        }
+      })
+      .catch(error => console.error('Failed to load components:', error));
+  }, []);
 
   const handleCheckboxChange = idx => {
     setCheckedItems(prev => {
@@ -21,134 +42,203 @@ function App() {
     });
   };
 
+  // Display names for the component keys used by the backend response
+  const componentNames = Object.fromEntries(components.map(component => [component.key, component.title]));
+
+  // Human readable labels for backend progress phases
+  const progressLabels = {
+    "resolving_version": "Resolving latest version...",
+    "version_resolved": "Version resolved",
+    "summarizing": "Summarizing release notes..."
+  };
+
+  // Helper function to create structured summary from a component result
+  const createStructuredSummary = (componentData, componentName) => {
+    if (!componentData || !componentData.latestVersion) return null;
+    
+    const sections = [];
+    if (componentData.breaking_changes) {
+      sections.push(`**🚨 Breaking Changes:**\n${componentData.breaking_changes}`);
+    }
+    if (componentData.announcements) {
+      sections.push(`**📢 Announcements:**\n${componentData.announcements}`);
+    }
+    if (componentData.new_features) {
+      sections.push(`**✨ New Features:**\n${componentData.new_features}`);
+    }
+    if (componentData.technology_support) {
+      sections.push(`**🔧 Technology Support:**\n${componentData.technology_support}`);
+    }
+    if (componentData.resolved_issues) {
+      sections.push(`**🐛 Resolved Issues:**\n${componentData.resolved_issues}`);
+    }
+    
+    return {
+      component: componentName,
+      summary: sections.join('\n\n'),
+      version: componentData.latestVersion
+    };
+  };
+
+  // Parse a raw Server-Sent Events block into its event name and JSON data
+  const parseSseEvent = (block) => {
+    let event = "message";
+    const dataLines = [];
+    block.split('\n').forEach(line => {
+      if (line.startsWith('event:')) {
+        event = line.slice(6).trim();
+      } else if (line.startsWith('data:')) {
+        dataLines.push(line.slice(5).trim());
+      }
+    });
+    if (dataLines.length === 0) return null;
+    return { event, data: JSON.parse(dataLines.join('\n')) };
+  };
+
   const handleReleaseNewsClick = async () => {
     setIsLoading(true);
     setReleaseNews([]);
+    setProgress({});
+    setPartialSummaries({});
     
-    // Function to convert display name to element id
-    const getElementId = (itemName) => {
-      const idMap = {
-        "dynatrace_managed": "APM-Tool Managed release notes",
-        "oneagent": "OneAgent release notes",
-        "active_gate": "ActiveGate release notes",
-        "dynatrace_api": "APM-Tool API changelog",
-        "dynatrace_operator": "APM-Tool Operator release notes"
-      };
-      // Find the key that matches the itemName value
-      const elementId = Object.keys(idMap).find(key => idMap[key] === itemName);
-      return elementId || itemName.toLowerCase().replace(/\s+/g, '_');
-    };
-    
-    // Get selected items as array of objects with element id as key and value as value
-    const selectedItems = releaseNoteItems
-      .map((item, idx) => ({
-        elementId: getElementId(item),
-        value: item,
-        selected: checkedItems[idx]
-      }))
-      .filter(item => item.selected)
-      .map(item => ({ [item.elementId]: item.value }));
+    // Get selected items as array of objects with selection id as key and label as value
+    const selectedItems = components
+      .filter((component, idx) => checkedItems[idx])
+      .map(component => ({ [component.selectionId]: component.label }));
     
+    // Render each stream event as soon as it arrives
+    const handleStreamEvent = ({ event, data }) => {
+      const componentName = componentNames[data.component] || data.component;
+      if (event === "progress") {
+        setProgress(prev => ({ ...prev, [componentName]: progressLabels[data.phase] || data.phase }));
+        if (data.phase === "version_resolved") {
+          setPartialSummaries(prev => ({ ...prev, [componentName]: { ...prev[componentName], latestVersion: data.version } }));
+        } else if (data.phase === "resolving_version") {
+          // A restarted lookup replaces any text streamed for this component so far
+          setPartialSummaries(prev => {
+            const { [componentName]: _restarted, ...rest } = prev;
+            return rest;
+          });
+        }
+      } else if (event === "summary_delta") {
+        // Append streamed section text to the component's in-progress card
+        setPartialSummaries(prev => {
+          const current = prev[componentName] || {};
+          // The version is announced by a progress event unless it is resolved by the summary call itself
+          if (data.section === "latestVersion" && current.latestVersion && !current.streamedVersion) return prev;
+          if (data.section === "latestVersion") {
+            return {
+              ...prev,
+              [componentName]: { ...current, latestVersion: (current.latestVersion || "") + data.text, streamedVersion: true }
+            };
+          }
+          return {
+            ...prev,
+            [componentName]: { ...current, [data.section]: (current[data.section] || "") + data.text }
+          };
+        });
+      } else if (event === "component") {
+        const summary = createStructuredSummary(data, componentName);
+        if (summary) setReleaseNews(prev => [...prev, summary]);
+        setProgress(prev => ({ ...prev, [componentName]: "Done" }));
+        setPartialSummaries(prev => {
+          const { [componentName]: _finished, ...rest } = prev;
+          return rest;
+        });
+      } else if (event === "component_error") {
+        setReleaseNews(prev => [...prev, { component: "Error", summary: `${componentName}: ${data.error}`, version: "" }]);
+        setProgress(prev => ({ ...prev, [componentName]: "Failed" }));
+        setPartialSummaries(prev => {
+          const { [componentName]: _failed, ...rest } = prev;
+          return rest;
+        });
+      } else if (event === "error") {
+        setReleaseNews([{ component: "Error", summary: data.error, version: "" }]);
+      }
+    };
+
     try {
-      const res = await fetch("http://localhost:8000/api/dynatrace-release-news-summary", {
+      const res = await fetch("http://localhost:8000/api/dynatrace-release-news-summary/stream", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ selectedItems: selectedItems }),
+        body: JSON.stringify({ selectedItems: selectedItems, streamSummaries: true }),
       });
-      let data;
-      console.log('Response data:', res);
-      try {
-        data = await res.json();
-      } catch (jsonError) {
-        // If response is not valid JSON, show raw text
+      
+      if (!res.ok || !res.body) {
         const text = await res.text();
         setReleaseNews([{ component: "Error", summary: "Unexpected response: " + text.slice(0, 200), version: "" }]);
         setIsLoading(false);
         return;
       }
-      
-      const summaries = [];
 
-      // Helper function to create structured summary from new format
-      const createStructuredSummary = (componentData, componentName) => {
-        if (!componentData || !componentData.latestVersion) return null;
+      // Read the event stream and dispatch every complete event block
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let receivedComponents = 0;
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
         
-        const sections = [];
-        if (componentData.breaking_changes) {
-          sections.push(`**🚨 Breaking Changes:**\n${componentData.breaking_changes}`);
+        let boundary = buffer.indexOf('\n\n');
+        while (boundary !== -1) {
+          const parsed = parseSseEvent(buffer.slice(0, boundary));
+          buffer = buffer.slice(boundary + 2);
+          if (parsed) {
+            if (parsed.event === "component") receivedComponents += 1;
+            handleStreamEvent(parsed);
+          }
+          boundary = buffer.indexOf('\n\n');
         }
-        if (componentData.announcements) {
-          sections.push(`**📢 Announcements:**\n${componentData.announcements}`);
-        }
-        if (componentData.new_features) {
-          sections.push(`**✨ New Features:**\n${componentData.new_features}`);
-        }
-        if (componentData.technology_support) {
-          sections.push(`**🔧 Technology Support:**\n${componentData.technology_support}`);
-        }
-        if (componentData.resolved_issues) {
-          sections.push(`**🐛 Resolved Issues:**\n${componentData.resolved_issues}`);
-        }
-        
-        return {
-          component: componentName,
-          summary: sections.join('\n\n'),
-          version: componentData.latestVersion
-        };
-      };
-
-      // Check and add APM-Tool Managed data if available
-      const managedSummary = createStructuredSummary(data["dynatrace-managed"], "APM-Tool Managed");
-      if (managedSummary) summaries.push(managedSummary);
-      
-      // Check and add OneAgent data if available
-      const oneagentSummary = createStructuredSummary(data.oneagent, "OneAgent");
-      if (oneagentSummary) summaries.push(oneagentSummary);
-      
-      // Check and add ActiveGate data if available
-      const activegateSummary = createStructuredSummary(data["active-gate"], "ActiveGate");
-      if (activegateSummary) summaries.push(activegateSummary);
-
-      // Check and add APM-Tool API data if available
-      const apiSummary = createStructuredSummary(data["dynatrace-api"], "APM-Tool API");
-      if (apiSummary) summaries.push(apiSummary);
-      
-      // Check and add APM-Tool Operator data if available
-      const operatorSummary = createStructuredSummary(data["dynatrace-operator"], "APM-Tool Operator");
-      if (operatorSummary) summaries.push(operatorSummary);
+      }
       
-      if (summaries.length > 0) {
-        setReleaseNews(summaries);
-      } else if (data.error) {
-        setReleaseNews([{ component: "Error", summary: data.error, version: "" }]);
-      } else {
-        setReleaseNews([{ component: "Info", summary: "No summary data available for selected components.", version: "" }]);
+      if (receivedComponents === 0) {
+        setReleaseNews(prev => prev.length > 0 ? prev : [{ component: "Info", summary: "No summary data available for selected components.", version: "" }]);
       }
     } catch (error) {
-      setReleaseNews([{ component: "Error", summary: error.message, version: "" }]);
+      setReleaseNews(prev => [...prev, { component: "Error", summary: error.message, version: "" }]);
     }
+    setPartialSummaries({});
     setIsLoading(false);
   };
 
+  // Finished summaries followed by cards for components still being generated
+  const displayedNews = [
+    ...releaseNews,
+    ...Object.entries(partialSummaries)
+      .map(([componentName, sections]) => createStructuredSummary(sections, componentName))
+      .filter(Boolean)
+  ];
+
   // Download release news as PDF from backend using existing releaseNews data
   const handleDownloadPdf = async () => {
     try {
       console.log('Downloading PDF from backend using existing data...');
+      const lastPdf = lastPdfRef.current;
       const res = await fetch("http://localhost:8000/api/download-release-news-pdf", {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: {
+          "Content-Type": "application/json",
+          // Let the backend answer 304 when this exact PDF was downloaded before
+          ...(lastPdf ? { "If-None-Match": lastPdf.etag } : {})
+        },
         body: JSON.stringify({ releaseNews: releaseNews }),
       });
       
-      if (!res.ok) {
+      if (!res.ok && res.status !== 304) {
         const errorData = await res.json();
         console.error('PDF download error:', errorData);
         alert(`Error downloading PDF: ${errorData.error || 'Unknown error'}`);
         return;
       }
       
-      // Get the PDF blob
-      const blob = await res.blob();
+      // Get the PDF blob, reusing the previous download when it is unchanged
+      const blob = res.status === 304 ? lastPdf.blob : await res.blob();
+      const etag = res.headers.get('ETag');
+      if (etag && res.status !== 304) {
+        lastPdfRef.current = { etag, blob };
+      }
       
       // Create download link
       const url = window.URL.createObjectURL(blob);
@@ -351,6 +441,15 @@ function App() {
                 }}>
                   Loading...
                 </h2>
+                {Object.entries(progress).map(([componentName, status]) => (
+                  <p key={componentName} style={{
+                    color: '#1a3a6b',
+                    fontSize: '1.1rem',
+                    margin: '0.4rem 0',
+                  }}>
+                    <span style={{ fontWeight: 600 }}>{componentName}:</span> {status}
+                  </p>
+                ))}
               </div>
             )}
             <div style={{
@@ -359,7 +458,7 @@ function App() {
               gap: '2rem',
               width: '100%',
             }}>
-              {releaseNews.map((releaseData, index) => (
+              {displayedNews.map((releaseData, index) => (
                 <div key={index} style={{
                   background: 'linear-gradient(135deg, #f7f9fa 0%, #e3e8ee 100%)',
                   borderRadius: '22px',